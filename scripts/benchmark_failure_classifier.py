@@ -0,0 +1,69 @@
+"""Measure failure classification cost on short errors and long worker logs.
+
+Times ``classify_youtube_failure`` on typical one-line yt-dlp errors and on
+verbose download logs of growing size whose decisive error comes last, or
+on captured diagnostics passed with ``--log``.  ``--baseline`` also times
+the previous approach of lowering the whole text and scanning it once per
+pattern, which is what classification cost when no rule matched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from neural_extractor_v3.core import youtube_errors
+from neural_extractor_v3.core.youtube_errors import classify_youtube_failure
+
+_ERRORS = (
+    "ERROR: [youtube] dQw4w9WgXcQ: Requested format is not available. Use --list-formats",
+    "ERROR: [youtube] dQw4w9WgXcQ: Sign in to confirm you're not a bot. Use --cookies",
+    "ERROR: unable to download video data: HTTP Error 403: Forbidden",
+    "WARNING: [youtube] dQw4w9WgXcQ: n challenge solving failed: Some formats may be missing",
+    "ERROR: [youtube] dQw4w9WgXcQ: Unable to download API page: HTTP Error 502: Bad Gateway",
+)
+_PROGRESS = "[download]  42.3% of  183.52MiB at    4.21MiB/s ETA 00:25\n"
+
+
+def _per_pattern_scan(text: str) -> bool:
+    lowered = text.lower()
+    return any([pattern in lowered for pattern in youtube_errors._MATCHER.patterns])
+
+
+def _microseconds_per_call(classify: Callable[[str], object], texts: list[str]) -> float:
+    # Roughly 20 MB of text per measurement, and at most 2000 rounds.
+    rounds = max(1, min(2000, 20_000_000 // sum(len(text) for text in texts)))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            classify(text)
+    return (time.perf_counter() - started) / (rounds * len(texts)) * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", type=Path, nargs="*", default=[], help="Captured diagnostics.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 256, 4096], help="KiB.")
+    parser.add_argument("--baseline", action="store_true", help="Also time per-pattern scans.")
+    args = parser.parse_args()
+
+    workloads: list[tuple[str, list[str]]] = [("one-line errors", list(_ERRORS))]
+    for kibibytes in args.sizes:
+        noise = _PROGRESS * (kibibytes * 1024 // len(_PROGRESS))
+        workloads.append((f"{kibibytes} KiB log", [noise + error for error in _ERRORS]))
+    for path in args.log:
+        workloads.append((path.name, [path.read_text(encoding="utf-8", errors="replace")]))
+
+    for label, texts in workloads:
+        line = f"{label:>20}  classifier {_microseconds_per_call(classify_youtube_failure, texts):10.1f} us"
+        if args.baseline:
+            scan = _microseconds_per_call(_per_pattern_scan, texts)
+            line += f"  per-pattern scan {scan:10.1f} us"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
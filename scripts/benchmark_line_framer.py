@@ -0,0 +1,90 @@
+"""Show that worker stream framing stays linear on multi-megabyte bursts.
+
+Feeds synthetic worker output through ``LineFramer`` and through the old
+append-and-split buffer at doubling stream sizes.  Linear framing keeps the
+time per megabyte flat; the old buffer's time per megabyte grows with the
+stream size.  ``--check`` exits non-zero when the framer's time per megabyte
+at the largest size exceeds ``--max-growth`` times the smallest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable, Iterator
+
+from neural_extractor_v3.core.line_framer import LineFramer
+from neural_extractor_v3.core.ytdlp_worker import PROTOCOL_PREFIX
+
+CHUNK_CHARS = 4096
+
+
+def _stream(megabytes: int) -> str:
+    """Many short log frames followed by one large playlist frame, like a big expansion."""
+    log = PROTOCOL_PREFIX + json.dumps({"kind": "log", "message": "[debug] " + "x" * 80}) + "\n"
+    half = megabytes * 512 * 1024
+    entries = [{"index": index, "id": f"video{index:07d}"} for index in range(half // 32)]
+    playlist = PROTOCOL_PREFIX + json.dumps({"kind": "playlist", "entries": entries}) + "\n"
+    return log * (half // len(log)) + playlist
+
+
+def _chunks(text: str) -> Iterator[str]:
+    for offset in range(0, len(text), CHUNK_CHARS):
+        yield text[offset : offset + CHUNK_CHARS]
+
+
+def _framer(text: str) -> int:
+    framer = LineFramer()
+    lines = 0
+    for chunk in _chunks(text):
+        lines += len(framer.feed(chunk))
+    return lines
+
+
+def _split_buffer(text: str) -> int:
+    buffer = ""
+    lines = 0
+    for chunk in _chunks(text):
+        buffer += chunk
+        while "\n" in buffer:
+            _line, buffer = buffer.split("\n", 1)
+            lines += 1
+    return lines
+
+
+def _seconds_per_megabyte(frame: Callable[[str], int], text: str, megabytes: int) -> float:
+    started = time.perf_counter()
+    frame(text)
+    return (time.perf_counter() - started) / megabytes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--baseline", action="store_true", help="Also time the old split buffer.")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--max-growth", type=float, default=3.0)
+    args = parser.parse_args()
+
+    framer_costs: list[float] = []
+    for megabytes in args.sizes:
+        text = _stream(megabytes)
+        cost = _seconds_per_megabyte(_framer, text, megabytes)
+        framer_costs.append(cost)
+        line = f"{megabytes:>4} MB  framer {cost * 1000:8.2f} ms/MB"
+        if args.baseline:
+            baseline = _seconds_per_megabyte(_split_buffer, text, megabytes)
+            line += f"  split buffer {baseline * 1000:10.2f} ms/MB"
+        print(line)
+
+    growth = framer_costs[-1] / max(framer_costs[0], 1e-9)
+    print(f"framer cost growth {args.sizes[0]} MB -> {args.sizes[-1]} MB: {growth:.2f}x")
+    if args.check and growth > args.max_growth:
+        print(f"FAIL: growth exceeds {args.max_growth:.1f}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
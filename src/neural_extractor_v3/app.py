@@ -10,9 +10,24 @@ import tempfile
 from collections.abc import Callable
 from pathlib import Path
 
-from neural_extractor_v3.config import APP_NAME, VERSION, assets_dir, base_dir, bin_dir
+from neural_extractor_v3.config import (
+    APP_NAME,
+    MAX_PARALLEL_DOWNLOADS,
+    VERSION,
+    assets_dir,
+    base_dir,
+    bin_dir,
+)
 from neural_extractor_v3.core.diagnostics import run_support_diagnostics
-from neural_extractor_v3.core.downloader import DownloadEngine, recover_stale_download_processes
+from neural_extractor_v3.core.downloader import recover_stale_download_processes
+from neural_extractor_v3.core.job_journal import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_ORIGIN_CLI,
+    UNFINISHED_STATES,
+    get_job_journal,
+)
+from neural_extractor_v3.core.scheduler import DownloadScheduler
 from neural_extractor_v3.core.update_directory_installer import (
     DIRECTORY_TRANSACTION_FILENAME,
     cleanup_stale_directory_update_state,
@@ -29,7 +44,14 @@ from neural_extractor_v3.core.update_installer import (
     write_startup_confirmation,
     write_transaction_startup_confirmation,
 )
-from neural_extractor_v3.models import DownloadJob, DownloadOptions, MediaMode, PlaylistMode
+from neural_extractor_v3.models import (
+    DownloadAcceleration,
+    DownloadJob,
+    DownloadOptions,
+    MediaMode,
+    PlaylistMode,
+)
+from neural_extractor_v3.utils import parse_byte_rate
 
 
 def _parse_args(argv: list[str]) -> argparse.Namespace:
@@ -47,7 +69,7 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
         "--playlist",
         choices=[mode.value for mode in PlaylistMode],
         default=PlaylistMode.AUTO.value,
-        help="Playlist handling mode.",
+        help="Playlist handling mode. sync downloads only entries added since the last sync.",
     )
     parser.add_argument("--quality", default="Best available", help="Video quality preset.")
     parser.add_argument("--audio-quality", default="320", help="Audio bitrate for MP3/M4A.")
@@ -55,6 +77,39 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--no-subs", action="store_true", help="Disable subtitle download.")
     parser.add_argument("--no-thumbnail", action="store_true", help="Disable thumbnail download.")
     parser.add_argument("--cookies", default=None, help="Path to cookies.txt.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=f"Number of URLs to download in parallel (1-{MAX_PARALLEL_DOWNLOADS}).",
+    )
+    parser.add_argument(
+        "--limit-rate",
+        type=_byte_rate_argument,
+        default=None,
+        help="Total download bandwidth cap for the batch, for example 500K or 4M.",
+    )
+    parser.add_argument(
+        "--acceleration",
+        choices=[mode.value for mode in DownloadAcceleration],
+        default=DownloadAcceleration.OFF.value,
+        help="Download acceleration: adaptive tunes concurrent fragments and HTTP chunk size.",
+    )
+    parser.add_argument(
+        "--hedged-attempts",
+        action="store_true",
+        help="Race the verified-session or PO-provider attempt against a slow public attempt.",
+    )
+    parser.add_argument(
+        "--recheck-unavailable",
+        action="store_true",
+        help="Retry videos that recently failed as removed, restricted, or ended live events.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume jobs an earlier run did not finish, continuing partial downloads.",
+    )
     parser.add_argument(
         "--diagnostics",
         action="store_true",
@@ -72,6 +127,9 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument("--post-update-transaction", default=None, help=argparse.SUPPRESS)
     parser.add_argument("--update-rollback-status", default=None, help=argparse.SUPPRESS)
     parser.add_argument("--internal-ytdlp-worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--internal-ytdlp-worker-serve", action="store_true", help=argparse.SUPPRESS
+    )
     parser.add_argument("--internal-youtube-connection-smoke", default=None, help=argparse.SUPPRESS)
     parser.add_argument("--internal-provider-media-smoke", default=None, help=argparse.SUPPRESS)
     parser.add_argument("--internal-gui-startup-smoke", default=None, help=argparse.SUPPRESS)
@@ -80,6 +138,13 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _byte_rate_argument(value: str) -> int | None:
+    try:
+        return parse_byte_rate(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
 def _options_from_args(args: argparse.Namespace) -> DownloadOptions:
     output_dir = Path(args.output).expanduser() if args.output else Path.home() / "Downloads"
     return DownloadOptions(
@@ -92,6 +157,10 @@ def _options_from_args(args: argparse.Namespace) -> DownloadOptions:
         subtitles=not args.no_subs,
         thumbnail=not args.no_thumbnail,
         cookie_file=Path(args.cookies).expanduser() if args.cookies else None,
+        max_parallel_jobs=max(1, min(args.jobs, MAX_PARALLEL_DOWNLOADS)),
+        bandwidth_limit=args.limit_rate,
+        acceleration=DownloadAcceleration(args.acceleration),
+        hedged_attempts=args.hedged_attempts,
     )
 
 
@@ -107,19 +176,28 @@ def run_diagnostics_cli(args: argparse.Namespace) -> int:
 def run_cli(args: argparse.Namespace) -> int:
     recover_stale_download_processes(print)
     options = _options_from_args(args)
-    engine = DownloadEngine(
-        options=options,
+    journal = get_job_journal()
+    resumed = journal.jobs(UNFINISHED_STATES, origin=JOB_ORIGIN_CLI) if args.resume else []
+    jobs = [entry.job for entry in resumed]
+    # Resumed jobs keep the folder, mode and quality they were queued with.
+    job_options = {entry.job.job_id: entry.resume_options(options) for entry in resumed}
+    if args.resume:
+        print(f"Resuming {len(jobs)} unfinished job(s) from an earlier run")
+    jobs.extend(
+        DownloadJob(url=url, recheck_unavailable=args.recheck_unavailable) for url in args.url or ()
+    )
+    scheduler = DownloadScheduler(
+        options,
         progress_callback=lambda event: print(event.compact_status()),
         log_callback=print,
+        job_finished=lambda job, result: print(result.message),
+        journal=journal,
+        journal_origin=JOB_ORIGIN_CLI,
     )
-
-    exit_code = 0
-    for url in args.url:
-        result = engine.download(DownloadJob(url=url))
-        print(result.message)
-        if not result.success:
-            exit_code = 1
-    return exit_code
+    results = scheduler.run(jobs, job_options=job_options)
+    # Failures were reported above and are not resumable; only unfinished jobs stay.
+    journal.discard([JOB_COMPLETED, JOB_FAILED], origin=JOB_ORIGIN_CLI)
+    return 0 if all(result.success for result in results) else 1
 
 
 def run_gui(argv: list[str], args: argparse.Namespace) -> int:
@@ -134,6 +212,7 @@ def run_gui(argv: list[str], args: argparse.Namespace) -> int:
     window = MainWindow()
     window.show()
     recover_stale_download_processes(window.log)
+    window.restore_journaled_jobs()
     if not args.post_update_transaction:
         recover_stale_directory_updates(window.log)
         recovery = recover_stale_update_ownership(window.log)
@@ -560,7 +639,7 @@ def main(argv: list[str] | None = None) -> int:
     if args.internal_ytdlp_worker:
         from neural_extractor_v3.core.ytdlp_worker import main as run_ytdlp_worker
 
-        return run_ytdlp_worker()
+        return run_ytdlp_worker(serve_requests=args.internal_ytdlp_worker_serve)
     if args.internal_youtube_connection_smoke:
         return _run_internal_smoke(
             "youtube-connection",
@@ -602,7 +681,7 @@ def main(argv: list[str] | None = None) -> int:
         return 2
     if args.diagnostics:
         return run_diagnostics_cli(args)
-    if args.url:
+    if args.url or args.resume:
         return run_cli(args)
     return run_gui(
         sys.argv if argv is None else ["NeuralExtractorV3", *argv],
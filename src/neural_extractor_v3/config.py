@@ -7,13 +7,17 @@ import sys
 from pathlib import Path
 
 
-def _env_seconds(name: str, default: int, minimum: int) -> int:
+def _env_int(name: str, default: int, minimum: int) -> int:
     try:
         value = int(os.environ.get(name, str(default)))
     except ValueError:
         return default
     return max(minimum, value)
 
+
+def _env_seconds(name: str, default: int, minimum: int) -> int:
+    return _env_int(name, default, minimum)
+
 APP_NAME = "Neural Extractor V3"
 VERSION = "3.0.8"
 BUILD_LABEL = "pyside-external-helper-compliance-migration"
@@ -47,9 +51,41 @@ YTDLP_STATUS_HEARTBEAT_SECONDS = _env_seconds(
 YTDLP_TERMINATION_GRACE_SECONDS = _env_seconds(
     "NEURAL_EXTRACTOR_YTDLP_TERMINATION_GRACE_SECONDS", 3, 1
 )
+YTDLP_WORKER_POOL_SIZE = _env_int("NEURAL_EXTRACTOR_YTDLP_WORKER_POOL_SIZE", 2, 0)
+YTDLP_WORKER_MAX_REQUESTS = _env_int("NEURAL_EXTRACTOR_YTDLP_WORKER_MAX_REQUESTS", 20, 1)
+YTDLP_WORKER_IDLE_SECONDS = _env_seconds("NEURAL_EXTRACTOR_YTDLP_WORKER_IDLE_SECONDS", 300, 10)
+DISCOVERY_CACHE_TTL_SECONDS = _env_seconds("NEURAL_EXTRACTOR_DISCOVERY_CACHE_TTL_SECONDS", 120, 0)
+DISCOVERY_CACHE_MAX_ENTRIES = 64
+YTDLP_CACHE_MAX_BYTES = _env_int("NEURAL_EXTRACTOR_YTDLP_CACHE_MAX_MB", 64, 1) * 1024 * 1024
+YTDLP_CACHE_MAX_AGE_SECONDS = _env_seconds(
+    "NEURAL_EXTRACTOR_YTDLP_CACHE_MAX_AGE_SECONDS", 14 * 24 * 60 * 60, 3600
+)
+JS_SOLVER_REQUEST_TIMEOUT_SECONDS = _env_seconds(
+    "NEURAL_EXTRACTOR_JS_SOLVER_REQUEST_TIMEOUT_SECONDS", 60, 5
+)
+JS_SOLVER_CACHE_ENTRIES = _env_int("NEURAL_EXTRACTOR_JS_SOLVER_CACHE_ENTRIES", 4096, 0)
 YOUTUBE_EJS_REMOTE_COMPONENT = "ejs:github"
 YOUTUBE_REMOTE_COMPONENTS = [YOUTUBE_EJS_REMOTE_COMPONENT]
 
+MAX_PARALLEL_DOWNLOADS = 8
+PLAYLIST_ENTRY_PARALLELISM = _env_int("NEURAL_EXTRACTOR_PLAYLIST_ENTRY_PARALLELISM", 3, 1)
+HEDGED_ATTEMPT_DELAY_SECONDS = _env_seconds("NEURAL_EXTRACTOR_HEDGED_ATTEMPT_DELAY_SECONDS", 20, 1)
+ATTEMPT_OUTCOME_HALF_LIFE_SECONDS = _env_seconds(
+    "NEURAL_EXTRACTOR_ATTEMPT_OUTCOME_HALF_LIFE_SECONDS", 6 * 60 * 60, 60
+)
+PUBLIC_PATH_PROBE_INTERVAL = _env_int("NEURAL_EXTRACTOR_PUBLIC_PATH_PROBE_INTERVAL", 10, 1)
+NEGATIVE_CACHE_MAX_ENTRIES = _env_int("NEURAL_EXTRACTOR_NEGATIVE_CACHE_MAX_ENTRIES", 4096, 0)
+# Worker protocol lines longer than this are dropped and counted instead of buffered.
+WORKER_MAX_FRAME_CHARS = _env_int(
+    "NEURAL_EXTRACTOR_WORKER_MAX_FRAME_CHARS", 64 * 1024 * 1024, 64 * 1024
+)
+# Progress frames a worker sends per second; 0 forwards every yt-dlp progress report.
+WORKER_PROGRESS_FRAMES_PER_SECOND = _env_int(
+    "NEURAL_EXTRACTOR_WORKER_PROGRESS_FRAMES_PER_SECOND", 4, 0
+)
+# Worker output kept for failure diagnostics; the engine reads live output via callbacks.
+YTDLP_RETAINED_OUTPUT_CHARS = _env_int("NEURAL_EXTRACTOR_YTDLP_RETAINED_OUTPUT_KB", 256, 0) * 1024
+
 AUDIO_BITRATES = ["320", "256", "192", "128"]
 
 SUBTITLE_LANGUAGES: dict[str, str] = {
@@ -0,0 +1,151 @@
+"""Adaptive fragment concurrency and HTTP chunk sizing for media downloads.
+
+yt-dlp fetches DASH/HLS fragments one at a time and requests progressive
+media in a single range unless told otherwise.  The controller picks
+``concurrent_fragment_downloads`` by hill climbing on the throughput measured
+at each concurrency level, sizes ``http_chunk_size`` so one chunk takes a few
+seconds per connection, and halves the concurrency ceiling when YouTube
+answers with HTTP 403 or 429.  The ceiling recovers one step per quiet
+interval.  State is process-wide because every job shares one network path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from neural_extractor_v3.core.youtube_errors import FailureAnalysis, FailureCategory
+
+MIN_CONCURRENT_FRAGMENTS = 1
+INITIAL_CONCURRENT_FRAGMENTS = 4
+MAX_CONCURRENT_FRAGMENTS = 8
+MIN_HTTP_CHUNK_SIZE = 1024 * 1024
+MAX_HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+CHUNK_TARGET_SECONDS = 4.0
+THROUGHPUT_SMOOTHING = 0.3
+MIN_THROUGHPUT_GAIN = 0.1
+BACKOFF_COOLDOWN_SECONDS = 30.0
+RECOVERY_INTERVAL_SECONDS = 300.0
+
+THROTTLING_CATEGORIES = frozenset(
+    {
+        FailureCategory.HTTP_403_MEDIA_REJECTED,
+        FailureCategory.MEDIA_ACCESS_REJECTED_AFTER_AUTHENTICATION,
+        FailureCategory.VERIFIED_SESSION_MEDIA_403,
+        FailureCategory.PO_TOKEN_MEDIA_403,
+    }
+)
+
+
+def is_throttling_signal(analysis: FailureAnalysis) -> bool:
+    """Return whether a classified failure should slow down future downloads."""
+    return analysis.rate_limited or analysis.category in THROTTLING_CATEGORIES
+
+
+@dataclass(frozen=True, slots=True)
+class AccelerationSettings:
+    concurrent_fragments: int
+    http_chunk_size: int
+
+    def ydl_options(self) -> dict[str, int]:
+        return {
+            "concurrent_fragment_downloads": self.concurrent_fragments,
+            "http_chunk_size": self.http_chunk_size,
+        }
+
+
+class AccelerationController:
+    """Choose download acceleration settings from measured throughput."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._level = INITIAL_CONCURRENT_FRAGMENTS
+        self._ceiling = MAX_CONCURRENT_FRAGMENTS
+        self._throughput: dict[int, float] = {}
+        self._last_backoff: float | None = None
+
+    def settings(self) -> AccelerationSettings:
+        """Return the settings for the next attempt, stepping toward the best level."""
+        with self._lock:
+            self._recover()
+            self._climb()
+            per_connection = self._throughput.get(self._level, 0.0) / self._level
+            if per_connection:
+                chunk = int(per_connection * CHUNK_TARGET_SECONDS)
+                chunk = max(MIN_HTTP_CHUNK_SIZE, min(MAX_HTTP_CHUNK_SIZE, chunk))
+            else:
+                chunk = MAX_HTTP_CHUNK_SIZE
+            return AccelerationSettings(self._level, chunk)
+
+    def record_throughput(self, concurrent_fragments: int, bytes_per_second: float) -> None:
+        if bytes_per_second <= 0 or concurrent_fragments < MIN_CONCURRENT_FRAGMENTS:
+            return
+        with self._lock:
+            previous = self._throughput.get(concurrent_fragments)
+            if previous is None:
+                self._throughput[concurrent_fragments] = float(bytes_per_second)
+            else:
+                self._throughput[concurrent_fragments] = previous + THROUGHPUT_SMOOTHING * (
+                    bytes_per_second - previous
+                )
+
+    def back_off(self) -> AccelerationSettings | None:
+        """Halve the concurrency ceiling; ``None`` while the last back-off is still recent."""
+        with self._lock:
+            now = self._clock()
+            if self._last_backoff is not None and (
+                now - self._last_backoff < BACKOFF_COOLDOWN_SECONDS
+            ):
+                return None
+            self._last_backoff = now
+            self._ceiling = max(MIN_CONCURRENT_FRAGMENTS, self._level // 2)
+            self._level = min(self._level, self._ceiling)
+            # Measurements from before the rejection no longer describe the link.
+            self._throughput.clear()
+            return AccelerationSettings(self._level, MIN_HTTP_CHUNK_SIZE)
+
+    def _recover(self) -> None:
+        if self._last_backoff is None or self._ceiling >= MAX_CONCURRENT_FRAGMENTS:
+            return
+        steps = int((self._clock() - self._last_backoff) // RECOVERY_INTERVAL_SECONDS)
+        if steps > 0:
+            self._ceiling = min(MAX_CONCURRENT_FRAGMENTS, self._ceiling + steps)
+            self._last_backoff += steps * RECOVERY_INTERVAL_SECONDS
+
+    def _climb(self) -> None:
+        current = self._throughput.get(self._level)
+        if current is None:
+            return
+        lower = self._throughput.get(self._level - 1)
+        if lower is not None and current < lower * (1 + MIN_THROUGHPUT_GAIN):
+            self._level -= 1
+            return
+        if self._level >= self._ceiling:
+            self._level = self._ceiling
+            return
+        higher = self._throughput.get(self._level + 1)
+        if higher is None or higher >= current * (1 + MIN_THROUGHPUT_GAIN):
+            self._level += 1
+
+
+_CONTROLLER: AccelerationController | None = None
+_CONTROLLER_LOCK = threading.Lock()
+
+
+def get_acceleration_controller() -> AccelerationController:
+    global _CONTROLLER
+    with _CONTROLLER_LOCK:
+        if _CONTROLLER is None:
+            _CONTROLLER = AccelerationController()
+        return _CONTROLLER
+
+
+__all__ = [
+    "AccelerationController",
+    "AccelerationSettings",
+    "get_acceleration_controller",
+    "is_throttling_signal",
+]
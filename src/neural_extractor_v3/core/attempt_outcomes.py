@@ -0,0 +1,233 @@
+"""Persisted attempt outcomes used to order the first download attempt.
+
+The retry planner always starts with the public attempt and only reaches the
+verified dedicated-browser session or the external PO Token helper after a
+classified failure.  When a batch of similar videos all need the same rescue
+route, every job pays for a failing public attempt first.  The store keeps
+decayed success and failure counts per route for each URL class (single
+video or playlist entry, main/music/shorts host, and whether the video was
+seen behind the age gate) and suggests starting with a rescue route once it
+clearly outperforms the public path.  Counts halve every half-life, and every
+few promoted jobs the public path is probed first again, so the planner goes
+back to it when YouTube stops enforcing the rescue route.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+from neural_extractor_v3.config import (
+    ATTEMPT_OUTCOME_HALF_LIFE_SECONDS,
+    PUBLIC_PATH_PROBE_INTERVAL,
+    app_data_dir,
+)
+from neural_extractor_v3.core.json_store import load_json_document, save_json_document
+from neural_extractor_v3.utils import extract_video_id, normalize_user_url
+
+OUTCOME_STORE_FILENAME = "attempt-outcomes.json"
+OUTCOME_SCHEMA_VERSION = 1
+ROUTE_PUBLIC = "public"
+ROUTE_AUTHENTICATED = "authenticated"
+ROUTE_VERIFIED_SESSION = "verified_session"
+ROUTE_PO_PROVIDER = "po_provider"
+MIN_LEARNED_SUCCESSES = 2.5  # three recent wins, allowing for a little decay
+PREFERENCE_MARGIN = 0.25
+MAX_AGE_RESTRICTED_VIDEOS = 512
+
+
+@dataclass(frozen=True, slots=True)
+class RouteStats:
+    successes: float = 0.0
+    failures: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Laplace-smoothed success rate; an unseen route scores 0.5."""
+        return (self.successes + 1.0) / (self.successes + self.failures + 2.0)
+
+
+def url_class(url: str, *, playlist_entry: bool, age_restricted: bool = False) -> str:
+    """Return the coarse class whose routes are learned together."""
+    try:
+        parsed = urlparse(normalize_user_url(url))
+    except ValueError:
+        parsed = urlparse("")
+    if parsed.netloc.lower() == "music.youtube.com":
+        host = "music"
+    elif parsed.path.startswith("/shorts/"):
+        host = "shorts"
+    else:
+        host = "main"
+    kind = "playlist" if playlist_entry else "single"
+    return f"{kind}:{host}:{'age' if age_restricted else 'open'}"
+
+
+class AttemptOutcomeStore:
+    """Thread-safe, file-backed decayed route statistics per URL class."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        half_life: float = ATTEMPT_OUTCOME_HALF_LIFE_SECONDS,
+        probe_interval: int = PUBLIC_PATH_PROBE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.half_life = max(1.0, float(half_life))
+        self.probe_interval = max(1, probe_interval)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: dict[str, Any] | None = None
+
+    def classify(self, url: str, *, playlist_entry: bool) -> str:
+        video_id = extract_video_id(url)
+        with self._lock:
+            age_restricted = bool(video_id) and video_id in self._load()["age_restricted"]
+        return url_class(url, playlist_entry=playlist_entry, age_restricted=age_restricted)
+
+    def stats(self, url_class: str) -> dict[str, RouteStats]:
+        with self._lock:
+            routes = self._load()["classes"].get(url_class, {}).get("routes", {})
+            now = self._clock()
+            return {route: self._decayed(entry, now) for route, entry in routes.items()}
+
+    def record(
+        self,
+        url_class: str,
+        route: str,
+        *,
+        success: bool,
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        """Add one outcome; ``detail`` describes the winning profile for diagnostics."""
+        with self._lock:
+            state = self._load()
+            now = self._clock()
+            routes = state["classes"].setdefault(url_class, {"routes": {}, "plans": 0})["routes"]
+            current = self._decayed(routes.get(route, {}), now)
+            entry: dict[str, Any] = {
+                "successes": current.successes + (1.0 if success else 0.0),
+                "failures": current.failures + (0.0 if success else 1.0),
+                "updated": now,
+            }
+            previous = routes.get(route, {}).get("last_success")
+            if success and detail:
+                entry["last_success"] = dict(detail)
+            elif previous:
+                entry["last_success"] = previous
+            routes[route] = entry
+            self._save(state)
+
+    def mark_age_restricted(self, video_id: str | None) -> None:
+        if not video_id:
+            return
+        with self._lock:
+            state = self._load()
+            videos = state["age_restricted"]
+            if video_id in videos:
+                return
+            videos.append(video_id)
+            del videos[:-MAX_AGE_RESTRICTED_VIDEOS]
+            self._save(state)
+
+    def preferred_route(self, url_class: str, candidates: Iterable[str]) -> str | None:
+        """Return the rescue route to try before the public path, if one has earned it."""
+        with self._lock:
+            state = self._load()
+            entry = state["classes"].get(url_class)
+            if entry is None:
+                return None
+            now = self._clock()
+            routes = entry["routes"]
+            public = self._decayed(routes.get(ROUTE_PUBLIC, {}), now)
+            best: tuple[float, str] | None = None
+            for route in candidates:
+                stats = self._decayed(routes.get(route, {}), now)
+                if stats.successes < MIN_LEARNED_SUCCESSES:
+                    continue
+                if stats.success_rate < public.success_rate + PREFERENCE_MARGIN:
+                    continue
+                if best is None or stats.success_rate > best[0]:
+                    best = (stats.success_rate, route)
+            if best is None:
+                return None
+            entry["plans"] = int(entry.get("plans", 0)) + 1
+            self._save(state)
+            if entry["plans"] % self.probe_interval == 0:
+                return None
+            return best[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state = _empty_state()
+            self._save(self._state)
+
+    def _decayed(self, entry: dict[str, Any], now: float) -> RouteStats:
+        try:
+            successes = float(entry.get("successes", 0.0))
+            failures = float(entry.get("failures", 0.0))
+            elapsed = max(0.0, now - float(entry.get("updated", now)))
+        except (TypeError, ValueError):
+            return RouteStats()
+        factor = 0.5 ** (elapsed / self.half_life)
+        return RouteStats(successes * factor, failures * factor)
+
+    def _load(self) -> dict[str, Any]:
+        if self._state is not None:
+            return self._state
+        state = _empty_state()
+        stored = load_json_document(self.path, OUTCOME_SCHEMA_VERSION)
+        if (
+            stored is not None
+            and isinstance(stored.get("classes"), dict)
+            and isinstance(stored.get("age_restricted"), list)
+        ):
+            state["classes"] = {
+                name: entry
+                for name, entry in stored["classes"].items()
+                if isinstance(entry, dict) and isinstance(entry.get("routes"), dict)
+            }
+            state["age_restricted"] = [
+                item for item in stored["age_restricted"] if isinstance(item, str)
+            ]
+        self._state = state
+        return state
+
+    def _save(self, state: dict[str, Any]) -> None:
+        save_json_document(self.path, OUTCOME_SCHEMA_VERSION, state)
+
+
+def _empty_state() -> dict[str, Any]:
+    return {"schema_version": OUTCOME_SCHEMA_VERSION, "classes": {}, "age_restricted": []}
+
+
+_DEFAULT_STORE: AttemptOutcomeStore | None = None
+_DEFAULT_STORE_LOCK = threading.Lock()
+
+
+def get_attempt_outcome_store() -> AttemptOutcomeStore:
+    global _DEFAULT_STORE
+    with _DEFAULT_STORE_LOCK:
+        if _DEFAULT_STORE is None:
+            _DEFAULT_STORE = AttemptOutcomeStore(app_data_dir() / OUTCOME_STORE_FILENAME)
+        return _DEFAULT_STORE
+
+
+__all__ = [
+    "OUTCOME_STORE_FILENAME",
+    "ROUTE_AUTHENTICATED",
+    "ROUTE_PO_PROVIDER",
+    "ROUTE_PUBLIC",
+    "ROUTE_VERIFIED_SESSION",
+    "AttemptOutcomeStore",
+    "RouteStats",
+    "get_attempt_outcome_store",
+    "url_class",
+]
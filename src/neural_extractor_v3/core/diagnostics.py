@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import csv
 import io
-import os
 import platform
 import shutil
 import subprocess
@@ -24,7 +23,7 @@ from neural_extractor_v3.config import (
     BUILD_LABEL,
     VERSION,
     YOUTUBE_EJS_REMOTE_COMPONENT,
-    YOUTUBE_REMOTE_COMPONENTS,
+    app_data_dir,
     base_dir,
     bin_dir,
 )
@@ -35,10 +34,15 @@ from neural_extractor_v3.core.auth import (
     AuthStrategy,
     resolve_auth_strategies,
 )
+from neural_extractor_v3.core.discovery_cache import discovery_cache_key, get_discovery_cache
 from neural_extractor_v3.core.downloader import (
     DownloadEngine,
     YtdlpRunError,
 )
+from neural_extractor_v3.core.ejs_solver_store import (
+    default_ejs_solver_store,
+    ytdlp_remote_components,
+)
 from neural_extractor_v3.core.format_selection import select_discovered_format
 from neural_extractor_v3.core.js_runtime import ensure_youtube_js_runtime
 from neural_extractor_v3.core.pot_provider import (
@@ -46,9 +50,11 @@ from neural_extractor_v3.core.pot_provider import (
     redact_po_token_material,
 )
 from neural_extractor_v3.core.youtube_errors import FailureCategory, classify_youtube_failure
+from neural_extractor_v3.core.ytdlp_cache import YTDLP_CACHE_DIRECTORY, get_ytdlp_cache
 from neural_extractor_v3.models import DownloadOptions
 
 DEFAULT_DIAGNOSTIC_PROBE_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+FORMAT_PROBE_CLIENTS = ("default",)
 EJS_GITHUB_RELEASES_URL = "https://github.com/yt-dlp/ejs/releases"
 NODE_EXE_NAME = "node.exe" if sys.platform == "win32" else "node"
 PROCESS_NAMES = {
@@ -123,8 +129,8 @@ def run_support_diagnostics(
     _add_youtube_connection(items, options)
     _add_po_token_provider(items)
     _add_browser_processes(items)
-    _add_ejs_remote_status(items)
-    if check_github:
+    remote_ejs = _add_ejs_remote_status(items)
+    if check_github and remote_ejs:
         _add_ejs_github_access(items)
     _add_node_execution_status(items, js_runtime.path)
     if run_probe:
@@ -330,16 +336,33 @@ def _add_browser_processes(items: list[DiagnosticItem]) -> None:
     items.append(DiagnosticItem("Browser processes running", status, detail))
 
 
-def _add_ejs_remote_status(items: list[DiagnosticItem]) -> None:
-    enabled = YOUTUBE_EJS_REMOTE_COMPONENT in YOUTUBE_REMOTE_COMPONENTS
-    status = DiagnosticStatus.PASS if enabled else DiagnosticStatus.WARNING
-    detail = (
-        f"--remote-components {YOUTUBE_EJS_REMOTE_COMPONENT} enabled"
-        if enabled
-        else f"--remote-components {YOUTUBE_EJS_REMOTE_COMPONENT} disabled; "
-        "using bundled/cached challenge solver scripts"
+def _add_ejs_remote_status(items: list[DiagnosticItem]) -> bool:
+    """Report the local solver store; return whether yt-dlp still needs ``ejs:github``."""
+    enabled = YOUTUBE_EJS_REMOTE_COMPONENT in ytdlp_remote_components(_ytdlp_cache_dir())
+    solver_store = default_ejs_solver_store()
+    store = solver_store.status()
+    items.append(
+        DiagnosticItem(
+            "EJS local solver store",
+            DiagnosticStatus.PASS if store.ready else DiagnosticStatus.WARNING,
+            f"{store.detail}; {solver_store.root}",
+        )
     )
+    status = DiagnosticStatus.PASS if enabled or store.ready else DiagnosticStatus.WARNING
+    if enabled:
+        detail = f"--remote-components {YOUTUBE_EJS_REMOTE_COMPONENT} enabled"
+    elif store.ready:
+        detail = (
+            f"--remote-components {YOUTUBE_EJS_REMOTE_COMPONENT} not needed; "
+            "using the pinned local solver store"
+        )
+    else:
+        detail = (
+            f"--remote-components {YOUTUBE_EJS_REMOTE_COMPONENT} disabled; "
+            "using bundled/cached challenge solver scripts"
+        )
     items.append(DiagnosticItem("EJS GitHub remote component", status, detail))
+    return enabled
 
 
 def _add_ejs_github_access(items: list[DiagnosticItem]) -> None:
@@ -434,44 +457,53 @@ def _add_format_probe(
         None,
     )
     strategies = [strategy for strategy in (public, dedicated) if strategy is not None]
+    cache = get_discovery_cache()
 
     for index, auth_strategy in enumerate(strategies):
         probe_opts = _format_probe_options(options, auth_strategy, js_runtimes)
         command = _format_probe_command(probe_url, probe_opts)
-        try:
-            result = engine._run_yt_dlp(probe_url, probe_opts, discover_only=True)
-        except YtdlpRunError as exc:
-            analysis = classify_youtube_failure(
-                exc.diagnostic_text(),
-                auth_kind=auth_strategy.kind,
-                javascript_runtime_available=engine.js_runtime_status.found,
-            )
-            detail = (
-                f"{auth_strategy.display_name}: {analysis.category.value}: "
-                f"{_one_line(exc.diagnostic_text())}"
-            )
-            last_error = detail
-            fallback_is_justified = analysis.category in {
-                FailureCategory.AUTHENTICATION_REQUIRED,
-                FailureCategory.COOKIE_FILE_REJECTED,
-                FailureCategory.BROWSER_COOKIE_DATABASE_LOCKED,
-                FailureCategory.BROWSER_COOKIE_DECRYPTION_FAILED,
-                FailureCategory.BROWSER_COOKIE_EXTRACTION_FAILED,
-            }
-            if fallback_is_justified and index < len(strategies) - 1:
-                warnings.append(detail)
-                continue
-            items.append(
-                DiagnosticItem(
-                    "Safe yt-dlp format probe",
-                    DiagnosticStatus.FAIL,
-                    f"{detail}; command={command}; previous warnings={'; '.join(warnings) or 'none'}",
+        cache_key = discovery_cache_key(probe_url, auth_strategy.provider_id, FORMAT_PROBE_CLIENTS)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            formats = cached.formats
+            command = f"{command} (reused cached discovery)"
+        else:
+            try:
+                result = engine._run_yt_dlp(probe_url, probe_opts, discover_only=True)
+            except YtdlpRunError as exc:
+                analysis = classify_youtube_failure(
+                    exc.diagnostic_text(),
+                    auth_kind=auth_strategy.kind,
+                    javascript_runtime_available=engine.js_runtime_status.found,
                 )
-            )
-            return
+                detail = (
+                    f"{auth_strategy.display_name}: {analysis.category.value}: "
+                    f"{_one_line(exc.diagnostic_text())}"
+                )
+                last_error = detail
+                fallback_is_justified = analysis.category in {
+                    FailureCategory.AUTHENTICATION_REQUIRED,
+                    FailureCategory.COOKIE_FILE_REJECTED,
+                    FailureCategory.BROWSER_COOKIE_DATABASE_LOCKED,
+                    FailureCategory.BROWSER_COOKIE_DECRYPTION_FAILED,
+                    FailureCategory.BROWSER_COOKIE_EXTRACTION_FAILED,
+                }
+                if fallback_is_justified and index < len(strategies) - 1:
+                    warnings.append(detail)
+                    continue
+                items.append(
+                    DiagnosticItem(
+                        "Safe yt-dlp format probe",
+                        DiagnosticStatus.FAIL,
+                        f"{detail}; command={command}; previous warnings={'; '.join(warnings) or 'none'}",
+                    )
+                )
+                return
+            formats = result.formats
+            cache.put(cache_key, formats, result.metadata)
 
-        count = len(result.formats)
-        selection = select_discovered_format(result.formats, options.media_mode)
+        count = len(formats)
+        selection = select_discovered_format(formats, options.media_mode)
         has_media = bool(selection.selector or selection.media_format_count)
         status = DiagnosticStatus.PASS if has_media else DiagnosticStatus.FAIL
         detail = (
@@ -508,7 +540,7 @@ def _format_probe_options(
         "windowsfilenames": True,
         "extractor_args": {
             "youtube": {
-                "player_client": ["default"],
+                "player_client": list(FORMAT_PROBE_CLIENTS),
                 "fetch_pot": ["never"],
                 "pot_trace": ["false"],
             }
@@ -516,8 +548,9 @@ def _format_probe_options(
     }
     if js_runtimes:
         probe_opts["js_runtimes"] = js_runtimes
-    if YOUTUBE_REMOTE_COMPONENTS:
-        probe_opts["remote_components"] = list(YOUTUBE_REMOTE_COMPONENTS)
+    remote_components = ytdlp_remote_components(_ytdlp_cache_dir())
+    if remote_components:
+        probe_opts["remote_components"] = remote_components
 
     local_bin = bin_dir()
     if local_bin.exists():
@@ -563,8 +596,7 @@ def _format_probe_command(probe_url: str, probe_opts: dict[str, object]) -> str:
 
 
 def _ytdlp_cache_dir() -> Path:
-    cache_root = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
-    return Path(cache_root).expanduser() / "yt-dlp"
+    return get_ytdlp_cache(app_data_dir() / YTDLP_CACHE_DIRECTORY).ytdlp_dir
 
 
 def _directory_writable(path: Path, *, create: bool) -> tuple[bool, str]:
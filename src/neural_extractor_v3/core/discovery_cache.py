@@ -0,0 +1,133 @@
+"""Short-lived cache of yt-dlp format discovery results.
+
+A format-unavailable retry, the proven-403 selector, and the diagnostics
+format probe all need the same format list for a video.  Within a batch the
+list does not change between attempts, so the last successful discovery for a
+``(video ID, auth provider, player clients)`` combination is reused for a few
+minutes instead of probing YouTube again.  Format URLs are never downloaded
+from the cache; only format IDs are selected from it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from neural_extractor_v3.config import DISCOVERY_CACHE_MAX_ENTRIES, DISCOVERY_CACHE_TTL_SECONDS
+from neural_extractor_v3.utils import extract_video_id
+
+DiscoveryKey = tuple[str, str, tuple[str, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class CachedDiscovery:
+    formats: list[dict[str, Any]] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+def discovery_cache_key(
+    url: str,
+    provider_id: str,
+    player_clients: Iterable[str],
+) -> DiscoveryKey | None:
+    """Return the cache key for a single video, or ``None`` when it is not cacheable."""
+    video_id = extract_video_id(url)
+    if not video_id:
+        return None
+    return (video_id, provider_id, tuple(player_clients))
+
+
+class DiscoveryCache:
+    """Thread-safe TTL cache holding at most ``max_entries`` discoveries."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DISCOVERY_CACHE_TTL_SECONDS,
+        max_entries: int = DISCOVERY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max(0, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[DiscoveryKey, tuple[float, CachedDiscovery]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: DiscoveryKey | None) -> CachedDiscovery | None:
+        if key is None or not self.enabled:
+            return None
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, cached = entry
+            if now - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return _copy(cached.formats, cached.metadata)
+
+    def put(
+        self,
+        key: DiscoveryKey | None,
+        formats: Iterable[Mapping[str, Any]],
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Remember a discovery; empty format lists are never cached."""
+        if key is None or not self.enabled:
+            return
+        cached = _copy(formats, metadata or {})
+        if not cached.formats:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock(), cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _copy(
+    formats: Iterable[Mapping[str, Any]],
+    metadata: Mapping[str, Any],
+) -> CachedDiscovery:
+    return CachedDiscovery(
+        formats=[dict(item) for item in formats if isinstance(item, Mapping)],
+        metadata=dict(metadata),
+    )
+
+
+_DEFAULT_CACHE: DiscoveryCache | None = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_discovery_cache() -> DiscoveryCache:
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = DiscoveryCache()
+        return _DEFAULT_CACHE
+
+
+__all__ = [
+    "CachedDiscovery",
+    "DiscoveryCache",
+    "discovery_cache_key",
+    "get_discovery_cache",
+]
@@ -0,0 +1,219 @@
+"""SQLite index of completed downloads used to skip media that is already on disk.
+
+yt-dlp only notices an existing file after a worker has started and the
+video has been extracted again, so re-running a large playlist cost one
+worker per entry.  The worker now reports the final path of each completed
+video; the engine records it here together with the video ID, media mode,
+quality, size and SHA-256.  Before a worker is launched for a video, or for
+each entry of an expanded playlist, the index is checked.  A record only
+counts while its file still exists inside the current output folder with the
+recorded size; anything else is dropped and the video is downloaded again.
+``DownloadOptions.overwrite`` bypasses the index.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from neural_extractor_v3.config import app_data_dir
+from neural_extractor_v3.models import DownloadOptions, MediaMode
+
+DOWNLOAD_ARCHIVE_FILENAME = "download-archive.sqlite3"
+HASH_CHUNK_BYTES = 1024 * 1024
+ARCHIVED_MEDIA_MODES = frozenset({MediaMode.VIDEO, MediaMode.AUDIO_MP3, MediaMode.AUDIO_M4A})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    video_id TEXT NOT NULL,
+    media_mode TEXT NOT NULL,
+    quality TEXT NOT NULL,
+    output_path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (video_id, media_mode, quality)
+)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ArchivedDownload:
+    video_id: str
+    media_mode: str
+    quality: str
+    output_path: Path
+    size: int
+    sha256: str
+    completed_at: float
+
+
+def archive_variant(options: DownloadOptions) -> tuple[str, str] | None:
+    """Return ``(media_mode, quality)`` for archived modes, ``None`` otherwise."""
+    if options.media_mode not in ARCHIVED_MEDIA_MODES:
+        return None
+    if options.media_mode == MediaMode.VIDEO:
+        quality = options.quality
+    elif options.media_mode == MediaMode.AUDIO_MP3:
+        quality = options.audio_quality
+    else:
+        quality = ""
+    return options.media_mode.value, quality
+
+
+class DownloadArchive:
+    """Thread-safe access to one archive database; every call uses a short transaction."""
+
+    def __init__(self, path: Path, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def lookup(
+        self,
+        video_id: str | None,
+        variant: tuple[str, str] | None,
+        output_dir: Path,
+    ) -> ArchivedDownload | None:
+        """Return the record when its file is still present and unchanged in ``output_dir``."""
+        if not video_id or variant is None:
+            return None
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                row = connection.execute(
+                    "SELECT output_path, size, sha256, completed_at FROM downloads "
+                    "WHERE video_id = ? AND media_mode = ? AND quality = ?",
+                    (video_id, *variant),
+                ).fetchone()
+                if row is None:
+                    return None
+                record = ArchivedDownload(video_id, *variant, Path(row[0]), *row[1:])
+                if _is_within(record.output_path, output_dir) and _has_size(
+                    record.output_path, record.size
+                ):
+                    return record
+                if not record.output_path.exists():
+                    with connection:
+                        connection.execute(
+                            "DELETE FROM downloads "
+                            "WHERE video_id = ? AND media_mode = ? AND quality = ?",
+                            (video_id, *variant),
+                        )
+            except sqlite3.Error:
+                return None
+            return None
+
+    def record(
+        self,
+        video_id: str | None,
+        variant: tuple[str, str] | None,
+        output_path: Path,
+    ) -> ArchivedDownload | None:
+        """Hash ``output_path`` and store it; ``None`` when it cannot be archived."""
+        if not video_id or variant is None:
+            return None
+        output_path = Path(output_path).resolve()
+        try:
+            size = output_path.stat().st_size
+            digest = _sha256(output_path)
+        except OSError:
+            return None
+        record = ArchivedDownload(video_id, *variant, output_path, size, digest, self._clock())
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return None
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO downloads "
+                        "(video_id, media_mode, quality, output_path, size, sha256, completed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            record.video_id,
+                            record.media_mode,
+                            record.quality,
+                            str(record.output_path),
+                            record.size,
+                            record.sha256,
+                            record.completed_at,
+                        ),
+                    )
+            except sqlite3.Error:
+                return None
+        return record
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._connection is not None:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            with contextlib.suppress(sqlite3.DatabaseError):
+                connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(_SCHEMA)
+        except (OSError, sqlite3.Error):
+            # The archive only saves time; an unusable database disables it.
+            return None
+        self._connection = connection
+        return connection
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        while chunk := stream.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _is_within(path: Path, directory: Path) -> bool:
+    try:
+        return Path(path).resolve().is_relative_to(Path(directory).resolve())
+    except OSError:
+        return False
+
+
+def _has_size(path: Path, size: int) -> bool:
+    try:
+        return path.is_file() and path.stat().st_size == size
+    except OSError:
+        return False
+
+
+_DEFAULT_ARCHIVE: DownloadArchive | None = None
+_DEFAULT_ARCHIVE_LOCK = threading.Lock()
+
+
+def get_download_archive() -> DownloadArchive:
+    global _DEFAULT_ARCHIVE
+    with _DEFAULT_ARCHIVE_LOCK:
+        if _DEFAULT_ARCHIVE is None:
+            _DEFAULT_ARCHIVE = DownloadArchive(app_data_dir() / DOWNLOAD_ARCHIVE_FILENAME)
+        return _DEFAULT_ARCHIVE
+
+
+__all__ = [
+    "DOWNLOAD_ARCHIVE_FILENAME",
+    "ArchivedDownload",
+    "DownloadArchive",
+    "archive_variant",
+    "get_download_archive",
+]
@@ -0,0 +1,66 @@
+"""Process-wide budget of concurrently running downloads.
+
+The scheduler runs up to ``max_parallel_jobs`` jobs and a playlist job runs
+several entries of its own, so the two together could start far more yt-dlp
+workers than ``MAX_PARALLEL_DOWNLOADS`` (each with its own fragment
+connections).  Every scheduler job holds one slot of this budget while it
+runs.  A playlist runs its first entry in the slot its job already holds and
+only adds entries in parallel while it can take further slots, so the total
+number of concurrent downloads in the process stays bounded and a playlist can
+never wait on a slot it is itself holding.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from neural_extractor_v3.config import MAX_PARALLEL_DOWNLOADS
+
+SLOT_POLL_SECONDS = 0.25
+
+
+class DownloadSlots:
+    """A bounded number of download slots shared by every engine in the process."""
+
+    def __init__(self, size: int = MAX_PARALLEL_DOWNLOADS) -> None:
+        self.size = max(1, int(size))
+        self._semaphore = threading.BoundedSemaphore(self.size)
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Hold one slot for the duration of the block, waiting for one if needed."""
+        self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def acquire_while(self, keep_waiting: Callable[[], bool]) -> bool:
+        """Wait for a slot while ``keep_waiting()`` holds; ``False`` if it gave up.
+
+        A slot taken here must be given back with ``release``.
+        """
+        while keep_waiting():
+            if self._semaphore.acquire(timeout=SLOT_POLL_SECONDS):
+                return True
+        return False
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+
+_DEFAULT_SLOTS: DownloadSlots | None = None
+_DEFAULT_SLOTS_LOCK = threading.Lock()
+
+
+def get_download_slots() -> DownloadSlots:
+    global _DEFAULT_SLOTS
+    with _DEFAULT_SLOTS_LOCK:
+        if _DEFAULT_SLOTS is None:
+            _DEFAULT_SLOTS = DownloadSlots()
+        return _DEFAULT_SLOTS
+
+
+__all__ = ["SLOT_POLL_SECONDS", "DownloadSlots", "get_download_slots"]
@@ -10,27 +10,47 @@ import shutil
 import subprocess
 import sys
 import threading
+import time
 import traceback
-from collections import deque
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections import Counter, deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
 from neural_extractor_v3.config import (
+    HEDGED_ATTEMPT_DELAY_SECONDS,
+    MAX_PARALLEL_DOWNLOADS,
+    PLAYLIST_ENTRY_PARALLELISM,
     QUALITY_PRESETS,
     THROTTLE_SAFE_OPTIONS,
-    YOUTUBE_REMOTE_COMPONENTS,
+    WORKER_MAX_FRAME_CHARS,
+    WORKER_PROGRESS_FRAMES_PER_SECOND,
+    YOUTUBE_EJS_REMOTE_COMPONENT,
     YTDLP_ATTEMPT_TOTAL_TIMEOUT_SECONDS,
     YTDLP_INACTIVITY_TIMEOUT_SECONDS,
+    YTDLP_RETAINED_OUTPUT_CHARS,
     YTDLP_STATUS_HEARTBEAT_SECONDS,
     YTDLP_TERMINATION_GRACE_SECONDS,
     app_data_dir,
     base_dir,
     bin_dir,
 )
+from neural_extractor_v3.core.acceleration import (
+    AccelerationSettings,
+    get_acceleration_controller,
+    is_throttling_signal,
+)
+from neural_extractor_v3.core.attempt_outcomes import (
+    ROUTE_AUTHENTICATED,
+    ROUTE_PO_PROVIDER,
+    ROUTE_PUBLIC,
+    ROUTE_VERIFIED_SESSION,
+    get_attempt_outcome_store,
+)
 from neural_extractor_v3.core.auth import (
     AuthenticationState,
     AuthResolution,
@@ -39,6 +59,19 @@ from neural_extractor_v3.core.auth import (
     clean_browser_cookie_failure,
     resolve_auth_strategies,
 )
+from neural_extractor_v3.core.discovery_cache import (
+    CachedDiscovery,
+    DiscoveryKey,
+    discovery_cache_key,
+    get_discovery_cache,
+)
+from neural_extractor_v3.core.download_archive import (
+    ArchivedDownload,
+    archive_variant,
+    get_download_archive,
+)
+from neural_extractor_v3.core.download_slots import get_download_slots
+from neural_extractor_v3.core.ejs_solver_store import ytdlp_remote_components
 from neural_extractor_v3.core.format_selection import (
     DiscoveredFormatSelection,
     select_discovered_format,
@@ -47,12 +80,23 @@ from neural_extractor_v3.core.js_runtime import (
     clean_youtube_challenge_runtime_error,
     ensure_youtube_js_runtime,
 )
+from neural_extractor_v3.core.line_framer import LineFramer
+from neural_extractor_v3.core.negative_cache import get_negative_result_cache
+from neural_extractor_v3.core.playlist_sync import (
+    KNOWN_ENTRY_STREAK,
+    get_playlist_sync_store,
+    lists_newest_first,
+    playlist_sync_key,
+    sync_listing_url,
+)
 from neural_extractor_v3.core.pot_provider import (
     PROVIDER_EXTRACTOR_KEY,
     get_po_token_provider,
     redact_po_token_material,
 )
 from neural_extractor_v3.core.process_control import (
+    OutputRetention,
+    OutputRetentionMode,
     OwnedProcessSupervisor,
     ProcessCancelledError,
     ProcessInactivityTimeoutError,
@@ -66,6 +110,7 @@ from neural_extractor_v3.core.process_control import (
     recover_owned_process,
 )
 from neural_extractor_v3.core.subtitles import subtitle_postprocessor, subtitle_ydl_options
+from neural_extractor_v3.core.worker_pool import PooledWorkerRunner, get_ytdlp_worker_pool
 from neural_extractor_v3.core.youtube_connection import (
     ManagedBrowser,
     validate_managed_profile_path,
@@ -74,9 +119,16 @@ from neural_extractor_v3.core.youtube_errors import (
     FailureAnalysis,
     FailureCategory,
     classify_youtube_failure,
+    has_age_restriction_signal,
+)
+from neural_extractor_v3.core.ytdlp_cache import (
+    YTDLP_CACHE_DIRECTORY,
+    SharedYtdlpCache,
+    get_ytdlp_cache,
 )
-from neural_extractor_v3.core.ytdlp_worker import PROTOCOL_PREFIX
+from neural_extractor_v3.core.ytdlp_worker import DOWNLOAD_CLAIM_LOST_PHASE, PROTOCOL_PREFIX
 from neural_extractor_v3.models import (
+    DownloadAcceleration,
     DownloadJob,
     DownloadOptions,
     DownloadResult,
@@ -85,6 +137,7 @@ from neural_extractor_v3.models import (
     ProgressEvent,
 )
 from neural_extractor_v3.utils import (
+    extract_video_id,
     format_bytes_per_second,
     format_eta,
     is_youtube_mix_url,
@@ -116,15 +169,100 @@ HTTP_403_FINAL_MESSAGE = (
     "retry later or review the Activity Log for client, rate-limit, IP, or PO Token details."
 )
 
+ROUTE_NEUTRAL_CATEGORIES = frozenset(
+    {
+        FailureCategory.NETWORK_TRANSIENT,
+        FailureCategory.NETWORK_INACTIVITY_TIMEOUT,
+        FailureCategory.TOTAL_ATTEMPT_TIMEOUT,
+        FailureCategory.REQUESTED_FORMAT_UNAVAILABLE,
+        FailureCategory.WORKER_PROTOCOL_ERROR,
+        FailureCategory.DOWNLOAD_CANCELLED,
+        FailureCategory.VIDEO_UNAVAILABLE,
+        FailureCategory.LIVE_EVENT_ENDED,
+        FailureCategory.UNKNOWN,
+    }
+)
+
+# Redacted lines kept per stream for classification and diagnostics.  The final
+# error lines decide the failure category, so even a zero retention setting keeps
+# a tail.
+CAPTURED_OUTPUT_MAX_CHARS = max(YTDLP_RETAINED_OUTPUT_CHARS, 64 * 1024)
+
+_CREDENTIAL_ASSIGNMENT_PATTERN = re.compile(r"(?i)\b(cookie|authorization)\s*[:=]\s*\S+")
+
+HEDGE_PRIMARY = "primary"
+HEDGE_SECONDARY = "hedge"
+HEDGE_SIGNAL_CATEGORIES = frozenset(
+    {
+        FailureCategory.AUTHENTICATION_REQUIRED,
+        FailureCategory.HTTP_403_MEDIA_REJECTED,
+        FailureCategory.PO_TOKEN_REQUIRED,
+        FailureCategory.ONLY_SABR_OR_IMAGE_FORMATS,
+    }
+)
+
 
 class DownloadCancelledError(RuntimeError):
     """Raised after the exact owned process tree has been cancelled."""
 
 
+class CapturedLines:
+    """Redacted output lines bounded to a head and a tail by character count.
+
+    Lines fill the head until ``max_chars // 4`` characters are held; later lines
+    go to a tail that drops its oldest lines beyond the remaining budget, always
+    keeping the newest line.  Iteration yields the head, one marker line for
+    anything dropped, then the tail, so the final error lines yt-dlp prints are
+    never lost however long the attempt ran.
+    """
+
+    __slots__ = ("_head", "_head_room", "_tail", "_tail_chars", "_tail_limit", "_omitted")
+
+    def __init__(self, lines: Iterable[str] = (), *, max_chars: int | None = None) -> None:
+        budget = CAPTURED_OUTPUT_MAX_CHARS if max_chars is None else max(1, max_chars)
+        self._head: list[str] = []
+        self._head_room = budget // 4
+        self._tail: deque[str] = deque()
+        self._tail_chars = 0
+        self._tail_limit = budget - budget // 4
+        self._omitted = 0
+        self.extend(lines)
+
+    def append(self, line: str) -> None:
+        if not self._tail and len(line) <= self._head_room:
+            self._head.append(line)
+            self._head_room -= len(line)
+            return
+        self._tail.append(line)
+        self._tail_chars += len(line)
+        while len(self._tail) > 1 and self._tail_chars > self._tail_limit:
+            self._tail_chars -= len(self._tail.popleft())
+            self._omitted += 1
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._head
+        if self._omitted:
+            yield f"[... {self._omitted} line(s) of yt-dlp output omitted ...]"
+        yield from self._tail
+
+    def __len__(self) -> int:
+        return len(self._head) + bool(self._omitted) + len(self._tail)
+
+
 @dataclass(slots=True)
 class YtdlpCapturedOutput:
-    stdout: list[str] = field(default_factory=list)
-    stderr: list[str] = field(default_factory=list)
+    stdout: CapturedLines = field(default_factory=CapturedLines)
+    stderr: CapturedLines = field(default_factory=CapturedLines)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.stdout, CapturedLines):
+            self.stdout = CapturedLines(self.stdout)
+        if not isinstance(self.stderr, CapturedLines):
+            self.stderr = CapturedLines(self.stderr)
 
     def stdout_text(self) -> str:
         return "\n".join(line for line in self.stdout if line).strip()
@@ -158,11 +296,151 @@ class DownloadAttemptProfile:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class PlaylistEntry:
+    """One flat-extracted playlist entry, downloaded as its own single-video job."""
+
+    index: int
+    url: str
+    video_id: str = ""
+    title: str = ""
+
+
 @dataclass(frozen=True, slots=True)
 class YtdlpRunResult:
     formats: list[dict[str, Any]] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
     diagnostic: str = ""
+    playlist_title: str = ""
+    entries: list[PlaylistEntry] = field(default_factory=list)
+
+
+class _PlaylistProgress:
+    """Fold per-entry progress into one aggregate row for the parent job."""
+
+    def __init__(self, job_id: str, total: int, callback: ProgressCallback | None) -> None:
+        self.job_id = job_id
+        self.total = max(1, total)
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._percent_by_index: dict[int, int] = {}
+        self._finished = 0
+
+    def percent(self) -> int:
+        with self._lock:
+            return self._aggregate()
+
+    def _aggregate(self) -> int:
+        return min(100, sum(self._percent_by_index.values()) // self.total)
+
+    def entry_callback(self, entry: PlaylistEntry) -> ProgressCallback:
+        def forward(event: ProgressEvent) -> None:
+            with self._lock:
+                if event.status == "downloading":
+                    # Video and audio streams each run 0-100%; never move the row backwards.
+                    previous = self._percent_by_index.get(entry.index, 0)
+                    self._percent_by_index[entry.index] = max(previous, event.percent)
+                percent = self._aggregate()
+            self._emit(
+                replace(
+                    event,
+                    job_id=self.job_id,
+                    percent=percent,
+                    title=event.title or entry.title,
+                    playlist_index=entry.index,
+                    playlist_total=self.total,
+                )
+            )
+
+        return forward
+
+    def finish(self, entry: PlaylistEntry) -> None:
+        with self._lock:
+            self._percent_by_index[entry.index] = 100
+            self._finished += 1
+            percent = self._aggregate()
+            finished = self._finished
+        self._emit(
+            ProgressEvent(
+                job_id=self.job_id,
+                status=f"Finished {finished} of {self.total} playlist entries",
+                percent=percent,
+                title=entry.title,
+                playlist_index=entry.index,
+                playlist_total=self.total,
+            )
+        )
+
+    def _emit(self, event: ProgressEvent) -> None:
+        if self.callback:
+            self.callback(event)
+
+
+@dataclass(slots=True)
+class _HedgeOutcome:
+    profile: DownloadAttemptProfile
+    error: YtdlpRunError | None = None
+    hedge: DownloadAttemptProfile | None = None
+
+
+class _HedgedRace:
+    """Coordinate a primary attempt and its hedge; the first to reach the download phase wins.
+
+    Only the extraction phase is raced.  Each worker must create ``claim_path``
+    exclusively before it downloads, so exactly one attempt ever writes media;
+    a worker that finds the claim taken stops and the other attempt wins.
+    """
+
+    def __init__(self, claim_path: Path) -> None:
+        self._lock = threading.Lock()
+        self._engines: dict[str, DownloadEngine] = {}
+        self.claim_path = claim_path
+        self.wake = threading.Event()
+        self.primary_finished = threading.Event()
+        self.signal = ""
+        self.winner = ""
+
+    def observer(self, racer: str) -> Callable[[str, str], None]:
+        def observe(kind: str, value: str) -> None:
+            if kind == "phase" and value == "download":
+                self.claim(racer)
+            elif kind == "phase" and value == DOWNLOAD_CLAIM_LOST_PHASE:
+                self.claim(HEDGE_SECONDARY if racer == HEDGE_PRIMARY else HEDGE_PRIMARY)
+            elif kind == "log" and racer == HEDGE_PRIMARY and not self.signal:
+                category = classify_youtube_failure(value).category
+                if category in HEDGE_SIGNAL_CATEGORIES:
+                    self.signal = category.value
+                    self.wake.set()
+
+        return observe
+
+    def progress(self, racer: str, callback: ProgressCallback | None) -> ProgressCallback | None:
+        if callback is None:
+            return None
+
+        def forward(event: ProgressEvent) -> None:
+            # The primary owns the job's status line until a racer has claimed it.
+            if self.winner == racer or (not self.winner and racer == HEDGE_PRIMARY):
+                callback(event)
+
+        return forward
+
+    def register(self, racer: str, engine: DownloadEngine) -> bool:
+        with self._lock:
+            if self.winner and self.winner != racer:
+                return False
+            self._engines[racer] = engine
+            return True
+
+    def claim(self, racer: str) -> None:
+        with self._lock:
+            if self.winner:
+                return
+            self.winner = racer
+            losers = [engine for name, engine in self._engines.items() if name != racer]
+        self.wake.set()
+        for engine in losers:
+            engine.cancel()
 
 
 class YtdlpCaptureLogger:
@@ -236,6 +514,16 @@ class YtdlpRunError(RuntimeError):
         return redact_po_token_material("\n\n".join(sections))
 
 
+def _profile_route(profile: DownloadAttemptProfile) -> str:
+    if profile.po_token_provider:
+        return ROUTE_PO_PROVIDER
+    if profile.auth_strategy.is_dedicated_browser:
+        return ROUTE_VERIFIED_SESSION
+    if profile.auth_strategy.attempted_auth:
+        return ROUTE_AUTHENTICATED
+    return ROUTE_PUBLIC
+
+
 def _height_limited_video_selector(height: int) -> str:
     return (
         f"bv*[height<={height}][ext=mp4]+ba[ext=m4a]/"
@@ -301,6 +589,14 @@ def _remove_owned_worker_temp(directory: Path, worker_temp_root: Path) -> bool:
     return True
 
 
+def _literal_path_component(value: str, restrict: bool) -> str:
+    """Name one literal directory exactly as yt-dlp would expand ``%(playlist)s``."""
+    from yt_dlp.utils import sanitize_filename
+
+    text = sanitize_filename(value, restricted=restrict) or "Playlist"
+    return text.replace("%", "%%")
+
+
 class DownloadEngine:
     """Build yt-dlp options and execute isolated, state-driven download attempts."""
 
@@ -314,14 +610,32 @@ class DownloadEngine:
         process_record_label: str = "download",
     ) -> None:
         self.options = options
+        self._path_replacements: tuple[tuple[str, str], ...] | None = None
         self.progress_callback = progress_callback
         self.log_callback = log_callback
         self._cancel_event = threading.Event()
         self._active_job_id = ""
+        self._active_job: DownloadJob | None = None
+        self._child_engines: set[DownloadEngine] = set()
+        self._child_engines_lock = threading.Lock()
+        self._attempt_observer: Callable[[str, str], None] | None = None
+        self._download_claim: tuple[Path, str] | None = None
+        self._expansion_error: YtdlpRunError | None = None
         self._files_seen: list[Path] = []
+        # Final files the worker reported once yt-dlp moved them into place, by video ID.
+        self._completed_media: list[tuple[str, Path]] = []
         self._last_percent = 0
         self._last_activity_status = ""
         self._last_discovery_failure: FailureAnalysis | None = None
+        # Formats a failed attempt already reported in this job, per provider and client.
+        self._observed_formats: dict[tuple[str, tuple[str, ...]], CachedDiscovery] = {}
+        self._discovery_cache = get_discovery_cache()
+        self._outcomes = get_attempt_outcome_store()
+        self._negative_results = get_negative_result_cache()
+        self._archive = get_download_archive()
+        self._playlist_sync = get_playlist_sync_store()
+        self._acceleration = get_acceleration_controller()
+        self._acceleration_settings: AccelerationSettings | None = None
         self.js_runtime_status = ensure_youtube_js_runtime()
         self.po_token_provider = get_po_token_provider()
         refresh_provider = getattr(self.po_token_provider, "refresh_status", None)
@@ -337,16 +651,40 @@ class DownloadEngine:
         )
         safe_label = re.sub(r"[^a-z0-9_-]", "-", process_record_label.casefold()).strip("-")
         safe_label = safe_label or "download"
+        self._process_limits = limits
+        self._process_record_label = safe_label
         record = (
             app_data_dir()
             / "process-state"
             / f"active-{safe_label}-{os.getpid()}-{uuid4().hex[:8]}.json"
         )
-        self._supervisor = OwnedProcessSupervisor(
-            limits,
-            cancellation_event=self._cancel_event,
-            ownership_record=record,
+        # Output is consumed line by line through the callbacks; the result only
+        # needs the start and end of a stream for diagnostics.
+        retained = YTDLP_RETAINED_OUTPUT_CHARS
+        retention = OutputRetention(
+            OutputRetentionMode.HEAD_TAIL if retained else OutputRetentionMode.NONE,
+            head_chars=retained // 4,
+            tail_chars=retained - retained // 4,
         )
+        worker_pool = get_ytdlp_worker_pool()
+        self._pooled_workers = worker_pool.enabled
+        self._supervisor: OwnedProcessSupervisor | PooledWorkerRunner
+        if self._pooled_workers:
+            self._supervisor = PooledWorkerRunner(
+                worker_pool,
+                limits,
+                cancellation_event=self._cancel_event,
+                record_directory=record.parent,
+                record_label=safe_label,
+                retention=retention,
+            )
+        else:
+            self._supervisor = OwnedProcessSupervisor(
+                limits,
+                cancellation_event=self._cancel_event,
+                ownership_record=record,
+                retention=retention,
+            )
 
     @property
     def cancel_requested(self) -> bool:
@@ -359,13 +697,20 @@ class DownloadEngine:
         self._log("Cancelling download")
         self._emit_activity_status("Cancelling download")
         self._supervisor.cancel()
+        with self._child_engines_lock:
+            child_engines = list(self._child_engines)
+        for engine in child_engines:
+            engine.cancel()
 
     def download(self, job: DownloadJob) -> DownloadResult:
         self._active_job_id = job.job_id
+        self._active_job = job
         self._files_seen = []
+        self._completed_media = []
         self._last_percent = 0
         self._last_activity_status = ""
         self._last_discovery_failure = None
+        self._observed_formats = {}
 
         if self.cancel_requested:
             return self._failure_result(
@@ -381,6 +726,27 @@ class DownloadEngine:
             )
 
         url = self.prepare_url(job.url)
+        playlist = should_download_playlist(url, self.options.playlist_mode.value)
+        video_id = None if playlist else extract_video_id(url)
+        known_failure = None if job.recheck_unavailable else self._negative_results.get(video_id)
+        if known_failure is not None:
+            age = max(0, int((time.time() - known_failure.recorded_at) // 60))
+            self._log(
+                f"Skipping {video_id}: it failed as {known_failure.category.value} "
+                f"{age} minute(s) ago. Use Retry and Recheck Availability in the queue "
+                "(--recheck-unavailable from the command line) to try it again."
+            )
+            return self._failure_result(job, known_failure.category, known_failure.message)
+        archived = self._archived_download(video_id, self.options)
+        if archived is not None:
+            self._log(f"Skipping {video_id}: already downloaded as {archived.output_path}.")
+            self._files_seen = [archived.output_path]
+            return DownloadResult(
+                job.job_id,
+                True,
+                f"Already downloaded: {archived.output_path.name}",
+                [archived.output_path],
+            )
         self.options.output_dir.mkdir(parents=True, exist_ok=True)
         auth_resolution = resolve_auth_strategies(
             self.options.cookie_file,
@@ -407,6 +773,24 @@ class DownloadEngine:
             )
 
         public_strategy = self._public_strategy(auth_resolution)
+        if playlist:
+            sync_key = None
+            if self.options.playlist_mode == PlaylistMode.SYNC:
+                url = sync_listing_url(url)
+                sync_key = playlist_sync_key(url)
+            known = self._playlist_sync.known_ids(sync_key)
+            expansion = self._expand_playlist(
+                url,
+                public_strategy,
+                known_entries=known if lists_newest_first(url) else (),
+                fallback=sync_key is None,
+            )
+            if sync_key is not None:
+                if expansion is None:
+                    return self._sync_listing_failure(job, public_strategy)
+                return self._sync_playlist_entries(job, expansion, sync_key, known)
+            if expansion is not None:
+                return self._download_playlist_entries(job, expansion)
         verified_strategy, verified_problem = self._recent_verified_strategy(auth_resolution)
         verified_configured = bool(
             self.options.dedicated_browser
@@ -417,6 +801,28 @@ class DownloadEngine:
             [self._profile(public_strategy, reason="public_primary")]
         )
         attempted_profiles: set[tuple[str, str, tuple[str, ...], str, bool]] = set()
+        outcome_class = self._outcomes.classify(url, playlist_entry=job.playlist_index is not None)
+        learned_profile = self._learned_profile(outcome_class, public_strategy, verified_strategy)
+        if learned_profile is not None:
+            queue.appendleft(learned_profile)
+            self._log(
+                f"Attempt order learned for {outcome_class}: "
+                f"starting with {learned_profile.reason}."
+            )
+        signal_hedge = delay_hedge = None
+        if self.options.hedged_attempts:
+            signal_hedge = self._hedge_profile(
+                public_strategy, verified_strategy, after_failure_signal=True
+            )
+            delay_hedge = self._hedge_profile(
+                public_strategy, verified_strategy, after_failure_signal=False
+            )
+        if learned_profile is not None:
+            learned_route = _profile_route(learned_profile)
+            if signal_hedge is not None and _profile_route(signal_hedge) == learned_route:
+                signal_hedge = None
+            if delay_hedge is not None and _profile_route(delay_hedge) == learned_route:
+                delay_hedge = None
         clean_no_cookie_retry_used = False
         verified_media_retry_used = False
         po_provider_retry_used = False
@@ -445,7 +851,18 @@ class DownloadEngine:
             self._log_attempt_start(profile, attempts)
 
             try:
-                self._run_profile(url, profile)
+                if (signal_hedge or delay_hedge) and profile.reason == "public_primary":
+                    outcome = self._run_hedged(url, profile, signal_hedge, delay_hedge)
+                    if outcome.hedge is not None:
+                        attempts += 1
+                        attempted_profiles.add(outcome.hedge.key())
+                        if outcome.hedge.auth_strategy.attempted_auth:
+                            auth_state.mark_attempted(outcome.hedge.auth_strategy)
+                    profile = outcome.profile
+                    if outcome.error is not None:
+                        raise outcome.error
+                else:
+                    self._run_profile(url, profile)
             except DownloadCancelledError:
                 return self._failure_result(
                     job,
@@ -462,6 +879,10 @@ class DownloadEngine:
                     )
                 analysis = self._analyse_error(error, profile)
                 last_analysis = analysis
+                self._observe_throttling(analysis)
+                self._record_outcome(outcome_class, profile, analysis)
+                if has_age_restriction_signal(error.diagnostic_text()):
+                    self._outcomes.mark_age_restricted(extract_video_id(url))
                 if self._has_po_enforcement_signal(
                     error.diagnostic_text()
                 ) or analysis.category in {
@@ -470,9 +891,10 @@ class DownloadEngine:
                     FailureCategory.VERIFIED_SESSION_MEDIA_403,
                 }:
                     po_enforcement_seen = True
-                if self._is_proven_media_403(error):
+                known_formats = self._known_formats(url, profile, error)
+                if self._is_proven_media_403(error, known_formats):
                     proven_media_selector = (
-                        self._media_selector_from_formats(error.formats)
+                        self._media_selector_from_formats(known_formats)
                         or proven_media_selector
                         or profile.format_selector
                     )
@@ -481,6 +903,13 @@ class DownloadEngine:
                     f"{analysis.user_message}"
                 )
 
+                if profile.reason.startswith("learned_"):
+                    # A learned first attempt is never repeated; the regular plan takes over.
+                    # Only the PO provider route is learned, so no cookie retry is spent here.
+                    po_provider_retry_used = True
+                    self._log("Learned first attempt failed; continuing with the regular plan.")
+                    continue
+
                 if analysis.category in {
                     FailureCategory.NETWORK_INACTIVITY_TIMEOUT,
                     FailureCategory.TOTAL_ATTEMPT_TIMEOUT,
@@ -676,6 +1105,9 @@ class DownloadEngine:
 
                 break
             else:
+                self._record_outcome(outcome_class, profile, None)
+                self._negative_results.discard(video_id)
+                self._archive_completed_media()
                 message = "Download completed"
                 if self._files_seen:
                     message = f"Download completed: {self._files_seen[-1].name}"
@@ -685,8 +1117,281 @@ class DownloadEngine:
             f"Retry plan exhausted after {attempts} download attempt(s) and "
             f"{discovery_attempts} format discovery attempt(s)."
         )
+        if self._negative_results.put(video_id, last_analysis.category, last_analysis.user_message):
+            self._log(f"Remembering {video_id} as {last_analysis.category.value}.")
         return self._failure_result(job, last_analysis.category, last_analysis.user_message)
 
+    def _expand_playlist(
+        self,
+        prepared_url: str,
+        auth_strategy: AuthStrategy,
+        *,
+        known_entries: Collection[str] = (),
+        fallback: bool = True,
+    ) -> YtdlpRunResult | None:
+        """List playlist entries without downloading; ``None`` if there are none to run.
+
+        With ``fallback`` the caller then downloads the playlist in one worker;
+        a listing error is kept in ``_expansion_error`` either way.  With
+        ``known_entries`` the listing of a newest-first playlist stops once it
+        reaches entries that were already downloaded.
+        """
+        self._expansion_error = None
+        if self.cancel_requested:
+            return None
+        self._emit_activity_status("Listing playlist entries")
+        try:
+            result = self._run_yt_dlp(
+                prepared_url,
+                self.build_ydl_options(prepared_url, auth_strategy),
+                expand_playlist=True,
+                known_entries=known_entries,
+            )
+        except DownloadCancelledError:
+            return None
+        except YtdlpRunError as error:
+            self._log(error.full_text())
+            self._expansion_error = error
+            if fallback:
+                self._log("Playlist expansion failed; downloading the playlist in a single worker.")
+            return None
+        if not result.entries:
+            if fallback:
+                self._log("Playlist expansion found no entries; downloading in a single worker.")
+            return None
+        return result
+
+    def _sync_listing_failure(
+        self,
+        job: DownloadJob,
+        public_strategy: AuthStrategy,
+    ) -> DownloadResult:
+        """Fail a sync whose entries could not be listed.
+
+        A whole-playlist download in one worker would skip none of the known
+        entries and record none of the new ones, so sync never falls back to it.
+        """
+        if self.cancel_requested:
+            return self._failure_result(
+                job,
+                FailureCategory.DOWNLOAD_CANCELLED,
+                "Download cancelled",
+            )
+        error = self._expansion_error
+        if error is None:
+            category = FailureCategory.UNKNOWN
+            message = "Playlist sync found no videos to download in this playlist."
+        else:
+            profile = self._profile(public_strategy, reason="public_primary")
+            analysis = self._analyse_error(error, profile)
+            category = analysis.category
+            message = f"Playlist sync could not list the playlist: {analysis.user_message}"
+        self._log(message)
+        return self._failure_result(job, category, message)
+
+    def _sync_playlist_entries(
+        self,
+        job: DownloadJob,
+        expansion: YtdlpRunResult,
+        sync_key: str,
+        known: frozenset[str],
+    ) -> DownloadResult:
+        title = expansion.playlist_title or str(expansion.metadata.get("id") or "Playlist")
+        new_entries = [
+            entry
+            for entry in expansion.entries
+            if not entry.video_id or entry.video_id not in known
+        ]
+        if not new_entries:
+            self._log(f"Playlist sync: no new entries since the last sync ({len(known)} known).")
+            self._playlist_sync.record(sync_key, title, ())
+            self._last_percent = 100
+            return DownloadResult(job.job_id, True, "Playlist up to date: no new entries")
+        self._log(
+            f"Playlist sync: {len(new_entries)} new of {len(expansion.entries)} listed "
+            f"entries ({len(known)} known)."
+        )
+        result = self._download_playlist_entries(job, replace(expansion, entries=new_entries))
+        # Failed entries stay unknown so the next sync retries them.
+        self._playlist_sync.record(
+            sync_key,
+            title,
+            [
+                entry.video_id
+                for entry, entry_result in zip(new_entries, result.entries, strict=True)
+                if entry_result.success
+            ],
+        )
+        return result
+
+    def _download_playlist_entries(
+        self,
+        job: DownloadJob,
+        expansion: YtdlpRunResult,
+    ) -> DownloadResult:
+        entries = expansion.entries
+        parallelism = max(1, min(PLAYLIST_ENTRY_PARALLELISM, MAX_PARALLEL_DOWNLOADS, len(entries)))
+        title = expansion.playlist_title or str(expansion.metadata.get("id") or "Playlist")
+        self._log(
+            f"Playlist expanded to {len(entries)} entries; "
+            f"downloading up to {parallelism} at a time."
+        )
+        entry_options = replace(self.options, playlist_mode=PlaylistMode.SINGLE)
+        progress = _PlaylistProgress(job.job_id, len(entries), self.progress_callback)
+
+        pending = deque(enumerate(entries))
+        pending_lock = threading.Lock()
+        results: list[DownloadResult | None] = [None] * len(entries)
+        slots = get_download_slots()
+
+        def run_entry(entry: PlaylistEntry) -> DownloadResult:
+            entry_job = DownloadJob(
+                entry.url,
+                job_id=f"{job.job_id}-{entry.index}",
+                playlist_title=title,
+                playlist_index=entry.index,
+                recheck_unavailable=job.recheck_unavailable,
+            )
+            options = entry_options
+            if self.options.bandwidth_limit:
+                # Read per entry: the scheduler raises this job's share as its batch drains.
+                options = replace(
+                    entry_options,
+                    bandwidth_limit=max(1, int(self.options.bandwidth_limit) // parallelism),
+                )
+            try:
+                return self._download_playlist_entry(entry_job, entry, options, progress)
+            finally:
+                progress.finish(entry)
+
+        def run_lane(shares_slots: bool) -> None:
+            # The first lane runs in the slot this job already holds; every other lane
+            # takes a slot from the process-wide budget per entry, so the total number
+            # of downloads stays bounded however many playlist jobs run at once.
+            while True:
+                if shares_slots and not slots.acquire_while(
+                    lambda: bool(pending) and not self.cancel_requested
+                ):
+                    return
+                try:
+                    with pending_lock:
+                        if not pending:
+                            return
+                        position, entry = pending.popleft()
+                    results[position] = run_entry(entry)
+                finally:
+                    if shares_slots:
+                        slots.release()
+
+        with ThreadPoolExecutor(
+            max_workers=parallelism,
+            thread_name_prefix="neural-extractor-playlist",
+        ) as executor:
+            lanes = [executor.submit(run_lane, lane > 0) for lane in range(parallelism)]
+            for lane in lanes:
+                lane.result()
+        self._last_percent = progress.percent()
+        return self._playlist_result(
+            job, entries, [result for result in results if result is not None]
+        )
+
+    def _download_playlist_entry(
+        self,
+        job: DownloadJob,
+        entry: PlaylistEntry,
+        options: DownloadOptions,
+        progress: _PlaylistProgress,
+    ) -> DownloadResult:
+        if self.cancel_requested:
+            return DownloadResult(
+                job.job_id,
+                False,
+                "Download cancelled",
+                failure_category=FailureCategory.DOWNLOAD_CANCELLED.value,
+            )
+        prefix = f"[playlist {entry.index}/{progress.total}] "
+        archived = self._archived_download(entry.video_id, options)
+        if archived is not None:
+            self._log(prefix + f"Already downloaded: {archived.output_path.name}")
+            return DownloadResult(
+                job.job_id,
+                True,
+                f"Already downloaded: {archived.output_path.name}",
+                [archived.output_path],
+            )
+        engine = DownloadEngine(
+            options,
+            progress_callback=progress.entry_callback(entry),
+            log_callback=(lambda message: self._log(prefix + message)),
+            process_limits=self._process_limits,
+            process_record_label=self._process_record_label,
+        )
+        with self._child_engines_lock:
+            self._child_engines.add(engine)
+        try:
+            # A cancel issued while the entry engine was being built must still reach it.
+            if self.cancel_requested:
+                engine.cancel()
+            return engine.download(job)
+        except Exception:
+            self._log(prefix + "Playlist entry exception:\n" + traceback.format_exc())
+            return DownloadResult(
+                job.job_id,
+                False,
+                "Download failed unexpectedly. See the Activity Log for details.",
+                failure_category=FailureCategory.UNKNOWN.value,
+            )
+        finally:
+            with self._child_engines_lock:
+                self._child_engines.discard(engine)
+
+    def _playlist_result(
+        self,
+        job: DownloadJob,
+        entries: list[PlaylistEntry],
+        results: list[DownloadResult],
+    ) -> DownloadResult:
+        files = [path for result in results for path in result.files]
+        self._files_seen = files
+        if self.cancel_requested:
+            return DownloadResult(
+                job.job_id,
+                False,
+                "Download cancelled",
+                files,
+                FailureCategory.DOWNLOAD_CANCELLED.value,
+                entries=results,
+            )
+        failed = [
+            (entry, result)
+            for entry, result in zip(entries, results, strict=True)
+            if not result.success
+        ]
+        if not failed:
+            return DownloadResult(
+                job.job_id,
+                True,
+                f"Playlist completed: {len(results)} entries downloaded",
+                files,
+                entries=results,
+            )
+        for entry, result in failed:
+            self._log(
+                f"Playlist entry {entry.index}/{len(entries)} failed as "
+                f"{result.failure_category}: {result.message}"
+            )
+        categories = Counter(result.failure_category for _, result in failed)
+        summary = ", ".join(f"{category} x{count}" for category, count in categories.most_common())
+        return DownloadResult(
+            job.job_id,
+            False,
+            f"Playlist finished with {len(failed)} of {len(results)} entries failed ({summary}). "
+            "See the Activity Log for each entry.",
+            files,
+            categories.most_common(1)[0][0],
+            entries=results,
+        )
+
     def prepare_url(self, url: str) -> str:
         normalized_url = normalize_user_url(url)
         if is_youtube_mix_url(normalized_url):
@@ -726,11 +1431,17 @@ class DownloadEngine:
 
         if self.options.media_mode == MediaMode.VIDEO:
             opts["merge_output_format"] = "mp4"
+        if self.options.bandwidth_limit:
+            opts["ratelimit"] = int(self.options.bandwidth_limit)
+        if self.options.acceleration is DownloadAcceleration.ADAPTIVE:
+            self._acceleration_settings = self._acceleration.settings()
+            opts.update(self._acceleration_settings.ydl_options())
         js_runtimes = self.js_runtime_status.ytdlp_options()
         if js_runtimes:
             opts["js_runtimes"] = js_runtimes
-        if YOUTUBE_REMOTE_COMPONENTS:
-            opts["remote_components"] = list(YOUTUBE_REMOTE_COMPONENTS)
+        remote_components = self._remote_components()
+        if remote_components:
+            opts["remote_components"] = remote_components
         local_bin = bin_dir()
         if local_bin.exists():
             opts["ffmpeg_location"] = str(local_bin)
@@ -803,7 +1514,7 @@ class DownloadEngine:
             format_selector=format_selector or self._format_selector(),
             player_clients=player_clients,
             node_runtime_available=self.js_runtime_status.found,
-            remote_ejs_enabled="ejs:github" in YOUTUBE_REMOTE_COMPONENTS,
+            remote_ejs_enabled=YOUTUBE_EJS_REMOTE_COMPONENT in self._remote_components(),
             reason=reason,
             po_token_provider=po_token_provider,
         )
@@ -814,6 +1525,226 @@ class DownloadEngine:
         self._log(f"Download attempt profile: {self._attempt_profile_summary(profile)}")
         return self._run_yt_dlp(prepared_url, ydl_opts)
 
+    def _rescue_routes(self, verified_strategy: AuthStrategy | None) -> list[str]:
+        """Return the rescue routes usable in this job, most likely first."""
+        routes = []
+        if verified_strategy is not None:
+            routes.append(ROUTE_VERIFIED_SESSION)
+        status = self.po_token_provider_status
+        if status.available and status.integrity_verified:
+            routes.append(ROUTE_PO_PROVIDER)
+        return routes
+
+    def _rescue_profile(
+        self,
+        route: str,
+        public_strategy: AuthStrategy,
+        verified_strategy: AuthStrategy | None,
+        *,
+        reason: str,
+    ) -> DownloadAttemptProfile:
+        if route == ROUTE_VERIFIED_SESSION and verified_strategy is not None:
+            return self._profile(verified_strategy, reason=reason)
+        return self._profile(
+            public_strategy,
+            player_clients=("mweb",),
+            reason=reason,
+            po_token_provider=True,
+        )
+
+    def _hedge_profile(
+        self,
+        public_strategy: AuthStrategy,
+        verified_strategy: AuthStrategy | None,
+        *,
+        after_failure_signal: bool,
+    ) -> DownloadAttemptProfile | None:
+        """Return the most likely rescue profile to race against the public attempt.
+
+        Cookies are never sent before a public attempt has failed in this job.
+        A leading failure signal from the public attempt counts as that failure;
+        a public attempt that is merely slow may still succeed, so a hedge
+        started by the delay alone never uses the verified session.
+        """
+        routes = self._rescue_routes(verified_strategy)
+        if not after_failure_signal:
+            routes = [route for route in routes if route != ROUTE_VERIFIED_SESSION]
+        if not routes:
+            return None
+        return self._rescue_profile(
+            routes[0], public_strategy, verified_strategy, reason=f"hedged_{routes[0]}"
+        )
+
+    def _learned_profile(
+        self,
+        outcome_class: str,
+        public_strategy: AuthStrategy,
+        verified_strategy: AuthStrategy | None,
+    ) -> DownloadAttemptProfile | None:
+        """Return a rescue profile to run first when past outcomes clearly favour it.
+
+        Cookies are never sent before a public attempt has failed in this job, so
+        the verified session is not a route that outcomes can promote.
+        """
+        routes = [
+            route
+            for route in self._rescue_routes(verified_strategy)
+            if route != ROUTE_VERIFIED_SESSION
+        ]
+        route = self._outcomes.preferred_route(outcome_class, routes) if routes else None
+        if route is None:
+            return None
+        return self._rescue_profile(
+            route, public_strategy, verified_strategy, reason=f"learned_{route}"
+        )
+
+    def _record_outcome(
+        self,
+        outcome_class: str,
+        profile: DownloadAttemptProfile,
+        analysis: FailureAnalysis | None,
+    ) -> None:
+        """Record a success (``analysis`` is ``None``) or a route-specific failure."""
+        if analysis is not None and analysis.category in ROUTE_NEUTRAL_CATEGORIES:
+            return
+        self._outcomes.record(
+            outcome_class,
+            _profile_route(profile),
+            success=analysis is None,
+            detail={
+                "reason": profile.reason,
+                "provider": profile.auth_strategy.provider_id,
+                "player_clients": list(profile.player_clients),
+            },
+        )
+
+    def _archived_download(
+        self,
+        video_id: str | None,
+        options: DownloadOptions,
+    ) -> ArchivedDownload | None:
+        if options.overwrite:
+            return None
+        return self._archive.lookup(video_id, archive_variant(options), options.output_dir)
+
+    def _archive_completed_media(self) -> None:
+        variant = archive_variant(self.options)
+        for video_id, path in self._completed_media:
+            self._archive.record(video_id, variant, path)
+
+    def _race_engine(self, race: _HedgedRace, racer: str) -> DownloadEngine:
+        prefix = f"[{racer} attempt] "
+        engine = DownloadEngine(
+            self.options,
+            progress_callback=race.progress(racer, self.progress_callback),
+            log_callback=(lambda message: self._log(prefix + message)),
+            process_limits=self._process_limits,
+            process_record_label=self._process_record_label,
+        )
+        engine._active_job_id = self._active_job_id
+        engine._active_job = self._active_job
+        engine._attempt_observer = race.observer(racer)
+        engine._download_claim = (race.claim_path, racer)
+        return engine
+
+    def _run_hedged(
+        self,
+        prepared_url: str,
+        primary: DownloadAttemptProfile,
+        signal_hedge: DownloadAttemptProfile | None,
+        delay_hedge: DownloadAttemptProfile | None,
+    ) -> _HedgeOutcome:
+        """Run ``primary`` and race ``signal_hedge`` on a leading failure signal or
+        ``delay_hedge`` after a delay without one.
+
+        Each racer runs in its own child engine so the loser can be cancelled
+        through its own supervisor without cancelling this job.
+        """
+        claim_directory = self._create_attempt_temp()
+        race = _HedgedRace(claim_directory / "download.claim")
+        profiles = {HEDGE_PRIMARY: primary}
+
+        def run(racer: str) -> DownloadEngine:
+            engine = self._race_engine(race, racer)
+            with self._child_engines_lock:
+                self._child_engines.add(engine)
+            try:
+                if self.cancel_requested or not race.register(racer, engine):
+                    raise DownloadCancelledError
+                engine._run_profile(prepared_url, profiles[racer])
+                race.claim(racer)
+                return engine
+            except YtdlpRunError:
+                if race.winner and race.winner != racer:
+                    raise DownloadCancelledError from None
+                raise
+            finally:
+                with self._child_engines_lock:
+                    self._child_engines.discard(engine)
+                if racer == HEDGE_PRIMARY:
+                    race.primary_finished.set()
+                    race.wake.set()
+
+        futures: dict[str, Future[DownloadEngine]] = {}
+        try:
+            with ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="neural-extractor-hedge"
+            ) as executor:
+                futures[HEDGE_PRIMARY] = executor.submit(run, HEDGE_PRIMARY)
+                race.wake.wait(HEDGED_ATTEMPT_DELAY_SECONDS)
+                hedge = signal_hedge if race.signal else delay_hedge
+                if (
+                    hedge is not None
+                    and not race.winner
+                    and not race.primary_finished.is_set()
+                    and not self.cancel_requested
+                ):
+                    trigger = (
+                        f"leading {race.signal} signal"
+                        if race.signal
+                        else f"{HEDGED_ATTEMPT_DELAY_SECONDS:g} seconds without a download"
+                    )
+                    self._log(f"Starting hedged {hedge.reason} attempt after {trigger}.")
+                    self._emit_activity_status("Starting hedged attempt")
+                    profiles[HEDGE_SECONDARY] = hedge
+                    futures[HEDGE_SECONDARY] = executor.submit(run, HEDGE_SECONDARY)
+                wait(futures.values())
+        finally:
+            self._cleanup_attempt_temp(claim_directory)
+
+        started_hedge = profiles.get(HEDGE_SECONDARY)
+        if race.winner and futures[race.winner].exception() is None:
+            engine = futures[race.winner].result()
+            self._files_seen.extend(engine._files_seen)
+            self._completed_media.extend(engine._completed_media)
+            self._last_percent = engine._last_percent
+            if started_hedge is not None:
+                self._log(
+                    f"Hedged race won by {profiles[race.winner].reason}; "
+                    "the other attempt was cancelled."
+                )
+            return _HedgeOutcome(profiles[race.winner], None, started_hedge)
+
+        order = [race.winner] if race.winner else []
+        order += [racer for racer in (HEDGE_SECONDARY, HEDGE_PRIMARY) if racer not in order]
+        failures = [(racer, futures[racer].exception()) for racer in order if racer in futures]
+        for _, failure in failures:
+            if failure is not None and not isinstance(
+                failure, YtdlpRunError | DownloadCancelledError
+            ):
+                raise failure
+        reported = next(
+            (item for item in failures if isinstance(item[1], YtdlpRunError)),
+            None,
+        )
+        if reported is None:
+            raise DownloadCancelledError
+        racer, error = reported
+        for other, failure in failures:
+            if other != racer and isinstance(failure, YtdlpRunError):
+                self._log(f"[{other} attempt] " + failure.full_text())
+        return _HedgeOutcome(profiles[racer], error, started_hedge)
+
     def _options_for_attempt_profile(
         self,
         prepared_url: str,
@@ -882,19 +1813,32 @@ class DownloadEngine:
             player_clients=player_clients,
             reason=f"{reason}_discovery",
         )
-        probe_opts = self._options_for_attempt_profile(prepared_url, probe_profile)
-        try:
-            result = self._run_yt_dlp(prepared_url, probe_opts, discover_only=True)
-        except DownloadCancelledError:
-            raise
-        except YtdlpRunError as error:
-            self._log(error.full_text())
-            analysis = self._analyse_error(error, probe_profile)
-            self._last_discovery_failure = analysis
+        cache_key = self._discovery_key(prepared_url, auth_strategy, player_clients)
+        cached = self._observed_formats.get((auth_strategy.provider_id, player_clients))
+        if cached is not None:
             self._log(
-                f"Format discovery failed as {analysis.category.value}: {analysis.user_message}"
+                f"Reusing {len(cached.formats)} format(s) reported by the failed attempt; "
+                "no discovery worker needed."
             )
-            return None
+            result = YtdlpRunResult(formats=cached.formats, metadata=cached.metadata)
+        elif (cached := self._discovery_cache.get(cache_key)) is not None:
+            self._log(f"Reusing cached format discovery with {len(cached.formats)} format(s).")
+            result = YtdlpRunResult(formats=cached.formats, metadata=cached.metadata)
+        else:
+            probe_opts = self._options_for_attempt_profile(prepared_url, probe_profile)
+            try:
+                result = self._run_yt_dlp(prepared_url, probe_opts, discover_only=True)
+            except DownloadCancelledError:
+                raise
+            except YtdlpRunError as error:
+                self._log(error.full_text())
+                analysis = self._analyse_error(error, probe_profile)
+                self._last_discovery_failure = analysis
+                self._log(
+                    f"Format discovery failed as {analysis.category.value}: {analysis.user_message}"
+                )
+                return None
+            self._discovery_cache.put(cache_key, result.formats, result.metadata)
 
         selection = select_discovered_format(
             result.formats,
@@ -928,8 +1872,12 @@ class DownloadEngine:
         ydl_opts: dict[str, Any],
         *,
         discover_only: bool = False,
+        expand_playlist: bool = False,
+        known_entries: Collection[str] = (),
     ) -> YtdlpRunResult:
         playlist = should_download_playlist(prepared_url, self.options.playlist_mode.value)
+        if expand_playlist:
+            ydl_opts = {**ydl_opts, "extract_flat": "in_playlist"}
         command = self._yt_dlp_command(prepared_url, ydl_opts)
         self._log(f"yt-dlp command:\n{command}")
 
@@ -938,20 +1886,32 @@ class DownloadEngine:
             "url": prepared_url,
             "options": request_opts,
             "playlist": playlist,
-            "mode": "discover" if discover_only else "download",
+            "mode": "expand" if expand_playlist else "discover" if discover_only else "download",
             "activity_label": self._download_activity_label(),
+            "progress_frames_per_second": WORKER_PROGRESS_FRAMES_PER_SECOND,
         }
+        if self._download_claim is not None and request["mode"] == "download":
+            request["download_claim"] = str(self._download_claim[0])
+            request["download_claim_owner"] = self._download_claim[1]
+        if expand_playlist and known_entries:
+            request["known_entries"] = sorted(known_entries)
+            request["known_streak"] = KNOWN_ENTRY_STREAK
         output = YtdlpCapturedOutput()
         formats: list[dict[str, Any]] = []
         metadata: dict[str, Any] = {}
-        phase = "discovery" if discover_only else "preflight"
+        playlist_title = ""
+        entries: list[PlaylistEntry] = []
+        phase = "discovery" if discover_only or expand_playlist else "preflight"
         worker_error = ""
         protocol_error = ""
-        buffers = {"stdout": "", "stderr": ""}
+        framers = {
+            "stdout": LineFramer(WORKER_MAX_FRAME_CHARS),
+            "stderr": LineFramer(WORKER_MAX_FRAME_CHARS),
+        }
         parser_lock = threading.Lock()
 
         def handle_event_line(line: str, fallback_stream: str) -> None:
-            nonlocal phase, worker_error, protocol_error, formats, metadata
+            nonlocal phase, worker_error, protocol_error, formats, metadata, playlist_title, entries
             if not line:
                 return
             if not line.startswith(PROTOCOL_PREFIX):
@@ -975,16 +1935,22 @@ class DownloadEngine:
                 message = self._redact_diagnostic_text(str(event.get("message") or ""))
                 stream = str(event.get("stream") or fallback_stream)
                 (output.stderr if stream == "stderr" else output.stdout).append(message)
+                if self._attempt_observer and stream == "stderr":
+                    self._attempt_observer("log", message)
                 lowered = message.lower()
                 if "retry" in lowered and any(
                     token in lowered for token in ("network", "fragment", "http error", "unable")
                 ):
                     self._emit_activity_status("Waiting for YouTube retry")
+                if "http error" in lowered:
+                    self._observe_throttling(classify_youtube_failure(message))
             elif kind == "phase":
                 phase = str(event.get("phase") or phase)
                 message = str(event.get("message") or "")
                 if message:
                     self._emit_activity_status(message)
+                if self._attempt_observer:
+                    self._attempt_observer("phase", phase)
             elif kind == "progress":
                 data = event.get("data")
                 if isinstance(data, dict):
@@ -998,6 +1964,27 @@ class DownloadEngine:
                     for key in ("id", "title", "availability", "live_status")
                     if event.get(key) is not None
                 }
+            elif kind == "completed":
+                video = str(event.get("id") or "")
+                filepath = str(event.get("filepath") or "")
+                if video and filepath:
+                    path = Path(filepath)
+                    self._completed_media.append((video, path))
+                    if path not in self._files_seen:
+                        self._files_seen.append(path)
+            elif kind == "playlist":
+                playlist_title = str(event.get("title") or "")
+                metadata = {"id": str(event.get("id") or ""), "title": playlist_title}
+                entries = [
+                    PlaylistEntry(
+                        index=int(item.get("index") or position),
+                        url=str(item.get("url") or ""),
+                        video_id=str(item.get("id") or ""),
+                        title=str(item.get("title") or ""),
+                    )
+                    for position, item in enumerate(event.get("entries") or (), start=1)
+                    if isinstance(item, dict) and item.get("url")
+                ]
             elif kind == "error":
                 phase = str(event.get("phase") or phase)
                 worker_error = self._redact_diagnostic_text(str(event.get("message") or ""))
@@ -1009,18 +1996,29 @@ class DownloadEngine:
 
         def feed(stream: str, chunk: str) -> None:
             with parser_lock:
-                buffers[stream] += chunk
-                while "\n" in buffers[stream]:
-                    line, buffers[stream] = buffers[stream].split("\n", 1)
-                    handle_event_line(line.rstrip("\r"), stream)
+                for line in framers[stream].feed(chunk):
+                    handle_event_line(line, stream)
 
         def flush_buffers() -> None:
             with parser_lock:
-                for stream, remaining in tuple(buffers.items()):
+                for stream, framer in framers.items():
+                    remaining = framer.flush()
                     if remaining:
-                        handle_event_line(remaining.rstrip("\r"), stream)
-                        buffers[stream] = ""
+                        handle_event_line(remaining, stream)
+                    if framer.overflowed_frames:
+                        output.stderr.append(
+                            f"Dropped {framer.overflowed_frames} {stream} line(s) longer than "
+                            f"{WORKER_MAX_FRAME_CHARS} characters "
+                            f"({framer.overflowed_chars} characters in total)."
+                        )
 
+        report = self._ytdlp_cache().maintain()
+        if report and (report.removed_invalid or report.removed_evicted or report.removed_expired):
+            self._log(
+                f"yt-dlp cache maintenance: kept {report.kept} entries ({report.kept_bytes} bytes); "
+                f"removed {report.removed_invalid} invalid, {report.removed_expired} expired, "
+                f"{report.removed_evicted} evicted."
+            )
         attempt_temp = self._create_attempt_temp()
         try:
             try:
@@ -1110,6 +2108,8 @@ class DownloadEngine:
             formats=formats,
             metadata=metadata,
             diagnostic=output.diagnostic_text(),
+            playlist_title=playlist_title,
+            entries=entries,
         )
 
     def _recent_verified_strategy(
@@ -1190,11 +2190,49 @@ class DownloadEngine:
         )
         return selection.selector or ""
 
-    def _is_proven_media_403(self, error: YtdlpRunError) -> bool:
+    def _discovery_key(
+        self,
+        prepared_url: str,
+        auth_strategy: AuthStrategy,
+        player_clients: tuple[str, ...],
+    ) -> DiscoveryKey | None:
+        if should_download_playlist(prepared_url, self.options.playlist_mode.value):
+            return None
+        return discovery_cache_key(prepared_url, auth_strategy.provider_id, player_clients)
+
+    def _known_formats(
+        self,
+        prepared_url: str,
+        profile: DownloadAttemptProfile,
+        error: YtdlpRunError,
+    ) -> list[dict[str, Any]]:
+        """Return the formats a failed attempt saw, falling back to a recent discovery."""
+        key = self._discovery_key(prepared_url, profile.auth_strategy, profile.player_clients)
+        observed_key = (profile.auth_strategy.provider_id, profile.player_clients)
+        if error.formats:
+            # PO-token attempts can expose formats the plain client does not.
+            if not profile.po_token_provider:
+                self._discovery_cache.put(key, error.formats, error.metadata)
+                self._observed_formats[observed_key] = CachedDiscovery(
+                    list(error.formats), dict(error.metadata)
+                )
+            return error.formats
+        if profile.po_token_provider:
+            return []
+        cached = self._observed_formats.get(observed_key) or self._discovery_cache.get(key)
+        return cached.formats if cached is not None else []
+
+    def _is_proven_media_403(
+        self,
+        error: YtdlpRunError,
+        formats: list[dict[str, Any]] | None = None,
+    ) -> bool:
         return (
             error.phase == "download"
             and self._raw_http_403(error.diagnostic_text())
-            and bool(self._media_selector_from_formats(error.formats))
+            and bool(
+                self._media_selector_from_formats(error.formats if formats is None else formats)
+            )
         )
 
     @staticmethod
@@ -1341,8 +2379,14 @@ class DownloadEngine:
 
     def _worker_command(self) -> list[str]:
         if getattr(sys, "frozen", False):
-            return [sys.executable, "--internal-ytdlp-worker"]
-        return [sys.executable, "-m", "neural_extractor_v3.core.ytdlp_worker"]
+            command = [sys.executable, "--internal-ytdlp-worker"]
+            if self._pooled_workers:
+                command.append("--internal-ytdlp-worker-serve")
+            return command
+        command = [sys.executable, "-m", "neural_extractor_v3.core.ytdlp_worker"]
+        if self._pooled_workers:
+            command.append("--serve")
+        return command
 
     def _worker_environment(self, attempt_temp: Path | None = None) -> dict[str, str]:
         environment = os.environ.copy()
@@ -1358,12 +2402,19 @@ class DownloadEngine:
         environment["FORCE_COLOR"] = "false"
         environment.pop("NODE_OPTIONS", None)
         environment.pop("NODE_PATH", None)
+        # Player JS and solved challenges outlive the attempt in the shared cache.
+        environment["XDG_CACHE_HOME"] = str(self._ytdlp_cache().root)
         if attempt_temp is not None:
             environment["TEMP"] = str(attempt_temp)
             environment["TMP"] = str(attempt_temp)
-            environment["XDG_CACHE_HOME"] = str(attempt_temp / "cache")
         return environment
 
+    def _ytdlp_cache(self) -> SharedYtdlpCache:
+        return get_ytdlp_cache(app_data_dir() / YTDLP_CACHE_DIRECTORY)
+
+    def _remote_components(self) -> list[str]:
+        return ytdlp_remote_components(self._ytdlp_cache().ytdlp_dir)
+
     def _create_attempt_temp(self) -> Path:
         root = app_data_dir() / "worker-temp"
         directory = root / f"owner-{os.getpid()}-{uuid4().hex}"
@@ -1481,7 +2532,11 @@ class DownloadEngine:
         add_option("-f", ydl_opts.get("format"))
         add_option("-o", ydl_opts.get("outtmpl"))
         add_option("--merge-output-format", ydl_opts.get("merge_output_format"))
+        add_option("--concurrent-fragments", ydl_opts.get("concurrent_fragment_downloads"))
+        add_option("--http-chunk-size", ydl_opts.get("http_chunk_size"))
         args.append("--no-playlist" if ydl_opts.get("noplaylist") else "--yes-playlist")
+        if ydl_opts.get("extract_flat"):
+            args.append("--flat-playlist")
         if ydl_opts.get("ignoreerrors"):
             args.append("--ignore-errors")
         if ydl_opts.get("noprogress"):
@@ -1576,6 +2631,15 @@ class DownloadEngine:
         return self._redact_diagnostic_text(subprocess.list2cmdline(args))
 
     def _output_template(self, playlist: bool) -> str:
+        entry = self._active_job
+        if not playlist and entry is not None and entry.playlist_index:
+            # Playlist entries download as single videos, so the playlist fields
+            # yt-dlp would fill in are written into the template literally.
+            return str(
+                self.options.output_dir
+                / _literal_path_component(entry.playlist_title, self.options.restrict_filenames)
+                / f"{entry.playlist_index:03d} - %(title).180B [%(id)s].%(ext)s"
+            )
         if playlist:
             return str(
                 self.options.output_dir
@@ -1643,6 +2707,11 @@ class DownloadEngine:
         downloaded = data.get("downloaded_bytes") or 0
         percent = int(downloaded / total * 100) if total else (100 if status == "finished" else 0)
         self._last_percent = max(0, min(100, percent))
+        speed = data.get("speed")
+        if status == "downloading" and self._acceleration_settings and speed:
+            self._acceleration.record_throughput(
+                self._acceleration_settings.concurrent_fragments, float(speed)
+            )
         event = ProgressEvent(
             job_id=self._active_job_id,
             status=status,
@@ -1657,6 +2726,18 @@ class DownloadEngine:
         if self.progress_callback:
             self.progress_callback(event)
 
+    def _observe_throttling(self, analysis: FailureAnalysis) -> None:
+        if self.options.acceleration is not DownloadAcceleration.ADAPTIVE:
+            return
+        if not is_throttling_signal(analysis):
+            return
+        reduced = self._acceleration.back_off()
+        if reduced:
+            self._log(
+                f"Download acceleration backed off after {analysis.category.value}: "
+                f"at most {reduced.concurrent_fragments} concurrent fragment(s)."
+            )
+
     def _emit_activity_status(self, status: str) -> None:
         if not status or status == self._last_activity_status:
             return
@@ -1686,27 +2767,25 @@ class DownloadEngine:
 
     def _redact_diagnostic_text(self, value: str) -> str:
         text = redact_po_token_material(str(value or ""))
-        if self.options.cookie_file:
-            text = text.replace(str(self.options.cookie_file), "<cookies.txt>")
-        if self.options.dedicated_firefox_profile:
-            text = text.replace(
-                str(self.options.dedicated_firefox_profile),
-                "<dedicated-firefox-profile>",
+        for path, placeholder in self._diagnostic_path_replacements():
+            if path in text:
+                text = text.replace(path, placeholder)
+        text = _CREDENTIAL_ASSIGNMENT_PATTERN.sub(r"\1=<redacted>", text)
+        return redact_po_token_material(text)
+
+    def _diagnostic_path_replacements(self) -> tuple[tuple[str, str], ...]:
+        # Built once per engine: every received worker line is redacted.
+        if self._path_replacements is None:
+            candidates = (
+                (self.options.cookie_file, "<cookies.txt>"),
+                (self.options.dedicated_firefox_profile, "<dedicated-firefox-profile>"),
+                (self.options.dedicated_browser_profile, "<dedicated-browser-profile>"),
+                (Path.home(), "<user-profile>"),
             )
-        if self.options.dedicated_browser_profile:
-            text = text.replace(
-                str(self.options.dedicated_browser_profile),
-                "<dedicated-browser-profile>",
+            self._path_replacements = tuple(
+                (str(path), placeholder) for path, placeholder in candidates if path and str(path)
             )
-        home = str(Path.home())
-        if home:
-            text = text.replace(home, "<user-profile>")
-        text = re.sub(
-            r"(?i)\b(cookie|authorization)\s*[:=]\s*\S+",
-            r"\1=<redacted>",
-            text,
-        )
-        return redact_po_token_material(text)
+        return self._path_replacements
 
     def _clean_error_message(self, error_text: str) -> str:
         analysis = classify_youtube_failure(
@@ -1727,7 +2806,9 @@ class DownloadEngine:
 __all__ = [
     "AUDIO_M4A_SELECTOR",
     "AUDIO_MP3_SELECTOR",
+    "CAPTURED_OUTPUT_MAX_CHARS",
     "DEFAULT_YOUTUBE_CLIENTS",
+    "CapturedLines",
     "DownloadAttemptProfile",
     "DownloadCancelledError",
     "DownloadEngine",
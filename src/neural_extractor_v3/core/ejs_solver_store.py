@@ -0,0 +1,347 @@
+"""Hash-pinned local store for yt-dlp's EJS challenge-solver scripts.
+
+With ``--remote-components ejs:github`` yt-dlp falls back to downloading the
+solver scripts from GitHub whenever its cache has no usable copy, and the
+Node runtime has no vendored ``lib`` script at all.  The store keeps one
+verified copy of each script under the application data folder.  Scripts are
+admitted only when their SHA3-512 matches the pin in the installed yt-dlp;
+they come from a build-shipped ``ejs`` folder or from a copy yt-dlp already
+fetched into the shared cache.  The manifest records a SHA-256 per script
+that is checked on every load; a file whose stat identity is unchanged since
+its last successful check is not rehashed.  Before each attempt the verified
+scripts are written into the shared yt-dlp cache, so workers load them from
+disk and ``ejs:github`` is only requested while the store is incomplete.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from neural_extractor_v3.config import (
+    YOUTUBE_EJS_REMOTE_COMPONENT,
+    YOUTUBE_REMOTE_COMPONENTS,
+    app_data_dir,
+    base_dir,
+)
+
+EJS_STORE_DIRECTORY = "ejs-solver"
+SHIPPED_SCRIPTS_DIRECTORY = "ejs"
+CACHE_SECTION = "challenge-solver"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+SCRIPT_TYPES = ("lib", "core")
+MAX_SCRIPT_BYTES = 16 * 1024 * 1024
+
+_FileIdentity = tuple[int, int, int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class SolverPins:
+    """Script version plus ``{type: {variant: (filename, sha3_512)}}`` from yt-dlp."""
+
+    version: str
+    ytdlp_version: str
+    scripts: dict[str, dict[str, tuple[str, str]]]
+
+
+@dataclass(frozen=True, slots=True)
+class SolverStoreStatus:
+    ready: bool
+    version: str
+    detail: str
+
+
+class EjsSolverStore:
+    """Populate, verify and hand out the pinned challenge-solver scripts."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        shipped_dir: Path | None = None,
+        pins: SolverPins | None = None,
+    ) -> None:
+        self.root = Path(root)
+        self.shipped_dir = Path(shipped_dir or base_dir() / SHIPPED_SCRIPTS_DIRECTORY)
+        self._pins = pins
+        self._lock = threading.Lock()
+        self._verified: dict[Path, tuple[_FileIdentity, str]] = {}
+        self._seeded: dict[Path, _FileIdentity] = {}
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_FILENAME
+
+    def status(self) -> SolverStoreStatus:
+        """Verify the store without populating it or touching the yt-dlp cache."""
+        with self._lock:
+            pins = self._load_pins()
+            if pins is None:
+                return SolverStoreStatus(False, "", "installed yt-dlp exposes no solver pins")
+            scripts = self._verified_scripts(pins)
+            return _status(pins, scripts)
+
+    def prepare(self, ytdlp_cache_dir: Path) -> SolverStoreStatus:
+        """Complete the store if possible and seed ``ytdlp_cache_dir`` from it."""
+        with self._lock:
+            pins = self._load_pins()
+            if pins is None:
+                return SolverStoreStatus(False, "", "installed yt-dlp exposes no solver pins")
+            scripts = self._verified_scripts(pins)
+            if len(scripts) < len(SCRIPT_TYPES):
+                self._populate(pins, Path(ytdlp_cache_dir))
+                scripts = self._verified_scripts(pins)
+            status = _status(pins, scripts)
+            if status.ready:
+                for script_type, (path, variant) in scripts.items():
+                    self._seed(pins, Path(ytdlp_cache_dir), script_type, path, variant)
+            return status
+
+    def _load_pins(self) -> SolverPins | None:
+        if self._pins is None:
+            self._pins = _installed_solver_pins()
+        return self._pins
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        try:
+            with self.manifest_path.open(encoding="utf-8") as stream:
+                manifest = json.load(stream)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("scripts"), dict):
+            return None
+        if manifest.get("schema_version") != MANIFEST_SCHEMA_VERSION:
+            return None
+        return manifest
+
+    def _verified_scripts(self, pins: SolverPins) -> dict[str, tuple[Path, str]]:
+        """Return ``{type: (path, variant)}`` for scripts whose SHA-256 still matches."""
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get("version") != pins.version:
+            return {}
+        verified: dict[str, tuple[Path, str]] = {}
+        for script_type in SCRIPT_TYPES:
+            entry = manifest["scripts"].get(script_type)
+            if not isinstance(entry, dict):
+                continue
+            variant = entry.get("variant")
+            expected = entry.get("sha256")
+            pinned = pins.scripts.get(script_type, {}).get(variant)
+            if pinned is None or not isinstance(expected, str):
+                continue
+            path = self.root / pinned[0]
+            if self._matches_sha256(path, expected):
+                verified[script_type] = (path, variant)
+        return verified
+
+    def _matches_sha256(self, path: Path, expected: str) -> bool:
+        try:
+            identity = _file_identity(path.stat())
+            if self._verified.get(path) == (identity, expected):
+                return True
+            actual = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            self._verified.pop(path, None)
+            return False
+        if actual != expected:
+            self._verified.pop(path, None)
+            return False
+        self._verified[path] = (identity, expected)
+        return True
+
+    def _populate(self, pins: SolverPins, ytdlp_cache_dir: Path) -> None:
+        manifest = self._read_manifest()
+        if manifest is None or manifest.get("version") != pins.version:
+            manifest = {
+                "schema_version": MANIFEST_SCHEMA_VERSION,
+                "version": pins.version,
+                "scripts": {},
+            }
+        changed = False
+        present = self._verified_scripts(pins)
+        for script_type in SCRIPT_TYPES:
+            if script_type in present:
+                continue
+            candidate = self._find_candidate(pins, ytdlp_cache_dir, script_type)
+            if candidate is None:
+                continue
+            variant, code = candidate
+            filename = pins.scripts[script_type][variant][0]
+            try:
+                _atomic_write(self.root / filename, code)
+            except OSError:
+                continue
+            manifest["scripts"][script_type] = {
+                "variant": variant,
+                "sha256": hashlib.sha256(code).hexdigest(),
+            }
+            changed = True
+        if changed:
+            with contextlib.suppress(OSError):
+                _atomic_write(
+                    self.manifest_path,
+                    json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+                )
+
+    def _find_candidate(
+        self, pins: SolverPins, ytdlp_cache_dir: Path, script_type: str
+    ) -> tuple[str, bytes] | None:
+        variants = pins.scripts.get(script_type, {})
+        for variant, (filename, _) in variants.items():
+            code = _read_limited(self.shipped_dir / filename)
+            if code is not None and _pinned(pins, script_type, variant, code):
+                return variant, code
+        record = _read_cache_record(ytdlp_cache_dir / CACHE_SECTION / f"{script_type}.json")
+        if record is not None and record.get("version") == pins.version:
+            variant, code = record.get("variant"), record.get("code")
+            if isinstance(variant, str) and isinstance(code, str):
+                encoded = code.encode("utf-8")
+                if _pinned(pins, script_type, variant, encoded):
+                    return variant, encoded
+        return None
+
+    def _seed(
+        self,
+        pins: SolverPins,
+        ytdlp_cache_dir: Path,
+        script_type: str,
+        path: Path,
+        variant: str,
+    ) -> None:
+        target = ytdlp_cache_dir / CACHE_SECTION / f"{script_type}.json"
+        with contextlib.suppress(OSError):
+            if self._seeded.get(target) == _file_identity(target.stat()):
+                return
+        try:
+            code = path.read_text(encoding="utf-8")
+            record = {
+                "yt-dlp_version": pins.ytdlp_version,
+                "data": {"version": pins.version, "variant": variant, "code": code},
+            }
+            _atomic_write(target, json.dumps(record).encode("utf-8"))
+            self._seeded[target] = _file_identity(target.stat())
+        except OSError:
+            self._seeded.pop(target, None)
+
+
+def _status(pins: SolverPins, scripts: dict[str, tuple[Path, str]]) -> SolverStoreStatus:
+    missing = [script_type for script_type in SCRIPT_TYPES if script_type not in scripts]
+    if missing:
+        return SolverStoreStatus(
+            False, pins.version, f"solver v{pins.version} missing {', '.join(missing)}"
+        )
+    variants = ", ".join(f"{name}={scripts[name][1]}" for name in SCRIPT_TYPES)
+    return SolverStoreStatus(True, pins.version, f"solver v{pins.version} verified ({variants})")
+
+
+def _installed_solver_pins() -> SolverPins | None:
+    try:
+        from yt_dlp.extractor.youtube.jsc._builtin.ejs import EJSBaseJCP
+        from yt_dlp.version import __version__
+    except ImportError:
+        return None
+    try:
+        filenames = {
+            "minified": EJSBaseJCP._MIN_SCRIPT_FILENAMES,
+            "unminified": EJSBaseJCP._SCRIPT_FILENAMES,
+        }
+        scripts: dict[str, dict[str, tuple[str, str]]] = {}
+        for script_type, hashes in EJSBaseJCP._ALLOWED_HASHES.items():
+            for variant, digest in hashes.items():
+                names = filenames.get(variant.value)
+                if names is not None and script_type in names:
+                    scripts.setdefault(script_type.value, {})[variant.value] = (
+                        names[script_type],
+                        digest,
+                    )
+        return SolverPins(str(EJSBaseJCP._SCRIPT_VERSION), str(__version__), scripts)
+    except (AttributeError, TypeError):
+        return None
+
+
+def _pinned(pins: SolverPins, script_type: str, variant: str, code: bytes) -> bool:
+    pinned = pins.scripts.get(script_type, {}).get(variant)
+    return pinned is not None and hashlib.sha3_512(code).hexdigest() == pinned[1]
+
+
+def _read_limited(path: Path) -> bytes | None:
+    try:
+        if path.stat().st_size > MAX_SCRIPT_BYTES:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _read_cache_record(path: Path) -> dict[str, Any] | None:
+    raw = _read_limited(path)
+    if raw is None:
+        return None
+    try:
+        record = json.loads(raw.decode("utf-8"))
+    except ValueError:
+        return None
+    data = record.get("data") if isinstance(record, dict) else None
+    return data if isinstance(data, dict) else None
+
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        temporary.write_bytes(content)
+        os.replace(temporary, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            temporary.unlink()
+        raise
+
+
+def _file_identity(info: os.stat_result) -> _FileIdentity:
+    return (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns, info.st_ctime_ns)
+
+
+_STORES: dict[str, EjsSolverStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_ejs_solver_store(root: Path) -> EjsSolverStore:
+    key = os.path.normcase(os.path.abspath(root))
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = EjsSolverStore(Path(root))
+        return store
+
+
+def default_ejs_solver_store() -> EjsSolverStore:
+    return get_ejs_solver_store(app_data_dir() / EJS_STORE_DIRECTORY)
+
+
+def ytdlp_remote_components(ytdlp_cache_dir: Path) -> list[str]:
+    """Return yt-dlp ``remote_components``, dropping ``ejs:github`` while the store can serve."""
+    components = list(YOUTUBE_REMOTE_COMPONENTS)
+    if YOUTUBE_EJS_REMOTE_COMPONENT not in components:
+        return components
+    if default_ejs_solver_store().prepare(ytdlp_cache_dir).ready:
+        components.remove(YOUTUBE_EJS_REMOTE_COMPONENT)
+    return components
+
+
+__all__ = [
+    "EJS_STORE_DIRECTORY",
+    "EjsSolverStore",
+    "SolverPins",
+    "SolverStoreStatus",
+    "default_ejs_solver_store",
+    "get_ejs_solver_store",
+    "ytdlp_remote_components",
+]
@@ -0,0 +1,316 @@
+"""Crash-safe journal of queued download jobs.
+
+The Qt table and ``MainWindow.jobs`` used to be the only record of a queue,
+so a crash, a forced shutdown or an update restart lost the whole batch and
+every half-finished download started over.  The scheduler now writes each
+job state transition (queued, running, completed, failed, cancelled) to a
+SQLite journal in the app data folder, one short WAL transaction per
+transition.  On the next start the GUI restores unfinished jobs into the
+queue and ``--resume`` runs them from the CLI.  Re-running an interrupted job
+with the same output folder lets yt-dlp continue its ``.part`` files
+(``continuedl``) instead of downloading from the start, so each job also
+keeps a snapshot of the options it last ran with (output folder, mode and
+quality) and resumes with those rather than with whatever the front end is
+set to now.  Jobs remember which front end queued them: the GUI restores
+only its own jobs and ``--resume`` only those of earlier CLI batches.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from neural_extractor_v3.config import app_data_dir
+from neural_extractor_v3.models import (
+    DownloadJob,
+    DownloadOptions,
+    DownloadResult,
+    MediaMode,
+    PlaylistMode,
+)
+
+JOB_JOURNAL_FILENAME = "job-queue.sqlite3"
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+# States whose download never finished; they are resumed by default.
+UNFINISHED_STATES = frozenset({JOB_QUEUED, JOB_RUNNING, JOB_CANCELLED})
+JOB_ORIGIN_GUI = "gui"
+JOB_ORIGIN_CLI = "cli"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    position INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL UNIQUE,
+    url TEXT NOT NULL,
+    playlist_title TEXT NOT NULL DEFAULT '',
+    playlist_index INTEGER,
+    recheck_unavailable INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL,
+    message TEXT NOT NULL DEFAULT '',
+    failure_category TEXT NOT NULL DEFAULT '',
+    updated_at REAL NOT NULL,
+    origin TEXT NOT NULL DEFAULT 'gui',
+    options TEXT NOT NULL DEFAULT ''
+)
+"""
+# Columns added after the first release; older journals are migrated in place.
+_ADDED_COLUMNS = {
+    "origin": "origin TEXT NOT NULL DEFAULT 'gui'",
+    "options": "options TEXT NOT NULL DEFAULT ''",
+}
+# Options a resumed job must keep so it continues into the same files.
+_SNAPSHOT_FIELDS = {
+    "output_dir": Path,
+    "media_mode": MediaMode,
+    "playlist_mode": PlaylistMode,
+    "quality": str,
+    "audio_quality": str,
+}
+
+
+def _options_snapshot(options: DownloadOptions | None) -> str:
+    if options is None:
+        return ""
+    return json.dumps(
+        {
+            name: str(getattr(value, "value", value))
+            for name in _SNAPSHOT_FIELDS
+            if (value := getattr(options, name)) is not None
+        },
+        sort_keys=True,
+    )
+
+
+def _load_snapshot(raw: str) -> dict[str, str]:
+    try:
+        snapshot = json.loads(raw) if raw else {}
+    except ValueError:
+        return {}
+    if not isinstance(snapshot, dict):
+        return {}
+    return {
+        name: value
+        for name, value in snapshot.items()
+        if name in _SNAPSHOT_FIELDS and isinstance(value, str)
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class JournaledJob:
+    job: DownloadJob
+    state: str
+    message: str = ""
+    failure_category: str = ""
+    origin: str = JOB_ORIGIN_GUI
+    options: Mapping[str, str] = field(default_factory=dict)
+
+    def resume_options(self, defaults: DownloadOptions) -> DownloadOptions:
+        """Return ``defaults`` with the options this job was journaled with."""
+        changes = {}
+        for name, value in self.options.items():
+            try:
+                changes[name] = _SNAPSHOT_FIELDS[name](value)
+            except ValueError:
+                continue
+        return dataclasses.replace(defaults, **changes) if changes else defaults
+
+
+class JobJournal:
+    """Thread-safe job state journal; every transition is its own transaction."""
+
+    def __init__(self, path: Path, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def add(
+        self,
+        jobs: Iterable[DownloadJob],
+        options: DownloadOptions | None = None,
+        *,
+        origin: str = JOB_ORIGIN_GUI,
+        job_options: Mapping[str, DownloadOptions] | None = None,
+    ) -> None:
+        """Journal new jobs as queued; jobs that are already journaled keep their state.
+
+        ``options`` (or the job's entry in ``job_options``) is snapshotted for
+        resuming and replaces the snapshot of a job that is already journaled.
+        """
+        job_options = job_options or {}
+        rows = [
+            (
+                job.job_id,
+                job.url,
+                job.playlist_title,
+                job.playlist_index,
+                int(job.recheck_unavailable),
+                JOB_QUEUED,
+                self._clock(),
+                origin,
+                _options_snapshot(job_options.get(job.job_id, options)),
+            )
+            for job in jobs
+        ]
+        self._write(
+            "INSERT INTO jobs (job_id, url, playlist_title, playlist_index, "
+            "recheck_unavailable, state, updated_at, origin, options) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (job_id) DO UPDATE SET options = excluded.options "
+            "WHERE excluded.options != ''",
+            rows,
+        )
+
+    def mark_running(self, job_id: str) -> None:
+        self._write(
+            "UPDATE jobs SET state = ?, message = '', failure_category = '', updated_at = ? "
+            "WHERE job_id = ?",
+            [(JOB_RUNNING, self._clock(), job_id)],
+        )
+
+    def mark_finished(self, job_id: str, result: DownloadResult) -> None:
+        if result.success:
+            state = JOB_COMPLETED
+        elif result.failure_category == JOB_CANCELLED:  # the scheduler's cancelled category
+            state = JOB_CANCELLED
+        else:
+            state = JOB_FAILED
+        self._write(
+            "UPDATE jobs SET state = ?, message = ?, failure_category = ?, updated_at = ? "
+            "WHERE job_id = ?",
+            [(state, result.message, result.failure_category, self._clock(), job_id)],
+        )
+
+    def jobs(
+        self, states: Iterable[str] | None = None, *, origin: str | None = None
+    ) -> list[JournaledJob]:
+        """Return journaled jobs in queue order, optionally limited to ``states`` and ``origin``."""
+        wanted = None if states is None else set(states)
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return []
+            try:
+                rows = connection.execute(
+                    "SELECT job_id, url, playlist_title, playlist_index, recheck_unavailable, "
+                    "state, message, failure_category, origin, options FROM jobs "
+                    "ORDER BY position"
+                ).fetchall()
+            except sqlite3.Error:
+                return []
+        journaled: list[JournaledJob] = []
+        for job_id, url, title, index, recheck, state, message, category, source, raw in rows:
+            if wanted is not None and state not in wanted:
+                continue
+            if origin is not None and source != origin:
+                continue
+            job = DownloadJob(
+                url,
+                job_id=job_id,
+                playlist_title=title,
+                playlist_index=index,
+                recheck_unavailable=bool(recheck),
+            )
+            journaled.append(
+                JournaledJob(job, state, message, category, source, _load_snapshot(raw))
+            )
+        return journaled
+
+    def unfinished(self, *, origin: str | None = None) -> list[DownloadJob]:
+        return [entry.job for entry in self.jobs(UNFINISHED_STATES, origin=origin)]
+
+    def discard(self, states: Iterable[str], *, origin: str | None = None) -> None:
+        """Forget jobs in ``states``, optionally only those queued from ``origin``."""
+        if origin is None:
+            rows = [(state,) for state in states]
+            self._write("DELETE FROM jobs WHERE state = ?", rows)
+        else:
+            rows = [(state, origin) for state in states]
+            self._write("DELETE FROM jobs WHERE state = ? AND origin = ?", rows)
+
+    def discard_completed(self) -> None:
+        self.discard([JOB_COMPLETED])
+
+    def clear(self, *, origin: str | None = None) -> None:
+        if origin is None:
+            self._write("DELETE FROM jobs", [()])
+        else:
+            self._write("DELETE FROM jobs WHERE origin = ?", [(origin,)])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _write(self, statement: str, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                with connection:
+                    connection.executemany(statement, rows)
+            except sqlite3.Error:
+                # The journal protects against crashes; it must never fail a download.
+                return
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._connection is not None:
+            return self._connection
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            with contextlib.suppress(sqlite3.DatabaseError):
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(_SCHEMA)
+                columns = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+                for name, definition in _ADDED_COLUMNS.items():
+                    if name not in columns:
+                        connection.execute(f"ALTER TABLE jobs ADD COLUMN {definition}")
+        except (OSError, sqlite3.Error):
+            return None
+        self._connection = connection
+        return connection
+
+
+_DEFAULT_JOURNAL: JobJournal | None = None
+_DEFAULT_JOURNAL_LOCK = threading.Lock()
+
+
+def get_job_journal() -> JobJournal:
+    global _DEFAULT_JOURNAL
+    with _DEFAULT_JOURNAL_LOCK:
+        if _DEFAULT_JOURNAL is None:
+            _DEFAULT_JOURNAL = JobJournal(app_data_dir() / JOB_JOURNAL_FILENAME)
+        return _DEFAULT_JOURNAL
+
+
+__all__ = [
+    "JOB_CANCELLED",
+    "JOB_COMPLETED",
+    "JOB_FAILED",
+    "JOB_JOURNAL_FILENAME",
+    "JOB_ORIGIN_CLI",
+    "JOB_ORIGIN_GUI",
+    "JOB_QUEUED",
+    "JOB_RUNNING",
+    "UNFINISHED_STATES",
+    "JobJournal",
+    "JournaledJob",
+    "get_job_journal",
+]
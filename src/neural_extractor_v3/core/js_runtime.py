@@ -6,6 +6,7 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -18,6 +19,9 @@ MISSING_CHALLENGE_SOLVER_COMPONENT_MESSAGE = (
     "YouTube challenge solver component unavailable. Check internet/firewall or retry later."
 )
 
+_NODE_VERSION_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+_NODE_VERSION_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True, slots=True)
 class JavaScriptRuntimeStatus:
@@ -56,7 +60,7 @@ def resolve_youtube_js_runtime() -> JavaScriptRuntimeStatus:
         path = _resolve_executable(candidate)
         if not path:
             continue
-        version = _node_version(path)
+        version = _cached_node_version(path)
         if version:
             return JavaScriptRuntimeStatus(True, "node", path, version)
     return JavaScriptRuntimeStatus(False)
@@ -141,6 +145,25 @@ def _resolve_executable(candidate: Path | str) -> Path | None:
     return None
 
 
+def _cached_node_version(path: Path) -> str:
+    """Run ``node --version`` only when the executable changed since it last answered."""
+    try:
+        info = path.stat()
+    except OSError:
+        return ""
+    identity = (info.st_mtime_ns, info.st_size)
+    with _NODE_VERSION_LOCK:
+        cached = _NODE_VERSION_CACHE.get(path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    version = _node_version(path)
+    if version:
+        # Failures are not remembered: a slow first launch must not disable Node.
+        with _NODE_VERSION_LOCK:
+            _NODE_VERSION_CACHE[path] = (identity, version)
+    return version
+
+
 def _node_version(path: Path) -> str:
     try:
         completed = subprocess.run(
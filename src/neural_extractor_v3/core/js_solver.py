@@ -0,0 +1,456 @@
+"""Resident Node.js service and solution cache for YouTube n/sig challenges.
+
+yt-dlp's built-in Node provider starts ``node`` for every challenge batch and
+feeds it the solver library, the solver core and the multi-megabyte player
+script on stdin.  Inside a worker the resident provider instead keeps one
+owned ``node`` child running a small line-framed service.  The solver scripts
+are loaded once, the preprocessed player is kept in the service keyed by
+player URL, and each batch is a single request/response exchange.  Solved
+challenges are memoized per player URL, so retries and later attempts in the
+same pooled worker answer repeated challenges without touching Node at all.
+
+The service is recorded and terminated like every other owned child; it exits
+on its own when the worker closes its stdin.  If it cannot be started or
+fails, the provider falls back to yt-dlp's one-shot Node invocation.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from neural_extractor_v3.config import (
+    JS_SOLVER_CACHE_ENTRIES,
+    JS_SOLVER_REQUEST_TIMEOUT_SECONDS,
+    app_data_dir,
+)
+from neural_extractor_v3.core.process_control import (
+    OwnedProcessSession,
+    ProcessLaunchError,
+    ProcessLimits,
+)
+
+RESIDENT_PROVIDER_PREFERENCE = 100
+MAX_RESIDENT_PLAYERS = 4
+TERMINATION_GRACE_SECONDS = 2.0
+
+SOLVER_SERVICE_SCRIPT = r"""
+'use strict';
+const vm = require('vm');
+const readline = require('readline');
+const players = new Map();
+let scriptsKey = null;
+let solve = null;
+
+function reply(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+function handle(request) {
+  if (request.op === 'load') {
+    vm.runInThisContext(request.lib);
+    Object.assign(globalThis, vm.runInThisContext('lib'));
+    vm.runInThisContext(request.core);
+    solve = vm.runInThisContext('jsc');
+    scriptsKey = request.key;
+    players.clear();
+    return {loaded: scriptsKey};
+  }
+  if (request.op !== 'solve') {
+    throw new Error('unknown operation');
+  }
+  if (solve === null || request.scripts !== scriptsKey) {
+    return {missing: 'scripts'};
+  }
+  let data;
+  if (typeof request.player === 'string') {
+    data = {type: 'player', player: request.player, requests: request.requests,
+            output_preprocessed: true};
+  } else if (players.has(request.player_key)) {
+    const preprocessed = players.get(request.player_key);
+    players.delete(request.player_key);
+    players.set(request.player_key, preprocessed);
+    data = {type: 'preprocessed', preprocessed_player: preprocessed, requests: request.requests};
+  } else {
+    return {missing: 'player'};
+  }
+  const output = solve(data);
+  if (output && typeof output.preprocessed_player === 'string') {
+    players.set(request.player_key, output.preprocessed_player);
+    delete output.preprocessed_player;
+    while (players.size > MAX_PLAYERS) {
+      players.delete(players.keys().next().value);
+    }
+  }
+  return {output: output};
+}
+
+const input = readline.createInterface({input: process.stdin, crlfDelay: Infinity});
+input.on('line', (line) => {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    reply({id: null, error: 'invalid request frame'});
+    return;
+  }
+  try {
+    reply(Object.assign({id: request.id}, handle(request)));
+  } catch (error) {
+    reply({id: request.id, error: String((error && error.stack) || error)});
+  }
+});
+input.on('close', () => process.exit(0));
+""".replace("MAX_PLAYERS", str(MAX_RESIDENT_PLAYERS))
+
+
+class JsSolverError(RuntimeError):
+    """The resident service could not answer; the caller may fall back to one-shot Node."""
+
+
+def node_permission_args(version: Sequence[int]) -> list[str]:
+    """Match yt-dlp's sandboxing flags; ``--permission`` became stable in Node 23.5."""
+    if tuple(version) < (23, 5, 0):
+        return ["--experimental-permission", "--no-warnings=ExperimentalWarning"]
+    return ["--permission"]
+
+
+class ChallengeSolutionCache:
+    """LRU map of ``(player URL, challenge type, challenge)`` to the solved value."""
+
+    def __init__(self, *, max_entries: int = JS_SOLVER_CACHE_ENTRIES) -> None:
+        self.max_entries = max(0, max_entries)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def lookup(
+        self, player_url: str, challenge_type: str, challenges: Iterable[str]
+    ) -> dict[str, str]:
+        """Return the solutions already known for ``challenges``."""
+        found: dict[str, str] = {}
+        with self._lock:
+            for challenge in challenges:
+                key = (player_url, challenge_type, challenge)
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[challenge] = value
+        return found
+
+    def store(self, player_url: str, challenge_type: str, solutions: Mapping[str, str]) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            for challenge, value in solutions.items():
+                key = (player_url, challenge_type, challenge)
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResidentNodeSolver:
+    """One owned ``node`` service answering line-framed solve requests in order."""
+
+    def __init__(
+        self,
+        node_path: Path,
+        *,
+        node_version: Sequence[int] = (0,),
+        request_timeout: float = JS_SOLVER_REQUEST_TIMEOUT_SECONDS,
+        record_directory: Path | None = None,
+    ) -> None:
+        self.node_path = Path(node_path)
+        self.command = [
+            str(self.node_path),
+            *node_permission_args(node_version),
+            "-e",
+            SOLVER_SERVICE_SCRIPT,
+        ]
+        self.request_timeout = request_timeout
+        self.record_directory = record_directory
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._session: OwnedProcessSession | None = None
+        self._buffer = ""
+        self._replies: dict[int, dict[str, Any]] = {}
+        self._next_id = 0
+        self.requests_sent = 0
+
+    @property
+    def pid(self) -> int | None:
+        session = self._session
+        return session.pid if session is not None else None
+
+    def solve(
+        self,
+        *,
+        lib: str,
+        core: str,
+        player_key: str,
+        load_player: Callable[[], str],
+        requests: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return the solver core's JSON output for ``requests``; restart once after a crash."""
+        scripts_key = hashlib.sha256(f"{lib}\0{core}".encode()).hexdigest()
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    return self._solve(scripts_key, lib, core, player_key, load_player, requests)
+                except JsSolverError:
+                    self._stop()
+                    if attempt:
+                        raise
+        raise JsSolverError("node solver service failed")
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _solve(
+        self,
+        scripts_key: str,
+        lib: str,
+        core: str,
+        player_key: str,
+        load_player: Callable[[], str],
+        requests: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        message: dict[str, Any] = {
+            "op": "solve",
+            "scripts": scripts_key,
+            "player_key": player_key,
+            "requests": requests,
+        }
+        for _ in range(3):
+            reply = self._call(message)
+            missing = reply.get("missing")
+            if missing == "scripts":
+                self._call({"op": "load", "key": scripts_key, "lib": lib, "core": core})
+            elif missing == "player":
+                message["player"] = load_player()
+            elif isinstance(reply.get("output"), dict):
+                return reply["output"]
+            else:
+                raise JsSolverError(str(reply.get("error") or "invalid solver reply"))
+        raise JsSolverError("node solver service did not accept the request")
+
+    def _call(self, message: dict[str, Any]) -> dict[str, Any]:
+        session = self._running_session()
+        self._next_id += 1
+        request_id = self._next_id
+        frame = json.dumps({"id": request_id, **message}, ensure_ascii=False) + "\n"
+        try:
+            session.write(frame)
+        except OSError as exc:
+            raise JsSolverError("node solver service stopped accepting requests") from exc
+        self.requests_sent += 1
+        deadline = time.monotonic() + self.request_timeout
+        with self._condition:
+            while request_id not in self._replies:
+                if not session.alive:
+                    raise JsSolverError("node solver service exited")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise JsSolverError("node solver service timed out")
+                self._condition.wait(min(remaining, 0.1))
+            reply = self._replies.pop(request_id)
+        if "error" in reply and message["op"] == "load":
+            raise JsSolverError(str(reply["error"]))
+        return reply
+
+    def _running_session(self) -> OwnedProcessSession:
+        session = self._session
+        if session is not None and session.alive:
+            return session
+        self._stop()
+        record_directory = self.record_directory or app_data_dir() / "process-state"
+        session = OwnedProcessSession(
+            self.command,
+            limits=ProcessLimits(
+                termination_grace=TERMINATION_GRACE_SECONDS,
+                force_kill_wait=TERMINATION_GRACE_SECONDS,
+                pipe_join_timeout=TERMINATION_GRACE_SECONDS,
+            ),
+            ownership_record=record_directory
+            / f"active-js-solver-{os.getpid()}-{uuid4().hex[:8]}.json",
+        )
+        try:
+            session.start()
+        except ProcessLaunchError as exc:
+            raise JsSolverError(str(exc)) from exc
+        session.stream(self._on_stdout)
+        self._session = session
+        return session
+
+    def _stop(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            session.close()
+        with self._condition:
+            self._buffer = ""
+            self._replies.clear()
+
+    def _on_stdout(self, text: str) -> None:
+        with self._condition:
+            *lines, self._buffer = (self._buffer + text).split("\n")
+            for line in lines:
+                try:
+                    reply = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                request_id = reply.get("id") if isinstance(reply, dict) else None
+                if isinstance(request_id, int):
+                    self._replies[request_id] = reply
+            if lines:
+                self._condition.notify_all()
+
+
+_SOLUTION_CACHE = ChallengeSolutionCache()
+_SOLVERS: dict[Path, ResidentNodeSolver] = {}
+_SOLVERS_LOCK = threading.Lock()
+_PROVIDER_REGISTERED = False
+
+
+def get_challenge_solution_cache() -> ChallengeSolutionCache:
+    return _SOLUTION_CACHE
+
+
+def get_resident_node_solver(node_path: Path, node_version: Sequence[int]) -> ResidentNodeSolver:
+    path = Path(node_path)
+    with _SOLVERS_LOCK:
+        solver = _SOLVERS.get(path)
+        if solver is None:
+            solver = _SOLVERS[path] = ResidentNodeSolver(path, node_version=node_version)
+            atexit.register(solver.close)
+        return solver
+
+
+def configure_yt_dlp_challenge_solver() -> bool:
+    """Register the resident Node provider with yt-dlp once per worker process.
+
+    Returns whether the provider is registered; a yt-dlp without the provider
+    API keeps its own one-shot solvers.
+    """
+    global _PROVIDER_REGISTERED
+    with _SOLVERS_LOCK:
+        if not _PROVIDER_REGISTERED:
+            try:
+                _register_resident_provider()
+            except (ImportError, AttributeError):
+                return False
+            _PROVIDER_REGISTERED = True
+        return True
+
+
+def _register_resident_provider() -> None:
+    from yt_dlp.extractor.youtube.jsc._builtin.node import NodeJCP
+    from yt_dlp.extractor.youtube.jsc.provider import (
+        JsChallengeProviderError,
+        JsChallengeProviderResponse,
+        JsChallengeResponse,
+        JsChallengeType,
+        NChallengeOutput,
+        SigChallengeOutput,
+        register_preference,
+        register_provider,
+    )
+
+    def challenge_response(request: Any, results: dict[str, str]) -> Any:
+        output_type = NChallengeOutput if request.type is JsChallengeType.N else SigChallengeOutput
+        return JsChallengeProviderResponse(
+            request, JsChallengeResponse(request.type, output_type(results))
+        )
+
+    class ResidentNodeJCP(NodeJCP):
+        """yt-dlp's Node provider answered from the memo cache or the resident service."""
+
+        def _real_bulk_solve(self, /, requests: list[Any]) -> Any:
+            cache = get_challenge_solution_cache()
+            grouped: dict[str, list[tuple[Any, dict[str, str]]]] = {}
+            for request in requests:
+                player_url = request.input.player_url
+                known = cache.lookup(player_url, request.type.value, request.input.challenges)
+                if len(known) == len(set(request.input.challenges)):
+                    yield challenge_response(request, known)
+                else:
+                    grouped.setdefault(player_url, []).append((request, known))
+
+            for player_url, group in grouped.items():
+                video_id = next((request.video_id for request, _ in group), None)
+                payload = [
+                    {
+                        "type": request.type.value,
+                        "challenges": [
+                            challenge
+                            for challenge in request.input.challenges
+                            if challenge not in known
+                        ],
+                    }
+                    for request, known in group
+                ]
+                self.logger.info(f"Solving JS challenges using resident {self.JS_RUNTIME_NAME}")
+                try:
+                    solver = get_resident_node_solver(
+                        Path(self.runtime_info.path), self.runtime_info.version_tuple
+                    )
+                    output = solver.solve(
+                        lib=self._lib_script.code,
+                        core=self._core_script.code,
+                        player_key=player_url,
+                        load_player=lambda: self._get_player(video_id, player_url),
+                        requests=payload,
+                    )
+                except JsSolverError as exc:
+                    self.logger.warning(
+                        f"Resident {self.JS_RUNTIME_NAME} solver unavailable ({exc}); "
+                        "starting a one-shot process for this batch"
+                    )
+                    yield from super()._real_bulk_solve([request for request, _ in group])
+                    continue
+                if output.get("type") == "error":
+                    raise JsChallengeProviderError(str(output.get("error")))
+                responses = output.get("responses") or []
+                for (request, known), response in zip(group, responses, strict=True):
+                    if response.get("type") == "error":
+                        yield JsChallengeProviderResponse(
+                            request, None, JsChallengeProviderError(str(response.get("error")))
+                        )
+                        continue
+                    solved = response.get("data") or {}
+                    cache.store(player_url, request.type.value, solved)
+                    yield challenge_response(request, {**known, **solved})
+
+    register_provider(ResidentNodeJCP)
+
+    @register_preference(ResidentNodeJCP)
+    def _prefer_resident(provider: Any, requests: list[Any]) -> int:
+        return RESIDENT_PROVIDER_PREFERENCE
+
+
+__all__ = [
+    "ChallengeSolutionCache",
+    "JsSolverError",
+    "ResidentNodeSolver",
+    "configure_yt_dlp_challenge_solver",
+    "get_challenge_solution_cache",
+    "get_resident_node_solver",
+    "node_permission_args",
+]
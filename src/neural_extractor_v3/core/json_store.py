@@ -0,0 +1,51 @@
+"""Versioned JSON documents in the app data folder, replaced atomically.
+
+The attempt outcome store, the negative result cache and the playlist sync
+store each persist one small JSON document.  A document is only read back
+when it is an object carrying the expected ``schema_version``; anything else
+reads as missing so the store starts empty.  Writes go to a temporary sibling
+that replaces the file in one step, so a crash never leaves half a document
+behind.  Every such store is an optimisation, so a read-only or full data
+folder only loses what could not be written.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+
+def load_json_document(path: Path, schema_version: int) -> dict[str, Any] | None:
+    """Return the stored document, or ``None`` if it is missing, unreadable or outdated."""
+    try:
+        with Path(path).open(encoding="utf-8") as stream:
+            stored = json.load(stream)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stored, dict) or stored.get("schema_version") != schema_version:
+        return None
+    return stored
+
+
+def save_json_document(path: Path, schema_version: int, body: Mapping[str, Any]) -> bool:
+    """Atomically write ``body`` stamped with ``schema_version``; ``False`` if it failed."""
+    path = Path(path)
+    document = {**body, "schema_version": schema_version}
+    temporary = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(json.dumps(document), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            temporary.unlink()
+        return False
+    return True
+
+
+__all__ = ["load_json_document", "save_json_document"]
@@ -0,0 +1,76 @@
+"""Incremental newline framing for worker output streams.
+
+The engine used to append each chunk to one string and split off a line at a
+time, which re-copies the whole pending buffer for every line and turns a
+large burst (a playlist frame with thousands of entries, verbose debug
+output) into quadratic work.  ``LineFramer`` scans only the newly received
+chunk for newlines and keeps an unfinished line as a list of fragments that
+is joined once, when its newline arrives, so framing is linear in the input.
+A frame longer than ``max_frame_chars`` is dropped up to its newline and
+counted instead of growing the buffer without bound.
+"""
+
+from __future__ import annotations
+
+
+class LineFramer:
+    """Turn text chunks into complete lines without the trailing newline or ``\\r``."""
+
+    def __init__(self, max_frame_chars: int | None = None) -> None:
+        self.max_frame_chars = max_frame_chars
+        self.overflowed_frames = 0
+        self.overflowed_chars = 0
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._skipping = False
+
+    def feed(self, chunk: str) -> list[str]:
+        """Return the lines completed by ``chunk``; the unfinished rest is kept."""
+        lines: list[str] = []
+        start = 0
+        while (end := chunk.find("\n", start)) >= 0:
+            piece = chunk[start:end]
+            start = end + 1
+            if self._skipping:
+                # The rest of an overflowed frame; its newline ends the overflow.
+                self._skipping = False
+                self.overflowed_chars += len(piece)
+                continue
+            if self._pending:
+                self._pending.append(piece)
+                piece = "".join(self._pending)
+                self._pending.clear()
+                self._pending_chars = 0
+            if self.max_frame_chars is not None and len(piece) > self.max_frame_chars:
+                self.overflowed_frames += 1
+                self.overflowed_chars += len(piece)
+                continue
+            lines.append(piece.removesuffix("\r"))
+        tail = chunk[start:]
+        if tail:
+            self._keep(tail)
+        return lines
+
+    def flush(self) -> str:
+        """Return and forget the unfinished line at the end of the stream."""
+        remaining = "".join(self._pending).removesuffix("\r")
+        self._pending.clear()
+        self._pending_chars = 0
+        self._skipping = False
+        return remaining
+
+    def _keep(self, tail: str) -> None:
+        if self._skipping:
+            self.overflowed_chars += len(tail)
+            return
+        self._pending.append(tail)
+        self._pending_chars += len(tail)
+        if self.max_frame_chars is not None and self._pending_chars > self.max_frame_chars:
+            self.overflowed_frames += 1
+            self.overflowed_chars += self._pending_chars
+            self._pending.clear()
+            self._pending_chars = 0
+            self._skipping = True
+
+
+__all__ = ["LineFramer"]
@@ -0,0 +1,164 @@
+"""Persisted negative results for videos that cannot be downloaded right now.
+
+Re-queuing a batch used to run the full retry plan again for videos that had
+already failed for a reason no retry can fix: removed videos, ended live
+events without an archive, or restricted videos the connected account cannot
+open.  The engine records such failures by video ID and answers later jobs
+for the same video from this cache, without starting a worker, until the
+category-specific TTL runs out.  A job can opt out with
+``DownloadJob.recheck_unavailable``; any successful download clears the entry.
+Authentication failures of the public attempt are never cached because adding
+a cookie source can fix them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from neural_extractor_v3.config import NEGATIVE_CACHE_MAX_ENTRIES, app_data_dir
+from neural_extractor_v3.core.json_store import load_json_document, save_json_document
+from neural_extractor_v3.core.youtube_errors import FailureCategory
+
+NEGATIVE_CACHE_FILENAME = "negative-results.json"
+NEGATIVE_CACHE_SCHEMA_VERSION = 1
+NEGATIVE_RESULT_TTLS: dict[FailureCategory, float] = {
+    FailureCategory.VIDEO_UNAVAILABLE: 7 * 24 * 60 * 60,
+    FailureCategory.YOUTUBE_ACCESS_RESTRICTED: 24 * 60 * 60,
+    # An ended stream can still become a VOD once YouTube finishes processing it.
+    FailureCategory.LIVE_EVENT_ENDED: 6 * 60 * 60,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class NegativeResult:
+    video_id: str
+    category: FailureCategory
+    message: str
+    recorded_at: float
+    expires_at: float
+
+
+class NegativeResultCache:
+    """Thread-safe, file-backed map of video ID to its last permanent failure."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttls: Mapping[FailureCategory, float] | None = None,
+        max_entries: int = NEGATIVE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.ttls = dict(NEGATIVE_RESULT_TTLS if ttls is None else ttls)
+        self.max_entries = max(0, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def cacheable(self, category: FailureCategory) -> bool:
+        return self.max_entries > 0 and self.ttls.get(category, 0) > 0
+
+    def get(self, video_id: str | None) -> NegativeResult | None:
+        if not video_id or self.max_entries <= 0:
+            return None
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(video_id)
+            if entry is None:
+                return None
+            result = _result(video_id, entry)
+            if result is None or result.expires_at <= self._clock():
+                del entries[video_id]
+                self._save(entries)
+                return None
+            return result
+
+    def put(self, video_id: str | None, category: FailureCategory, message: str) -> bool:
+        """Remember a failure; returns ``False`` when the category is not cacheable."""
+        if not video_id or not self.cacheable(category):
+            return False
+        with self._lock:
+            entries = self._load()
+            now = self._clock()
+            entries.pop(video_id, None)
+            entries[video_id] = {
+                "category": category.value,
+                "message": message,
+                "recorded_at": now,
+                "expires_at": now + self.ttls[category],
+            }
+            # Dicts keep insertion order, so the oldest records are dropped first.
+            for stale in list(entries)[: max(0, len(entries) - self.max_entries)]:
+                del entries[stale]
+            self._save(entries)
+        return True
+
+    def discard(self, video_id: str | None) -> None:
+        if not video_id:
+            return
+        with self._lock:
+            entries = self._load()
+            if entries.pop(video_id, None) is not None:
+                self._save(entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._save(self._entries)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, dict[str, Any]] = {}
+        stored = load_json_document(self.path, NEGATIVE_CACHE_SCHEMA_VERSION)
+        if stored is not None and isinstance(stored.get("entries"), dict):
+            entries = {
+                video_id: entry
+                for video_id, entry in stored["entries"].items()
+                if isinstance(entry, dict) and _result(video_id, entry) is not None
+            }
+        self._entries = entries
+        return entries
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        save_json_document(self.path, NEGATIVE_CACHE_SCHEMA_VERSION, {"entries": entries})
+
+
+def _result(video_id: str, entry: Mapping[str, Any]) -> NegativeResult | None:
+    try:
+        return NegativeResult(
+            video_id=video_id,
+            category=FailureCategory(entry["category"]),
+            message=str(entry.get("message") or ""),
+            recorded_at=float(entry["recorded_at"]),
+            expires_at=float(entry["expires_at"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+_DEFAULT_CACHE: NegativeResultCache | None = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_negative_result_cache() -> NegativeResultCache:
+    global _DEFAULT_CACHE
+    with _DEFAULT_CACHE_LOCK:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = NegativeResultCache(app_data_dir() / NEGATIVE_CACHE_FILENAME)
+        return _DEFAULT_CACHE
+
+
+__all__ = [
+    "NEGATIVE_CACHE_FILENAME",
+    "NEGATIVE_RESULT_TTLS",
+    "NegativeResult",
+    "NegativeResultCache",
+    "get_negative_result_cache",
+]
@@ -0,0 +1,152 @@
+"""Remembered playlist entries for incremental playlist sync.
+
+``PlaylistMode.FULL`` lists and downloads every entry on each run, so an
+hourly re-download of a large channel or playlist spent most of its time on
+entries it already had.  ``PlaylistMode.SYNC`` keeps the IDs of entries that
+were downloaded per playlist (``list=`` ID or channel path) and only schedules
+entries that are not known yet.  A channel home lists one nested playlist per
+tab rather than videos, so it is synced through its ``/videos`` tab.  Channel tabs and uploads playlists are listed
+newest-first, so their listing stops after a few known entries in a row, which
+is usually the first page; other playlists are still listed in full but only
+new entries reach a worker.  Entries that fail stay unknown and are retried
+on the next sync.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from neural_extractor_v3.config import app_data_dir
+from neural_extractor_v3.core.json_store import load_json_document, save_json_document
+from neural_extractor_v3.utils import is_youtube_channel_url, normalize_user_url
+
+PLAYLIST_SYNC_FILENAME = "playlist-sync.json"
+PLAYLIST_SYNC_SCHEMA_VERSION = 1
+# Known entries in a row after which a newest-first listing is complete.
+KNOWN_ENTRY_STREAK = 3
+MAX_KNOWN_ENTRIES_PER_PLAYLIST = 50_000
+_CHANNEL_HOME_PATTERN = re.compile(r"^/(?:@[^/]+|(?:channel|c|user)/[^/]+)/?$")
+
+
+def sync_listing_url(url: str) -> str:
+    """Return the URL a sync lists and keys: a channel home becomes its ``/videos`` tab."""
+    try:
+        parsed = urlparse(normalize_user_url(url))
+    except ValueError:
+        return url
+    if not _CHANNEL_HOME_PATTERN.match(parsed.path):
+        return url
+    return parsed._replace(path=parsed.path.rstrip("/") + "/videos").geturl()
+
+
+def playlist_sync_key(url: str) -> str | None:
+    """Return the identity a playlist is remembered under, or ``None`` if it has none."""
+    try:
+        parsed = urlparse(normalize_user_url(url))
+    except ValueError:
+        return None
+    list_id = parse_qs(parsed.query).get("list", [""])[0]
+    if list_id:
+        return f"list:{list_id}"
+    if is_youtube_channel_url(url):
+        return f"channel:{parsed.path.rstrip('/')}"
+    return None
+
+
+def lists_newest_first(url: str) -> bool:
+    """Whether YouTube lists this playlist newest-first, so listing may stop at known entries."""
+    try:
+        parsed = urlparse(normalize_user_url(url))
+    except ValueError:
+        return False
+    list_id = parse_qs(parsed.query).get("list", [""])[0]
+    if list_id:
+        # UU, UULF, UUSH, ... are the per-channel uploads playlists.
+        return list_id.startswith("UU")
+    return is_youtube_channel_url(url)
+
+
+class PlaylistSyncStore:
+    """Thread-safe, file-backed set of downloaded entry IDs per playlist."""
+
+    def __init__(self, path: Path, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = Path(path)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._playlists: dict[str, dict[str, Any]] | None = None
+
+    def known_ids(self, key: str | None) -> frozenset[str]:
+        if not key:
+            return frozenset()
+        with self._lock:
+            return frozenset(self._load().get(key, {}).get("entries", ()))
+
+    def record(self, key: str | None, title: str, video_ids: Iterable[str]) -> None:
+        """Add downloaded entries and stamp the sync time, even when nothing was new."""
+        if not key:
+            return
+        with self._lock:
+            playlists = self._load()
+            entry = playlists.get(key, {})
+            known = list(entry.get("entries", ()))
+            seen = set(known)
+            for video_id in video_ids:
+                if video_id and video_id not in seen:
+                    seen.add(video_id)
+                    known.append(video_id)
+            playlists[key] = {
+                "title": title or str(entry.get("title") or ""),
+                "synced_at": self._clock(),
+                "entries": known[-MAX_KNOWN_ENTRIES_PER_PLAYLIST:],
+            }
+            self._save(playlists)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._playlists is not None:
+            return self._playlists
+        playlists: dict[str, dict[str, Any]] = {}
+        stored = load_json_document(self.path, PLAYLIST_SYNC_SCHEMA_VERSION)
+        if stored is not None and isinstance(stored.get("playlists"), dict):
+            playlists = {
+                key: {
+                    **entry,
+                    "entries": [item for item in entry["entries"] if isinstance(item, str)],
+                }
+                for key, entry in stored["playlists"].items()
+                if isinstance(entry, dict) and isinstance(entry.get("entries"), list)
+            }
+        self._playlists = playlists
+        return playlists
+
+    def _save(self, playlists: dict[str, dict[str, Any]]) -> None:
+        # Without the file the next sync simply lists and checks every entry again.
+        save_json_document(self.path, PLAYLIST_SYNC_SCHEMA_VERSION, {"playlists": playlists})
+
+
+_DEFAULT_STORE: PlaylistSyncStore | None = None
+_DEFAULT_STORE_LOCK = threading.Lock()
+
+
+def get_playlist_sync_store() -> PlaylistSyncStore:
+    global _DEFAULT_STORE
+    with _DEFAULT_STORE_LOCK:
+        if _DEFAULT_STORE is None:
+            _DEFAULT_STORE = PlaylistSyncStore(app_data_dir() / PLAYLIST_SYNC_FILENAME)
+        return _DEFAULT_STORE
+
+
+__all__ = [
+    "KNOWN_ENTRY_STREAK",
+    "PLAYLIST_SYNC_FILENAME",
+    "PlaylistSyncStore",
+    "get_playlist_sync_store",
+    "lists_newest_first",
+    "playlist_sync_key",
+    "sync_listing_url",
+]
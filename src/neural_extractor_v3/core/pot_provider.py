@@ -2,7 +2,8 @@
 
 The helper is a separately installed program.  Neural Extractor verifies an
 explicit activation manifest and the complete helper package before every
-launch, starts only the manifest-pinned command with ``shell=False``, and
+launch (rehashing only files whose stat identity changed, plus a periodic full
+rehash), starts only the manifest-pinned command with ``shell=False``, and
 exchanges one bounded JSON request/response through anonymous pipes.  No
 third-party provider module is imported into Neural Extractor or its yt-dlp
 worker.
@@ -15,13 +16,17 @@ a legal conclusion about whether the programs are separate works.
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import os
 import re
 import stat
 import threading
-from collections.abc import Mapping, Sequence
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path, PurePosixPath
@@ -30,6 +35,7 @@ from uuid import uuid4
 
 from neural_extractor_v3.config import app_data_dir, base_dir
 from neural_extractor_v3.core.process_control import (
+    OwnedProcessSession,
     OwnedProcessSupervisor,
     ProcessCancelledError,
     ProcessControlError,
@@ -47,6 +53,9 @@ PROTOCOL_NAME = "neural-extractor.po-helper"
 PROTOCOL_VERSION = 1
 PROVIDER_EXTRACTOR_KEY = "youtubepot-neuralextractorexternalhelper"
 PROVIDER_CAPABILITY = "mweb.gvs"
+SESSION_CAPABILITY = "session.framed"
+SESSION_TRANSPORT_ENVIRONMENT = "NEURAL_EXTRACTOR_PO_HELPER_TRANSPORT"
+SESSION_TRANSPORT = "framed-v1"
 
 MAX_MANIFEST_BYTES = 8 * 1024 * 1024
 MAX_PACKAGE_FILES = 20_000
@@ -58,6 +67,12 @@ MAX_TOKEN_LENGTH = 32 * 1024
 HELLO_TIMEOUT_SECONDS = 8.0
 GENERATION_TIMEOUT_SECONDS = 30.0
 TERMINATION_GRACE_SECONDS = 2.0
+SESSION_IDLE_TIMEOUT_SECONDS = 120.0
+MAX_SESSION_REQUESTS_IN_FLIGHT = 8
+MAX_CACHED_TOKENS = 256
+TOKEN_EXPIRY_MARGIN_SECONDS = 5 * 60
+UNDATED_TOKEN_TTL_SECONDS = 30 * 60
+FULL_VERIFICATION_INTERVAL_SECONDS = 15 * 60.0
 
 _SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
 _VERSION_PATTERN = re.compile(r"0|[1-9]\d*(?:\.(?:0|[1-9]\d*)){2}(?:[-+][0-9A-Za-z.-]+)?")
@@ -65,6 +80,9 @@ _TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]+={0,2}")
 _SAFE_ERROR_CODE_PATTERN = re.compile(r"[a-z][a-z0-9_]{0,63}")
 
 
+_FileIdentity = tuple[int, int, int, int, int]
+
+
 class ExternalPoHelperError(RuntimeError):
     """A fail-closed helper error carrying only a non-sensitive code."""
 
@@ -135,9 +153,19 @@ class ExternalPoTokenHelper:
         self.application_root = Path(application_root or base_dir()).resolve()
         self._active_lock = threading.Lock()
         self._active_supervisor: OwnedProcessSupervisor | None = None
+        self._status_identity: tuple[int, ...] | None = None
+        self._session_supported = False
+        self._session_lock = threading.Lock()
+        self._session: _HelperSession | None = None
+        self._atexit_registered = False
+        self._tokens = _PoTokenCache()
 
     @cached_property
     def status(self) -> PoTokenProviderStatus:
+        self._status_identity = self._manifest_identity()
+        self._session_supported = False
+        self.close_session()
+        self._tokens.clear()
         try:
             package = verify_helper_package(
                 self.activation_manifest,
@@ -155,6 +183,7 @@ class ExternalPoTokenHelper:
                 or result.get("provider_version") != package.provider_version
             ):
                 raise ExternalPoHelperError("unsupported_helper_capability")
+            self._session_supported = SESSION_CAPABILITY in capabilities
         except ExternalPoHelperError as exc:
             installed = exc.code != "helper_not_installed"
             detail = {
@@ -196,7 +225,19 @@ class ExternalPoTokenHelper:
         )
 
     def refresh_status(self) -> PoTokenProviderStatus:
-        """Re-check a manual install or removal without restarting the app."""
+        """Re-check a manual install or removal without restarting the app.
+
+        A ready or absent helper whose activation manifest is unchanged keeps
+        its status, so later jobs skip the package hash and ``hello`` launch.
+        Every token request still re-verifies the package before it runs.
+        """
+        cached = self.__dict__.get("status")
+        if (
+            cached is not None
+            and (cached.available or not cached.installed)
+            and self._status_identity == self._manifest_identity()
+        ):
+            return cached
         self.__dict__.pop("status", None)
         return self.status
 
@@ -229,7 +270,11 @@ class ExternalPoTokenHelper:
         authenticated: bool,
         bypass_cache: bool,
     ) -> tuple[str, int | None]:
-        """Request one token through stdin/stdout without logging its payload."""
+        """Request one token through stdin/stdout without logging its payload.
+
+        Tokens are cached in memory per binding until shortly before
+        ``expires_at``; ``bypass_cache`` always asks the helper again.
+        """
         if context != "gvs" or client_name != "MWEB":
             raise ExternalPoHelperError("unsupported_helper_request")
         if (
@@ -255,7 +300,20 @@ class ExternalPoTokenHelper:
             "authenticated": bool(authenticated),
             "bypass_cache": bool(bypass_cache),
         }
-        response = self._invoke("generate", payload, timeout=GENERATION_TIMEOUT_SECONDS)
+        cache_key = _token_cache_key(payload)
+        with self._tokens.single_flight(cache_key):
+            cached = None if bypass_cache else self._tokens.get(cache_key)
+            if cached is not None:
+                return cached
+            token, expires_at = self._request_token(payload)
+            self._tokens.put(cache_key, token, expires_at)
+        return token, expires_at
+
+    def _request_token(self, payload: Mapping[str, Any]) -> tuple[str, int | None]:
+        if self._session_supported:
+            response = self._session_invoke("generate", payload, timeout=GENERATION_TIMEOUT_SECONDS)
+        else:
+            response = self._invoke("generate", payload, timeout=GENERATION_TIMEOUT_SECONDS)
         result = _require_object(response.get("result"), "invalid_generate_response")
         if set(result) != {"expires_at", "po_token"}:
             raise ExternalPoHelperError("invalid_generate_response")
@@ -274,33 +332,86 @@ class ExternalPoTokenHelper:
         return token, expires_at
 
     def cancel(self) -> None:
-        """Cancel the active helper and let its supervisor clean the whole tree."""
+        """Cancel the active helper and let its supervisor clean the whole tree.
+
+        An idle persistent session has nothing to cancel and stays warm; one
+        with requests in flight is terminated.
+        """
         with self._active_lock:
             supervisor = self._active_supervisor
         if supervisor is not None:
             supervisor.cancel()
+        with self._session_lock:
+            session = self._session
+        if session is not None and session.in_flight():
+            session.fail("helper_cancelled")
+
+    def close_session(self) -> None:
+        """Shut down the persistent helper session, if one is running."""
+        with self._session_lock:
+            session = self._session
+            self._session = None
+        if session is not None:
+            session.close()
+
+    def _session_invoke(
+        self,
+        action: str,
+        payload: Mapping[str, Any],
+        *,
+        timeout: float,
+    ) -> dict[str, Any]:
+        """Send one request over the shared session, restarting it once after a crash."""
+        for attempt in range(2):
+            session = self._running_session()
+            request_id, request_bytes = _encode_request(action, payload)
+            try:
+                document = session.request(request_id, request_bytes, timeout=timeout)
+            except ExternalPoHelperError as exc:
+                if exc.code == "helper_process_failed" and attempt == 0:
+                    continue
+                raise
+            _validate_response_envelope(
+                document,
+                request_id=request_id,
+                package=session.package,
+            )
+            return document
+        raise ExternalPoHelperError("helper_process_failed")
+
+    def _running_session(self) -> _HelperSession:
+        with self._session_lock:
+            session = self._session
+            if session is not None and session.alive:
+                return session
+            package = verify_helper_package(
+                self.activation_manifest,
+                application_root=self.application_root,
+            )
+            session = _HelperSession(package)
+            try:
+                session.start()
+            except ProcessLaunchError:
+                raise ExternalPoHelperError("helper_launch_failed") from None
+            self._session = session
+            if not self._atexit_registered:
+                atexit.register(self.close_session)
+                self._atexit_registered = True
+            return session
+
+    def _manifest_identity(self) -> tuple[int, ...] | None:
+        try:
+            info = self.activation_manifest.stat()
+        except OSError:
+            return None
+        return (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns)
 
     def _invoke(self, action: str, payload: Mapping[str, Any], *, timeout: float) -> dict[str, Any]:
         package = verify_helper_package(
             self.activation_manifest,
             application_root=self.application_root,
         )
-        request_id = uuid4().hex
-        request = {
-            "protocol": PROTOCOL_NAME,
-            "protocol_version": PROTOCOL_VERSION,
-            "request_id": request_id,
-            "action": action,
-            "payload": dict(payload),
-        }
-        request_bytes = json.dumps(
-            request,
-            ensure_ascii=True,
-            separators=(",", ":"),
-            sort_keys=True,
-        ).encode("utf-8")
-        if len(request_bytes) > MAX_PROTOCOL_BYTES:
-            raise ExternalPoHelperError("request_too_large")
+        request_id, request_bytes = _encode_request(action, payload)
 
         output_size = 0
         output_limit_hit = threading.Event()
@@ -375,6 +486,297 @@ class ExternalPoTokenHelper:
         return document
 
 
+class _PendingResponse:
+    __slots__ = ("document", "done", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.document: dict[str, Any] | None = None
+        self.error = ""
+
+
+class _HelperSession:
+    """One persistent helper process multiplexing framed requests by request ID.
+
+    Each frame in either direction is the ASCII decimal byte length, ``LF``,
+    then exactly that many bytes of the protocol's JSON envelope.  Any protocol
+    violation, stderr output, crash, timeout, or cancellation fails every
+    request in flight and terminates the owned tree; the helper object starts a
+    fresh session for the next request.  The session shuts itself down after
+    ``SESSION_IDLE_TIMEOUT_SECONDS`` without requests.
+
+    The session belongs to the process that owns the helper object, normally
+    one yt-dlp worker.  A worker runs one attempt at a time, so requests are
+    multiplexed only within that attempt and a cancellation fails only that
+    worker's requests; other workers keep their own sessions.
+    """
+
+    def __init__(
+        self,
+        package: VerifiedHelperPackage,
+        *,
+        idle_timeout: float = SESSION_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.package = package
+        self.idle_timeout = idle_timeout
+        environment = _helper_environment(package.root)
+        environment[SESSION_TRANSPORT_ENVIRONMENT] = SESSION_TRANSPORT
+        self._process = OwnedProcessSession(
+            package.command,
+            limits=ProcessLimits(
+                termination_grace=TERMINATION_GRACE_SECONDS,
+                force_kill_wait=TERMINATION_GRACE_SECONDS,
+                pipe_join_timeout=TERMINATION_GRACE_SECONDS,
+            ),
+            cwd=package.root,
+            env=environment,
+            ownership_record=app_data_dir()
+            / "process-state"
+            / f"active-po-helper-session-{os.getpid()}-{uuid4().hex[:8]}.json",
+        )
+        self._lock = threading.Lock()
+        self._pending: dict[str, _PendingResponse] = {}
+        self._buffer = bytearray()
+        self._failure = ""
+        self._idle_timer: threading.Timer | None = None
+
+    @property
+    def alive(self) -> bool:
+        return not self._failure and self._process.alive
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def start(self) -> None:
+        self._process.start()
+        self._process.stream(self._on_stdout, self._on_stderr)
+        self._schedule_idle_shutdown()
+
+    def request(self, request_id: str, request_bytes: bytes, *, timeout: float) -> dict[str, Any]:
+        pending = _PendingResponse()
+        with self._lock:
+            if self._failure:
+                raise ExternalPoHelperError("helper_process_failed")
+            if len(self._pending) >= MAX_SESSION_REQUESTS_IN_FLIGHT:
+                raise ExternalPoHelperError("helper_busy")
+            self._pending[request_id] = pending
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        try:
+            try:
+                self._process.write(b"%d\n" % len(request_bytes) + request_bytes)
+            except OSError:
+                self.fail("helper_process_failed")
+            deadline = time.monotonic() + timeout
+            while not pending.done.wait(0.05):
+                if not self._process.alive:
+                    self.fail("helper_process_failed")
+                elif time.monotonic() >= deadline:
+                    self.fail("helper_timeout")
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            self._schedule_idle_shutdown()
+        if pending.error or pending.document is None:
+            raise ExternalPoHelperError(pending.error or "helper_process_failed")
+        return pending.document
+
+    def fail(self, code: str) -> None:
+        """Fail every request in flight with ``code`` and terminate the helper."""
+        with self._lock:
+            if not self._failure:
+                self._failure = code
+            waiting = list(self._pending.values())
+        for pending in waiting:
+            if not pending.done.is_set():
+                pending.error = code
+                pending.done.set()
+        # Output callbacks run on the reader threads, which close() joins.
+        threading.Thread(
+            target=self._process.close,
+            name="po-helper-session-close",
+            daemon=True,
+        ).start()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._failure:
+                self._failure = "helper_cancelled"
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        self._process.close()
+
+    def _schedule_idle_shutdown(self) -> None:
+        with self._lock:
+            if self._failure or self._pending or self._idle_timer is not None:
+                return
+            timer = threading.Timer(self.idle_timeout, self._close_if_idle)
+            timer.daemon = True
+            self._idle_timer = timer
+        timer.start()
+
+    def _close_if_idle(self) -> None:
+        with self._lock:
+            self._idle_timer = None
+            if self._pending:
+                return
+        self.close()
+
+    def _on_stderr(self, text: str) -> None:
+        if text.strip():
+            # Never surface helper stderr: it could contain token or binding material.
+            self.fail("helper_protocol_violation")
+
+    def _on_stdout(self, text: str) -> None:
+        frames: list[bytes] = []
+        with self._lock:
+            if self._failure:
+                return
+            self._buffer.extend(text.encode("utf-8", errors="replace"))
+            while True:
+                newline = self._buffer.find(b"\n", 0, 16)
+                if newline < 0:
+                    violation = len(self._buffer) >= 16
+                    break
+                header = bytes(self._buffer[:newline])
+                if not header.isdigit() or int(header) > MAX_PROTOCOL_BYTES:
+                    violation = True
+                    break
+                end = newline + 1 + int(header)
+                if len(self._buffer) < end:
+                    violation = False
+                    break
+                frames.append(bytes(self._buffer[newline + 1 : end]))
+                del self._buffer[:end]
+        if violation:
+            self.fail("helper_protocol_violation")
+            return
+        for frame in frames:
+            self._deliver(frame)
+
+    def _deliver(self, frame: bytes) -> None:
+        try:
+            document = json.loads(frame.decode("utf-8"), object_pairs_hook=_unique_object)
+        except (json.JSONDecodeError, UnicodeError, ValueError):
+            self.fail("invalid_helper_json")
+            return
+        request_id = document.get("request_id") if isinstance(document, dict) else None
+        with self._lock:
+            pending = self._pending.get(request_id) if isinstance(request_id, str) else None
+        if pending is None or pending.done.is_set():
+            self.fail("helper_protocol_violation")
+            return
+        pending.document = document
+        pending.done.set()
+
+
+class _PoTokenCache:
+    """In-memory PO tokens keyed by a digest of their binding, never persisted.
+
+    Entries are served until ``TOKEN_EXPIRY_MARGIN_SECONDS`` before their
+    ``expires_at``; tokens without an expiry are kept for
+    ``UNDATED_TOKEN_TTL_SECONDS``.  A lock per in-flight binding lets concurrent
+    requests for the same binding wait for one helper round-trip instead of
+    racing, without holding up requests for other bindings.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = MAX_CACHED_TOKENS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, str, int | None]] = OrderedDict()
+        self._flights: dict[str, tuple[threading.Lock, int]] = {}
+
+    @contextmanager
+    def single_flight(self, key: str) -> Iterator[None]:
+        with self._lock:
+            flight, waiters = self._flights.get(key, (None, 0))
+            if flight is None:
+                flight = threading.Lock()
+            self._flights[key] = (flight, waiters + 1)
+        try:
+            with flight:
+                yield
+        finally:
+            with self._lock:
+                _, waiters = self._flights[key]
+                if waiters <= 1:
+                    del self._flights[key]
+                else:
+                    self._flights[key] = (flight, waiters - 1)
+
+    def get(self, key: str) -> tuple[str, int | None] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            serve_until, token, expires_at = entry
+            if self._clock() >= serve_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return token, expires_at
+
+    def put(self, key: str, token: str, expires_at: int | None) -> None:
+        now = self._clock()
+        if expires_at is None:
+            serve_until = now + UNDATED_TOKEN_TTL_SECONDS
+        else:
+            serve_until = float(expires_at) - TOKEN_EXPIRY_MARGIN_SECONDS
+        with self._lock:
+            if serve_until <= now:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (serve_until, token, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _token_cache_key(payload: Mapping[str, Any]) -> str:
+    identity = [
+        payload["context"],
+        payload["client_name"],
+        payload["content_binding_type"],
+        payload["content_binding"],
+        bool(payload["authenticated"]),
+    ]
+    encoded = json.dumps(identity, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _encode_request(action: str, payload: Mapping[str, Any]) -> tuple[str, bytes]:
+    request_id = uuid4().hex
+    request = {
+        "protocol": PROTOCOL_NAME,
+        "protocol_version": PROTOCOL_VERSION,
+        "request_id": request_id,
+        "action": action,
+        "payload": dict(payload),
+    }
+    request_bytes = json.dumps(
+        request,
+        ensure_ascii=True,
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode("utf-8")
+    if len(request_bytes) > MAX_PROTOCOL_BYTES:
+        raise ExternalPoHelperError("request_too_large")
+    return request_id, request_bytes
+
+
 def verify_helper_package(
     activation_manifest: Path,
     *,
@@ -525,10 +927,16 @@ def verify_helper_package(
     ):
         raise ExternalPoHelperError("package_integrity_failed")
 
+    full_verification = _VERIFIED_FILES.full_verification_due(root)
     package_digest = hashlib.sha256()
     for item in files:
         path = root / Path(*PurePosixPath(item.relative_path).parts)
-        _verify_file(path, expected_size=item.size, expected_sha256=item.sha256)
+        _verify_file(
+            path,
+            expected_size=item.size,
+            expected_sha256=item.sha256,
+            trust_unchanged=not full_verification,
+        )
         package_digest.update(item.relative_path.encode("utf-8"))
         package_digest.update(b"\0")
         package_digest.update(str(item.size).encode("ascii"))
@@ -537,6 +945,8 @@ def verify_helper_package(
         package_digest.update(b"\n")
     if package_digest.hexdigest() != expected_package_hash:
         raise ExternalPoHelperError("package_integrity_failed")
+    if full_verification:
+        _VERIFIED_FILES.mark_full_verification(root)
 
     entrypoint = root / Path(*PurePosixPath(entrypoint_relative).parts)
     if not entrypoint.is_file() or _is_reparse_point(entrypoint):
@@ -666,42 +1076,56 @@ def options_request_po_provider(options: Mapping[str, Any]) -> bool:
     )
 
 
-def redact_po_token_material(value: str) -> str:
-    """Remove token, binding, session, and credential material from diagnostics."""
-    text = str(value or "")
-    names = (
-        r"(?:po_?token|potoken|integrity_?token|visitor_?data|data_?sync_?id|"
-        r"content_?binding|authorization|cookie)"
-    )
-    text = re.sub(
-        rf"(?i)([\"']?{names}[\"']?\s*[:=]\s*)([\"'])(.*?)(\2)",
+_SECRET_NAMES = (
+    r"(?:po_?token|potoken|integrity_?token|visitor_?data|data_?sync_?id|"
+    r"content_?binding|authorization|cookie)"
+)
+# Every redaction below needs one of these substrings, matched with the same
+# case-insensitive rules, so text without any of them is returned unchanged.
+_SECRET_MARKERS = ("token", "pot", "visitor", "sync", "binding", "authorization", "cookie")
+_SECRET_MARKER_PATTERN = re.compile("(?i)" + "|".join(_SECRET_MARKERS))
+# Applied in order; a later pass sees the output of the earlier ones.
+_SECRET_REDACTIONS = (
+    (
+        re.compile(rf"(?i)([\"']?{_SECRET_NAMES}[\"']?\s*[:=]\s*)([\"'])(.*?)(\2)"),
         r"\1\2<redacted>\4",
-        text,
-    )
-    text = re.sub(
-        rf"(?i)(\b{names}\b\s*[:=]\s*)(?!<redacted>)[^\s,;)&\]}}]+",
+    ),
+    (
+        re.compile(rf"(?i)(\b{_SECRET_NAMES}\b\s*[:=]\s*)(?!<redacted>)[^\s,;)&\]}}]+"),
         r"\1<redacted>",
-        text,
-    )
-    text = re.sub(
-        r"(?i)(generated\s+(?:a\s+)?(?:po\s*token|pot)\s*[:=]\s*)\S+",
+    ),
+    (
+        re.compile(r"(?i)(generated\s+(?:a\s+)?(?:po\s*token|pot)\s*[:=]\s*)\S+"),
         r"\1<redacted>",
-        text,
-    )
-    text = re.sub(
-        r"(?i)(PoTokenResponse\s*\(\s*po_token\s*=\s*)([^,)]+)",
+    ),
+    (
+        re.compile(r"(?i)(PoTokenResponse\s*\(\s*po_token\s*=\s*)([^,)]+)"),
         r"\1<redacted>",
-        text,
-    )
-    text = re.sub(
-        r"(?i)(/pot/)[A-Za-z0-9._~%+\-=]{8,}",
-        r"\1<redacted>",
-        text,
-    )
-    text = re.sub(r"(?i)([?&]pot=)[^&#\s]+", r"\1<redacted>", text)
+    ),
+    (re.compile(r"(?i)(/pot/)[A-Za-z0-9._~%+\-=]{8,}"), r"\1<redacted>"),
+    (re.compile(r"(?i)([?&]pot=)[^&#\s]+"), r"\1<redacted>"),
+)
+
+
+def redact_po_token_material(value: str) -> str:
+    """Remove token, binding, session, and credential material from diagnostics."""
+    text = str(value or "")
+    if not _may_contain_secret(text):
+        return text
+    for pattern, replacement in _SECRET_REDACTIONS:
+        text = pattern.sub(replacement, text)
     return text
 
 
+def _may_contain_secret(text: str) -> bool:
+    if text.isascii():
+        # Plain lowercase containment is far cheaper than the regex and, for
+        # ASCII, folds case exactly as the case-insensitive patterns do.
+        folded = text.lower()
+        return any(marker in folded for marker in _SECRET_MARKERS)
+    return _SECRET_MARKER_PATTERN.search(text) is not None
+
+
 def _validate_response_envelope(
     document: dict[str, Any],
     *,
@@ -829,15 +1253,75 @@ def _helper_environment(package_root: Path) -> dict[str, str]:
     return environment
 
 
-def _verify_file(path: Path, *, expected_size: int, expected_sha256: str) -> None:
+class _VerifiedFileCache:
+    """Remember package files that hashed correctly, keyed on their stat identity.
+
+    A file is only trusted without rehashing while its device, inode, size,
+    mtime and ctime are all unchanged; restoring a forged mtime still moves
+    ctime.  Each package root is fully rehashed at least every
+    ``FULL_VERIFICATION_INTERVAL_SECONDS``.
+    """
+
+    def __init__(self, *, full_interval: float = FULL_VERIFICATION_INTERVAL_SECONDS) -> None:
+        self.full_interval = full_interval
+        self._lock = threading.Lock()
+        self._files: dict[Path, tuple[_FileIdentity, str]] = {}
+        self._full_verified_at: dict[Path, float] = {}
+
+    def full_verification_due(self, root: Path) -> bool:
+        with self._lock:
+            verified_at = self._full_verified_at.get(root)
+        return verified_at is None or time.monotonic() - verified_at >= self.full_interval
+
+    def mark_full_verification(self, root: Path) -> None:
+        with self._lock:
+            self._full_verified_at[root] = time.monotonic()
+
+    def is_verified(self, path: Path, identity: _FileIdentity, sha256: str) -> bool:
+        with self._lock:
+            return self._files.get(path) == (identity, sha256)
+
+    def remember(self, path: Path, identity: _FileIdentity, sha256: str) -> None:
+        with self._lock:
+            self._files[path] = (identity, sha256)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._full_verified_at.clear()
+
+
+_VERIFIED_FILES = _VerifiedFileCache()
+
+
+def _file_identity(info: os.stat_result) -> _FileIdentity:
+    return (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns, info.st_ctime_ns)
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        while chunk := stream.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _verify_file(
+    path: Path,
+    *,
+    expected_size: int,
+    expected_sha256: str,
+    trust_unchanged: bool = False,
+) -> None:
     try:
         before = path.stat()
         if not path.is_file() or _is_reparse_point(path) or before.st_size != expected_size:
             raise ExternalPoHelperError("package_integrity_failed")
-        digest = hashlib.sha256()
-        with path.open("rb") as stream:
-            while chunk := stream.read(1024 * 1024):
-                digest.update(chunk)
+        if trust_unchanged and _VERIFIED_FILES.is_verified(
+            path, _file_identity(before), expected_sha256
+        ):
+            return
+        actual_sha256 = _sha256_file(path)
         after = path.stat()
     except ExternalPoHelperError:
         raise
@@ -846,9 +1330,11 @@ def _verify_file(path: Path, *, expected_size: int, expected_sha256: str) -> Non
     if (
         before.st_size != after.st_size
         or before.st_mtime_ns != after.st_mtime_ns
-        or digest.hexdigest() != expected_sha256
+        or actual_sha256 != expected_sha256
     ):
         raise ExternalPoHelperError("package_integrity_failed")
+    if _file_identity(before) == _file_identity(after):
+        _VERIFIED_FILES.remember(path, _file_identity(after), expected_sha256)
 
 
 def _validate_relative_path(value: Any) -> str:
@@ -946,6 +1432,7 @@ __all__ = [
     "PROVIDER_VERSION",
     "PoTokenProvider",
     "PoTokenProviderStatus",
+    "SESSION_CAPABILITY",
     "VerifiedHelperPackage",
     "configure_yt_dlp_plugins",
     "get_po_token_provider",
@@ -22,9 +22,11 @@ import json
 import os
 import signal
 import subprocess
+import tempfile
 import threading
 import time
 import uuid
+from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
@@ -38,6 +40,9 @@ DEFAULT_TERMINATION_GRACE_SECONDS = 3.0
 DEFAULT_FORCE_KILL_WAIT_SECONDS = 3.0
 DEFAULT_POLL_INTERVAL_SECONDS = 0.1
 DEFAULT_PIPE_JOIN_TIMEOUT_SECONDS = 2.0
+DEFAULT_RETAINED_HEAD_CHARS = 64 * 1024
+DEFAULT_RETAINED_TAIL_CHARS = 192 * 1024
+DEFAULT_SPILL_MAX_BYTES = 64 * 1024 * 1024
 OWNERSHIP_RECORD_SCHEMA = 1
 
 OutputCallback = Callable[[str], None]
@@ -104,6 +109,40 @@ class ProcessLimits:
                 raise ValueError(f"{name} must be a positive number")
 
 
+class OutputRetentionMode(str, Enum):
+    """How much child output a finished :class:`ProcessResult` carries."""
+
+    ALL = "all"
+    NONE = "none"
+    HEAD_TAIL = "head_tail"
+    SPILL = "spill"
+
+
+@dataclass(frozen=True, slots=True)
+class OutputRetention:
+    """Bound the output kept for ``ProcessResult`` while callbacks see every chunk.
+
+    ``ALL`` keeps everything, as one-shot helpers that parse stdout need.
+    ``NONE`` keeps nothing.  ``HEAD_TAIL`` keeps the first ``head_chars`` and
+    the last ``tail_chars`` of each stream with an omission marker between
+    them.  ``SPILL`` additionally writes the stream to a file in
+    ``spill_directory`` (the system temp folder by default) until
+    ``spill_max_bytes`` have been written; the caller owns that file.
+    """
+
+    mode: OutputRetentionMode = OutputRetentionMode.ALL
+    head_chars: int = DEFAULT_RETAINED_HEAD_CHARS
+    tail_chars: int = DEFAULT_RETAINED_TAIL_CHARS
+    spill_directory: Path | None = None
+    spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES
+
+    def __post_init__(self) -> None:
+        for name in ("head_chars", "tail_chars", "spill_max_bytes"):
+            value = getattr(self, name)
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"{name} must be a non-negative integer")
+
+
 @dataclass(frozen=True, slots=True)
 class ProcessStatus:
     """A lifecycle transition or periodic active heartbeat."""
@@ -126,6 +165,8 @@ class ProcessResult:
     stderr: str
     elapsed_seconds: float
     forced_kill: bool = False
+    stdout_spill_path: Path | None = None
+    stderr_spill_path: Path | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -260,7 +301,9 @@ class OwnedProcessSupervisor:
     Explicit cancellation sets the shared ``cancellation_event``.  A timeout
     never sets that event, so a timed-out attempt cannot poison a later retry or
     job.  Call :meth:`reset` only when beginning a new job after cancellation,
-    or create a fresh supervisor per job/attempt.
+    or create a fresh supervisor per job/attempt.  ``retention`` bounds how much
+    output the returned :class:`ProcessResult` keeps; callbacks always see all
+    of it.
     """
 
     def __init__(
@@ -270,9 +313,11 @@ class OwnedProcessSupervisor:
         cancellation_event: threading.Event | None = None,
         ownership_record: str | os.PathLike[str] | None = None,
         hide_window: bool = True,
+        retention: OutputRetention | None = None,
     ) -> None:
         self.limits = limits or ProcessLimits()
         self.cancellation_event = cancellation_event or threading.Event()
+        self.retention = retention or OutputRetention()
         self.ownership_record = Path(ownership_record) if ownership_record is not None else None
         self.hide_window = hide_window
         self._state_lock = threading.Lock()
@@ -335,8 +380,8 @@ class OwnedProcessSupervisor:
         started_at = time.monotonic()
         process: subprocess.Popen[bytes] | None = None
         identity: _ProcessIdentity | None = None
-        stdout_parts: list[str] = []
-        stderr_parts: list[str] = []
+        stdout_parts = _RetainedOutput(self.retention, "stdout")
+        stderr_parts = _RetainedOutput(self.retention, "stderr")
         reader_threads: list[threading.Thread] = []
         stdin_thread: threading.Thread | None = None
         outcome = ProcessOutcome.EXITED
@@ -406,7 +451,6 @@ class OwnedProcessSupervisor:
                 stdin_thread = _start_stdin_writer(process.stdin, payload, process.pid)
 
             _emit_status(status_callback, process.pid, ProcessPhase.STARTED, 0.0, 0.0)
-            next_status_at = started_at + self.limits.status_interval
 
             # The total-timeout clock intentionally runs from ``started_at``, but
             # inactivity must only measure the monitored window. Arm it here, now
@@ -417,57 +461,15 @@ class OwnedProcessSupervisor:
             # for inactivity it never caused.
             activity.arm(time.monotonic())
 
-            while True:
-                returncode = process.poll()
-                if returncode is not None:
-                    break
-
-                now = time.monotonic()
-                elapsed = max(0.0, now - started_at)
-                inactive = activity.inactive_for(now)
-
-                if self._is_cancelled(cancel_requested):
-                    outcome = ProcessOutcome.CANCELLED
-                    _emit_status(
-                        status_callback,
-                        process.pid,
-                        ProcessPhase.CANCELLING,
-                        elapsed,
-                        inactive,
-                    )
-                    break
-                if elapsed >= self.limits.total_timeout:
-                    outcome = ProcessOutcome.TOTAL_TIMEOUT
-                    _emit_status(
-                        status_callback,
-                        process.pid,
-                        ProcessPhase.TOTAL_TIMEOUT,
-                        elapsed,
-                        inactive,
-                    )
-                    break
-                if inactive >= self.limits.inactivity_timeout:
-                    outcome = ProcessOutcome.INACTIVITY_TIMEOUT
-                    _emit_status(
-                        status_callback,
-                        process.pid,
-                        ProcessPhase.INACTIVITY_TIMEOUT,
-                        elapsed,
-                        inactive,
-                    )
-                    break
-
-                if now >= next_status_at:
-                    _emit_status(
-                        status_callback,
-                        process.pid,
-                        ProcessPhase.ACTIVE,
-                        elapsed,
-                        inactive,
-                    )
-                    next_status_at = now + self.limits.status_interval
-
-                self.cancellation_event.wait(self.limits.poll_interval)
+            outcome = _monitor_owned_process(
+                process,
+                self.limits,
+                started_at=started_at,
+                activity=activity,
+                status_callback=status_callback,
+                is_cancelled=lambda: self._is_cancelled(cancel_requested),
+                wait_event=self.cancellation_event,
+            )
 
             if outcome != ProcessOutcome.EXITED and process.poll() is None:
                 forced_kill = _terminate_owned_process_tree(process, identity, self.limits)
@@ -509,10 +511,12 @@ class OwnedProcessSupervisor:
             pid=pid,
             returncode=returncode,
             outcome=outcome,
-            stdout="".join(stdout_parts),
-            stderr="".join(stderr_parts),
+            stdout=stdout_parts.text(),
+            stderr=stderr_parts.text(),
             elapsed_seconds=elapsed,
             forced_kill=forced_kill,
+            stdout_spill_path=stdout_parts.close(),
+            stderr_spill_path=stderr_parts.close(),
         )
         if pid is not None:
             _emit_status(
@@ -593,6 +597,413 @@ class OwnedProcessSupervisor:
         _atomic_write_json(self.ownership_record, record.to_dict())
 
 
+class OwnedProcessSession:
+    """Keep one owned child alive across several newline-framed stdin requests.
+
+    The child is launched, recorded, and terminated exactly like a supervised
+    one-shot process, but its stdin stays open between requests.  Each
+    :meth:`request` writes one frame and monitors the child with the same
+    inactivity, total-timeout, and cancellation rules until ``completed``
+    reports an exit code.  Cancellation or a timeout terminates the whole
+    owned tree and the session cannot be reused afterwards.
+    """
+
+    def __init__(
+        self,
+        args: Sequence[str | os.PathLike[str]],
+        *,
+        limits: ProcessLimits | None = None,
+        cwd: str | os.PathLike[str] | None = None,
+        env: Mapping[str, str] | None = None,
+        ownership_record: str | os.PathLike[str] | None = None,
+        hide_window: bool = True,
+    ) -> None:
+        self.command = _validate_command(args)
+        self.limits = limits or ProcessLimits()
+        self.ownership_record = Path(ownership_record) if ownership_record is not None else None
+        self._launcher = OwnedProcessSupervisor(
+            self.limits,
+            ownership_record=self.ownership_record,
+            hide_window=hide_window,
+        )
+        self._cwd = cwd
+        self._env = dict(env) if env is not None else None
+        self._state_lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._identity: _ProcessIdentity | None = None
+        self._reader_threads: list[threading.Thread] = []
+        self._activity = _ActivityClock(time.monotonic())
+        self._stdout = _RoutedOutput()
+        self._stderr = _RoutedOutput()
+        self._write_lock = threading.Lock()
+        self._streaming = False
+        self._busy = False
+        self._closed = False
+        self.requests_served = 0
+
+    @property
+    def pid(self) -> int | None:
+        process = self._process
+        return process.pid if process is not None else None
+
+    @property
+    def alive(self) -> bool:
+        process = self._process
+        return not self._closed and process is not None and process.poll() is None
+
+    def start(self) -> None:
+        """Launch and record the child; raise ``ProcessLaunchError`` on failure."""
+        with self._state_lock:
+            if self._process is not None or self._closed:
+                raise RuntimeError("this session was already started")
+            try:
+                process = self._launcher._spawn(self.command, True, cwd=self._cwd, env=self._env)
+            except OSError as exc:
+                self._closed = True
+                raise ProcessLaunchError(f"Could not launch {self.command[0]}.") from exc
+            identity = _process_identity(process.pid)
+            if identity is None:
+                _terminate_unrecorded_process(process, self.limits)
+                self._closed = True
+                raise ProcessLaunchError(
+                    f"Could not capture creation identity for owned PID {process.pid}."
+                )
+            if self.ownership_record is not None:
+                try:
+                    self._launcher._write_ownership_record(process.pid, identity)
+                except Exception as exc:
+                    _terminate_owned_process_tree(process, identity, self.limits)
+                    self._closed = True
+                    raise ProcessLaunchError(
+                        f"Could not persist ownership for PID {process.pid}; "
+                        "the owned tree was terminated."
+                    ) from exc
+            self._process = process
+            self._identity = identity
+            self._reader_threads = [
+                _start_output_reader(
+                    process.stdout,
+                    self._stdout,
+                    self._stdout.forward,
+                    self._activity,
+                    name=f"owned-session-{process.pid}-stdout",
+                ),
+                _start_output_reader(
+                    process.stderr,
+                    self._stderr,
+                    self._stderr.forward,
+                    self._activity,
+                    name=f"owned-session-{process.pid}-stderr",
+                ),
+            ]
+
+    def stream(
+        self,
+        stdout_callback: OutputCallback | None,
+        stderr_callback: OutputCallback | None = None,
+    ) -> None:
+        """Deliver every output chunk, whitespace included, to the callbacks.
+
+        For children that frame and multiplex their own replies; a streaming
+        session is driven with :meth:`write` and no longer accepts
+        :meth:`request`.
+        """
+        with self._state_lock:
+            if self._busy:
+                raise RuntimeError("a request is in progress")
+            self._streaming = True
+        self._stdout.stream(stdout_callback)
+        self._stderr.stream(stderr_callback)
+
+    def write(self, payload: str | bytes) -> None:
+        """Write raw bytes to the child's stdin; raise ``OSError`` once it is gone."""
+        data = _encode_stdin(payload) or b""
+        process = self._process
+        if process is None or self._closed or process.stdin is None:
+            raise OSError("session is not running")
+        with self._write_lock:
+            try:
+                process.stdin.write(data)
+                process.stdin.flush()
+            except ValueError as exc:
+                raise OSError("session stdin is closed") from exc
+
+    def request(
+        self,
+        payload: str | bytes,
+        *,
+        completed: Callable[[], int | None],
+        cancellation_event: threading.Event | None = None,
+        stdout_callback: OutputCallback | None = None,
+        stderr_callback: OutputCallback | None = None,
+        status_callback: StatusCallback | None = None,
+        cancel_requested: CancelCallback | None = None,
+        retention: OutputRetention | None = None,
+    ) -> ProcessResult:
+        """Send one frame and return once ``completed`` yields an exit code."""
+        frame = _encode_stdin(payload) or b""
+        if not frame.endswith(b"\n"):
+            frame += b"\n"
+        event = cancellation_event or threading.Event()
+
+        def is_cancelled() -> bool:
+            if event.is_set():
+                return True
+            if cancel_requested is None:
+                return False
+            try:
+                return bool(cancel_requested())
+            except Exception:
+                return False
+
+        with self._state_lock:
+            process = self._process
+            identity = self._identity
+            if process is None or identity is None or self._closed or self._busy or self._streaming:
+                raise RuntimeError("this session cannot accept a request")
+            self._busy = True
+
+        started_at = time.monotonic()
+        retention = retention or OutputRetention()
+        stdout_parts = _RetainedOutput(retention, "stdout")
+        stderr_parts = _RetainedOutput(retention, "stderr")
+        outcome = ProcessOutcome.EXITED
+        forced_kill = False
+        returncode: int | None = None
+        try:
+            self._stdout.route(stdout_parts, stdout_callback)
+            self._stderr.route(stderr_parts, stderr_callback)
+            if is_cancelled():
+                outcome = ProcessOutcome.CANCELLED
+            else:
+                _emit_status(status_callback, process.pid, ProcessPhase.STARTED, 0.0, 0.0)
+                try:
+                    if process.stdin is None:
+                        raise OSError("session stdin is not available")
+                    process.stdin.write(frame)
+                    process.stdin.flush()
+                except (OSError, ValueError):
+                    # A child that already died is reported through its exit code.
+                    with contextlib.suppress(subprocess.TimeoutExpired):
+                        process.wait(timeout=self.limits.pipe_join_timeout)
+                self._activity.arm(time.monotonic())
+                outcome = _monitor_owned_process(
+                    process,
+                    self.limits,
+                    started_at=started_at,
+                    activity=self._activity,
+                    status_callback=status_callback,
+                    is_cancelled=is_cancelled,
+                    wait_event=event,
+                    is_complete=lambda: completed() is not None,
+                )
+            if outcome == ProcessOutcome.EXITED:
+                returncode = completed()
+                if returncode is None:
+                    with contextlib.suppress(subprocess.TimeoutExpired):
+                        process.wait(timeout=self.limits.force_kill_wait)
+                    # Let the readers deliver the final frames of a dead child.
+                    _finish_output_readers(
+                        process, self._reader_threads, self.limits.pipe_join_timeout
+                    )
+                    returncode = completed()
+                    if returncode is None:
+                        returncode = process.poll()
+            elif process.poll() is None:
+                forced_kill = _terminate_owned_process_tree(process, identity, self.limits)
+        finally:
+            self._stdout.route(None, None)
+            self._stderr.route(None, None)
+            with self._state_lock:
+                self._busy = False
+                if outcome == ProcessOutcome.EXITED and returncode is not None:
+                    self.requests_served += 1
+            if outcome != ProcessOutcome.EXITED or process.poll() is not None:
+                self.close()
+
+        elapsed = max(0.0, time.monotonic() - started_at)
+        result = ProcessResult(
+            args=self.command,
+            pid=process.pid,
+            returncode=returncode,
+            outcome=outcome,
+            stdout=stdout_parts.text(),
+            stderr=stderr_parts.text(),
+            elapsed_seconds=elapsed,
+            forced_kill=forced_kill,
+            stdout_spill_path=stdout_parts.close(),
+            stderr_spill_path=stderr_parts.close(),
+        )
+        _emit_status(
+            status_callback,
+            process.pid,
+            ProcessPhase.EXITED,
+            elapsed,
+            self._activity.inactive_for(time.monotonic()),
+        )
+        if outcome == ProcessOutcome.CANCELLED:
+            raise ProcessCancelledError("Process cancelled by user.", result)
+        if outcome == ProcessOutcome.INACTIVITY_TIMEOUT:
+            raise ProcessInactivityTimeoutError(
+                f"No meaningful process output for {self.limits.inactivity_timeout:g} seconds.",
+                result,
+            )
+        if outcome == ProcessOutcome.TOTAL_TIMEOUT:
+            raise ProcessTotalTimeoutError(
+                f"Process exceeded the {self.limits.total_timeout:g}-second total limit.",
+                result,
+            )
+        return result
+
+    def close(self) -> None:
+        """Close stdin, allow a graceful exit, then terminate the owned tree."""
+        with self._state_lock:
+            if self._closed and self._process is None:
+                return
+            self._closed = True
+            process = self._process
+            identity = self._identity
+            self._process = None
+        if process is None:
+            return
+        _close_stdin(process.stdin)
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(timeout=self.limits.termination_grace)
+        if process.poll() is None:
+            if identity is not None:
+                _terminate_owned_process_tree(process, identity, self.limits)
+            else:
+                _terminate_unrecorded_process(process, self.limits)
+        _finish_output_readers(process, self._reader_threads, self.limits.pipe_join_timeout)
+        if self.ownership_record is not None and process.poll() is not None:
+            _remove_record(self.ownership_record)
+
+
+class _RoutedOutput:
+    """Reader sink whose destination changes per session request."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._parts: _RetainedOutput | None = None
+        self._callback: OutputCallback | None = None
+        self._stream: OutputCallback | None = None
+
+    def route(self, parts: _RetainedOutput | None, callback: OutputCallback | None) -> None:
+        with self._lock:
+            self._parts = parts
+            self._callback = callback
+
+    def stream(self, callback: OutputCallback | None) -> None:
+        with self._lock:
+            self._stream = callback
+
+    def append(self, text: str) -> None:
+        with self._lock:
+            if self._parts is not None:
+                self._parts.append(text)
+            stream = self._stream
+        _safe_output_callback(stream, text)
+
+    def forward(self, text: str) -> None:
+        with self._lock:
+            callback = self._callback
+        _safe_output_callback(callback, text)
+
+
+class _RetainedOutput:
+    """Reader sink that keeps one stream's output under an :class:`OutputRetention`.
+
+    ``HEAD_TAIL`` and ``SPILL`` hold at most ``head_chars + tail_chars`` plus
+    one reader chunk in memory however long the child runs.
+    """
+
+    def __init__(self, retention: OutputRetention, stream: str) -> None:
+        self._retention = retention
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._head: list[str] = []
+        self._head_chars = 0
+        self._tail: deque[str] = deque()
+        self._tail_chars = 0
+        self._total_chars = 0
+        self._spill: BinaryIO | None = None
+        self._spill_path: Path | None = None
+        self._spilled_bytes = 0
+
+    def append(self, text: str) -> None:
+        mode = self._retention.mode
+        with self._lock:
+            self._total_chars += len(text)
+            if mode == OutputRetentionMode.ALL:
+                self._head.append(text)
+                return
+            if mode == OutputRetentionMode.NONE:
+                return
+            if mode == OutputRetentionMode.SPILL:
+                self._write_spill(text)
+            room = self._retention.head_chars - self._head_chars
+            if room > 0:
+                self._head.append(text[:room])
+                self._head_chars += min(room, len(text))
+                text = text[room:]
+            if text and self._retention.tail_chars:
+                self._tail.append(text)
+                self._tail_chars += len(text)
+                limit = self._retention.tail_chars
+                while self._tail_chars - len(self._tail[0]) >= limit:
+                    self._tail_chars -= len(self._tail.popleft())
+
+    def text(self) -> str:
+        with self._lock:
+            if self._retention.mode == OutputRetentionMode.NONE:
+                return ""
+            head = "".join(self._head)
+            if self._retention.mode == OutputRetentionMode.ALL:
+                return head
+            tail = "".join(self._tail)
+            if self._retention.tail_chars:
+                tail = tail[-self._retention.tail_chars :]
+            else:
+                tail = ""
+            omitted = self._total_chars - len(head) - len(tail)
+            if omitted <= 0:
+                return head + tail
+            return f"{head}\n[... {omitted} characters of output omitted ...]\n{tail}"
+
+    def close(self) -> Path | None:
+        """Close the spill file and return its path, if anything was spilled."""
+        with self._lock:
+            if self._spill is not None:
+                with contextlib.suppress(OSError):
+                    self._spill.close()
+                self._spill = None
+            return self._spill_path
+
+    def _write_spill(self, text: str) -> None:
+        room = self._retention.spill_max_bytes - self._spilled_bytes
+        if room <= 0:
+            return
+        if self._spill is None:
+            if self._spill_path is not None:
+                return  # Already closed; a late reader chunk stays in memory only.
+            directory = self._retention.spill_directory or Path(tempfile.gettempdir())
+            self._spill_path = directory / f"process-output-{uuid.uuid4().hex}.{self._stream}.log"
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                self._spill = open(self._spill_path, "wb")
+            except OSError:
+                self._spill_path = None
+                self._spilled_bytes = self._retention.spill_max_bytes
+                return
+        data = text.encode("utf-8", errors="replace")[:room]
+        try:
+            self._spill.write(data)
+        except (OSError, ValueError):
+            self._spilled_bytes = self._retention.spill_max_bytes
+            return
+        self._spilled_bytes += len(data)
+
+
 def recover_owned_process(
     record_path: str | os.PathLike[str],
     *,
@@ -711,7 +1122,7 @@ def _encode_stdin(data: str | bytes | None) -> bytes | None:
 
 def _start_output_reader(
     pipe: BinaryIO | None,
-    sink: list[str],
+    sink: _RetainedOutput | _RoutedOutput,
     callback: OutputCallback | None,
     activity: _ActivityClock,
     *,
@@ -798,6 +1209,50 @@ def _emit_status(
         callback(status)
 
 
+def _monitor_owned_process(
+    process: subprocess.Popen[bytes],
+    limits: ProcessLimits,
+    *,
+    started_at: float,
+    activity: _ActivityClock,
+    status_callback: StatusCallback | None,
+    is_cancelled: Callable[[], bool],
+    wait_event: threading.Event,
+    is_complete: Callable[[], bool] | None = None,
+) -> ProcessOutcome:
+    """Poll until exit, completion, cancellation, or a timeout; never kills."""
+    next_status_at = started_at + limits.status_interval
+    while True:
+        if process.poll() is not None:
+            return ProcessOutcome.EXITED
+        if is_complete is not None and is_complete():
+            return ProcessOutcome.EXITED
+
+        now = time.monotonic()
+        elapsed = max(0.0, now - started_at)
+        inactive = activity.inactive_for(now)
+
+        if is_cancelled():
+            _emit_status(status_callback, process.pid, ProcessPhase.CANCELLING, elapsed, inactive)
+            return ProcessOutcome.CANCELLED
+        if elapsed >= limits.total_timeout:
+            _emit_status(
+                status_callback, process.pid, ProcessPhase.TOTAL_TIMEOUT, elapsed, inactive
+            )
+            return ProcessOutcome.TOTAL_TIMEOUT
+        if inactive >= limits.inactivity_timeout:
+            _emit_status(
+                status_callback, process.pid, ProcessPhase.INACTIVITY_TIMEOUT, elapsed, inactive
+            )
+            return ProcessOutcome.INACTIVITY_TIMEOUT
+
+        if now >= next_status_at:
+            _emit_status(status_callback, process.pid, ProcessPhase.ACTIVE, elapsed, inactive)
+            next_status_at = now + limits.status_interval
+
+        wait_event.wait(limits.poll_interval)
+
+
 def _close_stdin(pipe: BinaryIO | None) -> None:
     if pipe is not None:
         with contextlib.suppress(OSError, ValueError):
@@ -1099,9 +1554,15 @@ def _remove_record(path: Path) -> None:
 __all__ = [
     "DEFAULT_FORCE_KILL_WAIT_SECONDS",
     "DEFAULT_INACTIVITY_TIMEOUT_SECONDS",
+    "DEFAULT_RETAINED_HEAD_CHARS",
+    "DEFAULT_RETAINED_TAIL_CHARS",
+    "DEFAULT_SPILL_MAX_BYTES",
     "DEFAULT_STATUS_INTERVAL_SECONDS",
     "DEFAULT_TERMINATION_GRACE_SECONDS",
     "DEFAULT_TOTAL_TIMEOUT_SECONDS",
+    "OutputRetention",
+    "OutputRetentionMode",
+    "OwnedProcessSession",
     "OwnedProcessSupervisor",
     "ProcessCancelledError",
     "ProcessControlError",
@@ -16,6 +16,7 @@ from neural_extractor_v3.core.pot_provider import (
     get_po_token_provider,
     redact_po_token_material,
 )
+from neural_extractor_v3.core.ytdlp_cache import YTDLP_CACHE_DIRECTORY
 from neural_extractor_v3.models import DownloadJob, DownloadOptions
 
 _SMOKE_URL = "https://www.youtube.com/watch?v=offline-smoke"
@@ -91,10 +92,9 @@ def run_offline_provider_media_smoke() -> dict[str, bool]:
             name == "yt_dlp_plugins" or name.startswith("yt_dlp_plugins.") for name in sys.modules
         ),
         "token_redaction": sentinel not in redacted,
-        "attempt_cache_isolated": environment.get("XDG_CACHE_HOME", "").endswith(
-            "attempt-temp\\cache"
-        )
-        or environment.get("XDG_CACHE_HOME", "").endswith("attempt-temp/cache"),
+        "attempt_temp_isolated": environment.get("TEMP") == str(root / "attempt-temp"),
+        "ytdlp_cache_managed": environment.get("XDG_CACHE_HOME")
+        == str(application_data / YTDLP_CACHE_DIRECTORY),
     }
 
 
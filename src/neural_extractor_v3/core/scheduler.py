@@ -0,0 +1,261 @@
+"""Bounded-concurrency job scheduler shared by the Qt queue and CLI batches."""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import traceback
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from neural_extractor_v3.config import MAX_PARALLEL_DOWNLOADS
+from neural_extractor_v3.core.download_slots import DownloadSlots, get_download_slots
+from neural_extractor_v3.core.downloader import DownloadEngine, LogCallback, ProgressCallback
+from neural_extractor_v3.core.job_journal import JOB_ORIGIN_GUI, JobJournal
+from neural_extractor_v3.models import DownloadJob, DownloadOptions, DownloadResult
+
+EngineFactory = Callable[..., Any]
+JobStartedCallback = Callable[[DownloadJob], None]
+JobFinishedCallback = Callable[[DownloadJob, DownloadResult], None]
+
+CANCELLED_CATEGORY = "cancelled"
+UNEXPECTED_FAILURE_CATEGORY = "unknown_ytdlp_failure"
+UNEXPECTED_FAILURE_MESSAGE = "Download failed unexpectedly. See the Activity Log for details."
+
+
+class DownloadScheduler:
+    """Run jobs on at most ``max_parallel_jobs`` engines in submission order.
+
+    Every job gets its own ``DownloadEngine`` so cancellation stays per job.
+    Jobs are started strictly first-in, first-out; a slot that finishes always
+    takes the oldest pending job, and every running job holds one slot of the
+    process-wide ``DownloadSlots`` budget that playlist entries also draw from.
+    A configured ``bandwidth_limit`` is the cap
+    for the whole batch.  Each running job gets an even share of it among the
+    jobs still running or waiting (at most one per slot), and the shares are
+    raised as the batch drains.  yt-dlp cannot change the rate of a running
+    process, so a raised share applies from the job's next yt-dlp attempt or
+    playlist entry; shares only ever grow, so their sum never exceeds the cap.
+    With a ``journal`` every job state transition is persisted so an
+    interrupted batch can be resumed; ``journal_origin`` records which front
+    end queued the batch.  ``run`` accepts per-job options so resumed jobs keep
+    the output folder, mode and quality they were journaled with.
+    """
+
+    def __init__(
+        self,
+        options: DownloadOptions,
+        *,
+        engine_factory: EngineFactory = DownloadEngine,
+        progress_callback: ProgressCallback | None = None,
+        log_callback: LogCallback | None = None,
+        job_started: JobStartedCallback | None = None,
+        job_finished: JobFinishedCallback | None = None,
+        journal: JobJournal | None = None,
+        journal_origin: str = JOB_ORIGIN_GUI,
+        download_slots: DownloadSlots | None = None,
+    ) -> None:
+        self.options = options
+        self.engine_factory = engine_factory
+        self.progress_callback = progress_callback
+        self.log_callback = log_callback
+        self.job_started = job_started
+        self.job_finished = job_finished
+        self.journal = journal
+        self.journal_origin = journal_origin
+        self.download_slots = download_slots or get_download_slots()
+        self.max_parallel_jobs = max(1, min(int(options.max_parallel_jobs), MAX_PARALLEL_DOWNLOADS))
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._pending: deque[DownloadJob] = deque()
+        self._cancelled_job_ids: set[str] = set()
+        self._engines: dict[str, Any] = {}
+        self._slots = self.max_parallel_jobs
+        self._job_options: dict[str, DownloadOptions] = {}
+        self._rate_limited: dict[str, tuple[DownloadOptions, int]] = {}
+
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return self._stop_event.is_set() or job_id in self._cancelled_job_ids
+
+    def active_job_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._engines)
+
+    def cancel(self, job_id: str | None = None) -> list[str]:
+        """Cancel one job, or the whole batch when ``job_id`` is omitted.
+
+        Returns the IDs of the jobs that were running when cancellation was
+        requested so callers can mark them as cancelling immediately.
+        """
+        with self._lock:
+            if job_id is None:
+                self._stop_event.set()
+                targets = dict(self._engines)
+            else:
+                self._cancelled_job_ids.add(job_id)
+                targets = {job_id: self._engines[job_id]} if job_id in self._engines else {}
+        for engine in targets.values():
+            if engine is not None:
+                engine.cancel()
+        return list(targets)
+
+    def run(
+        self,
+        jobs: Sequence[DownloadJob],
+        *,
+        job_options: Mapping[str, DownloadOptions] | None = None,
+    ) -> list[DownloadResult]:
+        """Run every job and return results in completion order.
+
+        ``job_options`` overrides the batch options for the jobs it names.
+        """
+        self._job_options = dict(job_options or {})
+        if self.journal:
+            self.journal.add(
+                jobs,
+                self.options,
+                origin=self.journal_origin,
+                job_options=self._job_options,
+            )
+        with self._lock:
+            self._pending = deque(jobs)
+        results: list[DownloadResult] = []
+        slots = max(1, min(self.max_parallel_jobs, len(jobs)))
+        self._slots = slots
+        if slots == 1:
+            self._work(results)
+        else:
+            threads = [
+                threading.Thread(
+                    target=self._work,
+                    args=(results,),
+                    name=f"neural-extractor-download-{index}",
+                    daemon=True,
+                )
+                for index in range(slots)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        with self._lock:
+            remaining = list(self._pending)
+            self._pending.clear()
+        for job in remaining:
+            results.append(self._finish(job, self._cancelled_result(job)))
+        return results
+
+    def _next_job(self) -> DownloadJob | None:
+        with self._lock:
+            if self._stop_event.is_set() or not self._pending:
+                return None
+            job = self._pending.popleft()
+            # Reserve the slot before the engine exists so a batch-wide cancel
+            # issued during construction still reaches this job.
+            self._engines[job.job_id] = None
+            return job
+
+    def _work(self, results: list[DownloadResult]) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            try:
+                with self.download_slots.hold():
+                    result = self._run_job(job)
+            finally:
+                with self._lock:
+                    self._engines.pop(job.job_id, None)
+                    if self._rate_limited.pop(job.job_id, None) is not None:
+                        self._share_bandwidth()
+            results.append(self._finish(job, result))
+
+    def _run_job(self, job: DownloadJob) -> DownloadResult:
+        if job.job_id in self._cancelled_job_ids:
+            return self._cancelled_result(job)
+        if self.journal:
+            self.journal.mark_running(job.job_id)
+        if self.job_started:
+            self.job_started(job)
+        try:
+            engine = self.engine_factory(
+                self._engine_options(job),
+                progress_callback=self.progress_callback,
+                log_callback=self.log_callback,
+            )
+            with self._lock:
+                self._engines[job.job_id] = engine
+            if self.is_cancelled(job.job_id):
+                engine.cancel()
+                return self._cancelled_result(job)
+            raw_result = engine.download(job)
+        except Exception:
+            if self.log_callback:
+                self.log_callback("Download worker exception:\n" + traceback.format_exc())
+            if self.is_cancelled(job.job_id):
+                return self._cancelled_result(job)
+            return DownloadResult(
+                job.job_id,
+                False,
+                UNEXPECTED_FAILURE_MESSAGE,
+                failure_category=UNEXPECTED_FAILURE_CATEGORY,
+            )
+
+        success = bool(raw_result.success)
+        raw_category = getattr(raw_result, "failure_category", "")
+        failure_category = str(getattr(raw_category, "value", raw_category) or "")
+        if self.is_cancelled(job.job_id) and not success:
+            failure_category = CANCELLED_CATEGORY
+        return DownloadResult(
+            job.job_id,
+            success,
+            str(raw_result.message),
+            files=list(getattr(raw_result, "files", None) or []),
+            failure_category=failure_category,
+            entries=list(getattr(raw_result, "entries", None) or []),
+        )
+
+    def _engine_options(self, job: DownloadJob) -> DownloadOptions:
+        options = self._job_options.get(job.job_id, self.options)
+        limit = options.bandwidth_limit
+        if not limit:
+            return options
+        # The engine reads ``bandwidth_limit`` for every attempt, so this copy is
+        # where a larger share reaches it once other jobs have finished.
+        engine_options = dataclasses.replace(options)
+        with self._lock:
+            self._rate_limited[job.job_id] = (engine_options, int(limit))
+            self._share_bandwidth()
+        return engine_options
+
+    def _share_bandwidth(self) -> None:
+        # Caller holds ``self._lock``.  Jobs still waiting will take a slot, so they
+        # count too; the divisor therefore never grows during a batch.
+        sharing = max(1, min(self._slots, len(self._engines) + len(self._pending)))
+        for engine_options, limit in self._rate_limited.values():
+            engine_options.bandwidth_limit = max(1, limit // sharing)
+
+    def _finish(self, job: DownloadJob, result: DownloadResult) -> DownloadResult:
+        if self.journal:
+            self.journal.mark_finished(job.job_id, result)
+        if self.job_finished:
+            self.job_finished(job, result)
+        return result
+
+    @staticmethod
+    def _cancelled_result(job: DownloadJob) -> DownloadResult:
+        return DownloadResult(job.job_id, False, "Cancelled", failure_category=CANCELLED_CATEGORY)
+
+
+__all__ = [
+    "CANCELLED_CATEGORY",
+    "DownloadScheduler",
+    "UNEXPECTED_FAILURE_CATEGORY",
+    "UNEXPECTED_FAILURE_MESSAGE",
+]
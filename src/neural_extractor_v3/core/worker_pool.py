@@ -0,0 +1,280 @@
+"""Warm, supervised yt-dlp worker processes reused across download attempts.
+
+A one-shot worker pays interpreter startup plus ``import yt_dlp`` for every
+attempt and every discovery probe.  Pooled workers run the same
+``ytdlp_worker`` protocol in ``--serve`` mode: each request is one JSON line on
+stdin and ends with a ``complete`` frame.  Workers are keyed by their launch
+and auth/plugin configuration, retired after a bounded number of requests or
+an idle period, and remain owned trees: cancellation and timeouts terminate
+them exactly like a one-shot :class:`OwnedProcessSupervisor` child.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from neural_extractor_v3.config import (
+    YTDLP_WORKER_IDLE_SECONDS,
+    YTDLP_WORKER_MAX_REQUESTS,
+    YTDLP_WORKER_POOL_SIZE,
+)
+from neural_extractor_v3.core.line_framer import LineFramer
+from neural_extractor_v3.core.pot_provider import options_request_po_provider
+from neural_extractor_v3.core.process_control import (
+    CancelCallback,
+    OutputCallback,
+    OutputRetention,
+    OwnedProcessSession,
+    ProcessLimits,
+    ProcessResult,
+    StatusCallback,
+)
+from neural_extractor_v3.core.ytdlp_worker import (
+    PROTOCOL_COMPLETE_KIND,
+    PROTOCOL_PREFIX,
+    REQUEST_ENVIRONMENT_KEYS,
+)
+
+AUTH_OPTION_KEYS = ("cookiefile", "cookiesfrombrowser")
+MAX_COMPLETE_FRAME_CHARS = 1024
+_COMPLETE_FRAME_PREFIX = f'{PROTOCOL_PREFIX}{{"kind": "{PROTOCOL_COMPLETE_KIND}"'
+
+
+def worker_configuration_key(
+    command: Sequence[str],
+    *,
+    cwd: str | os.PathLike[str] | None,
+    env: Mapping[str, str],
+    request: Mapping[str, Any],
+) -> str:
+    """Identify which warm worker may serve ``request``.
+
+    Launch settings, the PO-provider plugin configuration, and the auth
+    inputs all change process-global yt-dlp state, so any difference gets a
+    different worker instead of reconfiguring a warm one.
+    """
+    options = request.get("options")
+    options = options if isinstance(options, Mapping) else {}
+    document = {
+        "command": list(command),
+        "cwd": os.fspath(cwd) if cwd is not None else "",
+        "env": sorted(env.items()),
+        "po_provider": options_request_po_provider(options),
+        "auth": {key: options.get(key) for key in AUTH_OPTION_KEYS},
+    }
+    encoded = json.dumps(document, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class YtdlpWorkerPool:
+    """Keep at most ``max_idle_workers`` warm sessions, least recently used first."""
+
+    def __init__(
+        self,
+        *,
+        max_idle_workers: int = YTDLP_WORKER_POOL_SIZE,
+        max_requests_per_worker: int = YTDLP_WORKER_MAX_REQUESTS,
+        idle_timeout: float = YTDLP_WORKER_IDLE_SECONDS,
+    ) -> None:
+        self.max_idle_workers = max(0, max_idle_workers)
+        self.max_requests_per_worker = max(1, max_requests_per_worker)
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._idle: list[tuple[str, float, OwnedProcessSession]] = []
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_idle_workers > 0 and not self._closed
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def lease(self, key: str) -> OwnedProcessSession | None:
+        """Return a warm session for ``key`` or ``None`` when one must be started."""
+        now = time.monotonic()
+        leased: OwnedProcessSession | None = None
+        with self._lock:
+            expired = [entry for entry in self._idle if now - entry[1] >= self.idle_timeout]
+            self._idle = [entry for entry in self._idle if entry not in expired]
+            for index in range(len(self._idle) - 1, -1, -1):
+                entry_key, _, session = self._idle[index]
+                if entry_key == key and session.alive:
+                    leased = session
+                    del self._idle[index]
+                    break
+        for _, _, session in expired:
+            session.close()
+        return leased
+
+    def release(self, key: str, session: OwnedProcessSession) -> None:
+        """Return a healthy session to the pool, or retire it."""
+        evicted: list[OwnedProcessSession] = []
+        with self._lock:
+            reusable = (
+                self.enabled
+                and session.alive
+                and session.requests_served < self.max_requests_per_worker
+            )
+            if reusable:
+                self._idle.append((key, time.monotonic(), session))
+                while len(self._idle) > self.max_idle_workers:
+                    evicted.append(self._idle.pop(0)[2])
+        if not reusable:
+            session.close()
+        for stale in evicted:
+            stale.close()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            sessions = [session for _, _, session in self._idle]
+            self._idle.clear()
+        for session in sessions:
+            with contextlib.suppress(Exception):
+                session.close()
+
+
+class PooledWorkerRunner:
+    """Run worker requests on pooled sessions with the supervisor ``run`` API.
+
+    ``DownloadEngine`` talks to this exactly as it talks to an
+    :class:`OwnedProcessSupervisor`; per-attempt temp and cache locations
+    travel inside the request instead of the launch environment.
+    """
+
+    def __init__(
+        self,
+        pool: YtdlpWorkerPool,
+        limits: ProcessLimits,
+        *,
+        cancellation_event: threading.Event,
+        record_directory: Path,
+        record_label: str,
+        hide_window: bool = True,
+        retention: OutputRetention | None = None,
+    ) -> None:
+        self.pool = pool
+        self.limits = limits
+        self.retention = retention
+        self.cancellation_event = cancellation_event
+        self.record_directory = Path(record_directory)
+        self.record_label = record_label
+        self.hide_window = hide_window
+
+    def cancel(self) -> None:
+        self.cancellation_event.set()
+
+    def run(
+        self,
+        args: Sequence[str],
+        *,
+        stdin_data: str,
+        cwd: str | os.PathLike[str] | None = None,
+        env: Mapping[str, str] | None = None,
+        stdout_callback: OutputCallback | None = None,
+        stderr_callback: OutputCallback | None = None,
+        status_callback: StatusCallback | None = None,
+        cancel_requested: CancelCallback | None = None,
+    ) -> ProcessResult:
+        request = json.loads(stdin_data)
+        launch_env = dict(env if env is not None else os.environ)
+        request["environment"] = {
+            key: launch_env.pop(key) for key in REQUEST_ENVIRONMENT_KEYS if key in launch_env
+        }
+        key = worker_configuration_key(args, cwd=cwd, env=launch_env, request=request)
+        session = self.pool.lease(key)
+        if session is None:
+            session = OwnedProcessSession(
+                args,
+                limits=self.limits,
+                cwd=cwd,
+                env=launch_env,
+                ownership_record=self.record_directory
+                / f"active-{self.record_label}-pool-{os.getpid()}-{uuid4().hex[:8]}.json",
+                hide_window=self.hide_window,
+            )
+            session.start()
+
+        watcher = _CompletionWatcher(stdout_callback)
+        try:
+            result = session.request(
+                json.dumps(request, ensure_ascii=False),
+                completed=watcher.exit_code,
+                cancellation_event=self.cancellation_event,
+                stdout_callback=watcher.feed,
+                stderr_callback=stderr_callback,
+                status_callback=status_callback,
+                cancel_requested=cancel_requested,
+                retention=self.retention,
+            )
+        except BaseException:
+            session.close()
+            raise
+        self.pool.release(key, session)
+        return result
+
+
+class _CompletionWatcher:
+    """Forward stdout unchanged while spotting the terminal ``complete`` frame."""
+
+    def __init__(self, callback: OutputCallback | None) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        # Far longer lines than a completion frame are dropped by the framer.
+        self._framer = LineFramer(MAX_COMPLETE_FRAME_CHARS)
+        self._exit_code: int | None = None
+
+    def exit_code(self) -> int | None:
+        with self._lock:
+            return self._exit_code
+
+    def feed(self, chunk: str) -> None:
+        if self._callback is not None:
+            self._callback(chunk)
+        with self._lock:
+            for line in self._framer.feed(chunk):
+                self._inspect(line)
+
+    def _inspect(self, line: str) -> None:
+        if not line.startswith(_COMPLETE_FRAME_PREFIX):
+            return
+        try:
+            event = json.loads(line[len(PROTOCOL_PREFIX) :])
+        except json.JSONDecodeError:
+            return
+        exit_code = event.get("exit_code") if isinstance(event, dict) else None
+        if isinstance(exit_code, int) and not isinstance(exit_code, bool):
+            self._exit_code = exit_code
+
+
+_DEFAULT_POOL: YtdlpWorkerPool | None = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def get_ytdlp_worker_pool() -> YtdlpWorkerPool:
+    global _DEFAULT_POOL
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = YtdlpWorkerPool()
+            atexit.register(_DEFAULT_POOL.shutdown)
+        return _DEFAULT_POOL
+
+
+__all__ = [
+    "PooledWorkerRunner",
+    "YtdlpWorkerPool",
+    "get_ytdlp_worker_pool",
+    "worker_configuration_key",
+]
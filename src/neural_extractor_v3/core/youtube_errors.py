@@ -1,10 +1,22 @@
-"""Precise YouTube/yt-dlp failure classification for retry decisions."""
+"""Precise YouTube/yt-dlp failure classification for retry decisions.
+
+Every pattern below is a lowercase literal.  Instead of one ``in`` scan per
+pattern, classification runs a single precompiled regex over the tail of the
+lowered diagnostic text and collects the set of patterns that occur; the
+category rules then only test set membership, in their original priority
+order.  yt-dlp reports the decisive error last, so only the final
+``CLASSIFICATION_WINDOW_CHARS`` of a very large output are examined.
+"""
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 
+CLASSIFICATION_WINDOW_CHARS = 256 * 1024
+
 
 class FailureCategory(str, Enum):
     """Stable failure buckets used by the engine, GUI, and offline tests."""
@@ -36,6 +48,7 @@ class FailureCategory(str, Enum):
     JAVASCRIPT_RUNTIME_UNAVAILABLE = "javascript_runtime_unavailable"
     CHALLENGE_SOLVER_COMPONENT_UNAVAILABLE = "challenge_solver_component_unavailable"
     LIVE_EVENT_ENDED = "live_event_ended"
+    VIDEO_UNAVAILABLE = "video_unavailable"
     UNKNOWN = "unknown_ytdlp_failure"
 
 
@@ -45,6 +58,7 @@ class FailureAnalysis:
     user_message: str
     authentication_specific: bool = False
     transient: bool = False
+    rate_limited: bool = False
 
 
 _AUTH_PATTERNS = (
@@ -88,6 +102,21 @@ _ACCOUNT_ACCESS_PATTERNS = (
     "age restricted",
 )
 
+_REMOVED_VIDEO_PATTERNS = (
+    "this video has been removed",
+    "video has been removed by the uploader",
+    "account associated with this video has been terminated",
+    "this video is no longer available",
+    "this video does not exist",
+)
+
+_AGE_RESTRICTION_PATTERNS = (
+    "confirm your age",
+    "age-restricted",
+    "age restricted",
+    "this video may be inappropriate for some users",
+)
+
 _TRANSIENT_NETWORK_PATTERNS = (
     "connection reset",
     "connection aborted",
@@ -156,6 +185,154 @@ _COMPONENT_PATTERNS = (
     "challenge solver core script",
 )
 
+_SABR_OR_IMAGE_PATTERNS = (
+    "only sabr formats",
+    "only sabr or image formats",
+    "sabr-only",
+    "only images are available",
+    "only image formats",
+    "only storyboard formats",
+)
+
+_REQUIREMENT_PATTERNS = ("required", "requires", "missing", "not provided", "without")
+
+_COOKIE_DECRYPTION_PATTERNS = (
+    "dpapi",
+    "failed to decrypt",
+    "could not decrypt",
+    "unable to decrypt",
+    "decrypt cookie",
+    "app-bound",
+    "app bound",
+    "application-bound",
+    'cookie version: "v20"',
+)
+
+_COOKIE_EXTRACTION_PATTERNS = (
+    "failed to load cookies",
+    "could not load cookies",
+    "failed loading cookies",
+    "cookies from browser",
+    "browser cookies",
+    "keyring",
+    "secretstorage",
+)
+
+_FORMAT_UNAVAILABLE_PATTERNS = (
+    "requested format is not available",
+    "requested format not available",
+    "format is not available",
+    "no suitable formats",
+    "no video formats found",
+)
+
+_UNICODE_ERROR_PATTERNS = (
+    "unicodeencodeerror",
+    "unicodedecodeerror",
+    "codec can't encode character",
+    "codec can't decode byte",
+)
+
+_UNICODE_CODEC_PATTERNS = (
+    "charmap",
+    "cp1252",
+    "utf-8",
+    "unicodeencodeerror",
+    "unicodedecodeerror",
+)
+
+_HTTP_403_PATTERNS = ("http error 403", "http status 403", "403 forbidden")
+_LIVE_EVENT_ENDED = "this live event has ended"
+_N_CHALLENGE_FAILED = "n challenge solving failed"
+_RATE_LIMITED = "http error 429"
+_COOKIE_COPY_FAILED = "could not copy"
+_COOKIE_DATABASE = "cookie database"
+_DATABASE_LOCKED_PATTERNS = ("database is locked", "database table is locked")
+
+
+class _PatternMatcher:
+    """Find every literal pattern that occurs in a text with one compiled regex.
+
+    The patterns are merged into a prefix trie so the regex tries each
+    distinct first character once per position.  The greedy trie matches the
+    longest pattern starting at a position; patterns contained in that match
+    are implied.  Searching again from the next character, not the end of the
+    match, keeps overlapping occurrences, so the result always equals
+    ``{pattern for pattern in patterns if pattern in text}``.
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = frozenset(patterns)
+        self._regex = re.compile(_trie_expression(self.patterns))
+        self._implied = {
+            pattern: frozenset(other for other in self.patterns if other in pattern)
+            for pattern in self.patterns
+        }
+
+    def hits(self, lowered: str) -> frozenset[str]:
+        found: set[str] = set()
+        search = self._regex.search
+        position = 0
+        while (match := search(lowered, position)) is not None:
+            found.update(self._implied[match.group()])
+            position = match.start() + 1
+        return frozenset(found)
+
+
+def _trie_expression(patterns: Iterable[str]) -> str:
+    trie: dict[str, dict] = {}
+    for pattern in patterns:
+        node = trie
+        for character in pattern:
+            node = node.setdefault(character, {})
+        node[""] = {}
+
+    def expression(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(character) + expression(child)
+            for character, child in sorted(node.items())
+            if character
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return expression(trie)
+
+
+_MATCHER = _PatternMatcher(
+    (
+        *_AUTH_PATTERNS,
+        *_EXPIRED_COOKIE_PATTERNS,
+        *_DEDICATED_SESSION_REJECTION_PATTERNS,
+        *_ACCOUNT_ACCESS_PATTERNS,
+        *_REMOVED_VIDEO_PATTERNS,
+        *_AGE_RESTRICTION_PATTERNS,
+        *_TRANSIENT_NETWORK_PATTERNS,
+        *_PO_TOKEN_PATTERNS,
+        *_PO_PROVIDER_UNAVAILABLE_PATTERNS,
+        *_PO_FETCH_FAILURE_PATTERNS,
+        *_MISSING_RUNTIME_PATTERNS,
+        *_COMPONENT_PATTERNS,
+        *_SABR_OR_IMAGE_PATTERNS,
+        *_REQUIREMENT_PATTERNS,
+        *_COOKIE_DECRYPTION_PATTERNS,
+        *_COOKIE_EXTRACTION_PATTERNS,
+        *_FORMAT_UNAVAILABLE_PATTERNS,
+        *_UNICODE_ERROR_PATTERNS,
+        *_UNICODE_CODEC_PATTERNS,
+        *_HTTP_403_PATTERNS,
+        *_DATABASE_LOCKED_PATTERNS,
+        _LIVE_EVENT_ENDED,
+        _N_CHALLENGE_FAILED,
+        _RATE_LIMITED,
+        _COOKIE_COPY_FAILED,
+        _COOKIE_DATABASE,
+    )
+)
+
 
 def classify_youtube_failure(
     error_text: str,
@@ -171,16 +348,16 @@ def classify_youtube_failure(
     into a missing-Node diagnostic when Node was already found and executed.
     """
 
-    lowered = (error_text or "").lower()
+    hits = _pattern_hits(error_text)
 
-    if _is_worker_unicode_transport_failure(lowered):
+    if _is_worker_unicode_transport_failure(hits):
         return FailureAnalysis(
             FailureCategory.WORKER_PROTOCOL_ERROR,
             "The internal yt-dlp worker could not transport Unicode output safely.",
         )
 
-    if auth_kind in {"dedicated_browser", "dedicated_firefox"} and any(
-        pattern in lowered for pattern in _ACCOUNT_ACCESS_PATTERNS
+    if auth_kind in {"dedicated_browser", "dedicated_firefox"} and _found(
+        hits, _ACCOUNT_ACCESS_PATTERNS
     ):
         return FailureAnalysis(
             FailureCategory.YOUTUBE_ACCESS_RESTRICTED,
@@ -189,8 +366,8 @@ def classify_youtube_failure(
         )
 
     if auth_kind in {"dedicated_browser", "dedicated_firefox"} and (
-        any(pattern in lowered for pattern in _EXPIRED_COOKIE_PATTERNS)
-        or any(pattern in lowered for pattern in _DEDICATED_SESSION_REJECTION_PATTERNS)
+        _found(hits, _EXPIRED_COOKIE_PATTERNS)
+        or _found(hits, _DEDICATED_SESSION_REJECTION_PATTERNS)
     ):
         return FailureAnalysis(
             FailureCategory.YOUTUBE_SESSION_EXPIRED,
@@ -198,93 +375,85 @@ def classify_youtube_failure(
             authentication_specific=True,
         )
 
-    if "this live event has ended" in lowered:
+    if _LIVE_EVENT_ENDED in hits:
         return FailureAnalysis(
             FailureCategory.LIVE_EVENT_ENDED,
             "This live event has ended and is not currently downloadable.",
         )
 
-    if _is_cookie_database_locked(lowered):
+    if _found(hits, _REMOVED_VIDEO_PATTERNS):
+        return FailureAnalysis(
+            FailureCategory.VIDEO_UNAVAILABLE,
+            "This video was removed or is no longer available on YouTube.",
+        )
+
+    if _is_cookie_database_locked(hits):
         return FailureAnalysis(
             FailureCategory.BROWSER_COOKIE_DATABASE_LOCKED,
             "The browser cookie database is locked. Close that browser and retry, or use cookies.txt.",
             authentication_specific=True,
         )
 
-    if _is_cookie_decryption_failure(lowered):
+    if _found(hits, _COOKIE_DECRYPTION_PATTERNS):
         return FailureAnalysis(
             FailureCategory.BROWSER_COOKIE_DECRYPTION_FAILED,
             "Windows could not decrypt this browser's cookies. Try another authenticated source.",
             authentication_specific=True,
         )
 
-    if _is_browser_cookie_extraction_failure(lowered):
+    if _found(hits, _COOKIE_EXTRACTION_PATTERNS):
         return FailureAnalysis(
             FailureCategory.BROWSER_COOKIE_EXTRACTION_FAILED,
             "Browser cookie extraction failed. Try another authenticated source or export cookies.txt.",
             authentication_specific=True,
         )
 
-    if any(pattern in lowered for pattern in _PO_PROVIDER_UNAVAILABLE_PATTERNS):
+    if _found(hits, _PO_PROVIDER_UNAVAILABLE_PATTERNS):
         return FailureAnalysis(
             FailureCategory.PO_TOKEN_PROVIDER_UNAVAILABLE,
             "The optional external PO Token helper is unavailable.",
         )
 
-    if any(pattern in lowered for pattern in _PO_FETCH_FAILURE_PATTERNS):
+    if _found(hits, _PO_FETCH_FAILURE_PATTERNS):
         return FailureAnalysis(
             FailureCategory.PO_TOKEN_FETCH_FAILED,
             "The optional external PO Token helper could not obtain a valid token.",
         )
 
-    if any(
-        pattern in lowered
-        for pattern in (
-            "only sabr formats",
-            "only sabr or image formats",
-            "sabr-only",
-            "only images are available",
-            "only image formats",
-            "only storyboard formats",
-        )
-    ):
+    if _found(hits, _SABR_OR_IMAGE_PATTERNS):
         return FailureAnalysis(
             FailureCategory.ONLY_SABR_OR_IMAGE_FORMATS,
             "YouTube exposed only SABR or image formats; no directly downloadable media format was available.",
         )
 
-    if any(token in lowered for token in _PO_TOKEN_PATTERNS) and any(
-        marker in lowered
-        for marker in ("required", "requires", "missing", "not provided", "without")
-    ):
+    if _found(hits, _PO_TOKEN_PATTERNS) and _found(hits, _REQUIREMENT_PATTERNS):
         return FailureAnalysis(
             FailureCategory.PO_TOKEN_REQUIRED,
             "The selected YouTube client requires a PO Token to expose downloadable media formats.",
         )
 
-    if any(pattern in lowered for pattern in _COMPONENT_PATTERNS):
+    if _found(hits, _COMPONENT_PATTERNS):
         return FailureAnalysis(
             FailureCategory.CHALLENGE_SOLVER_COMPONENT_UNAVAILABLE,
             "YouTube challenge processing failed because the supported solver component was unavailable.",
         )
 
     if not javascript_runtime_available and (
-        any(pattern in lowered for pattern in _MISSING_RUNTIME_PATTERNS)
-        or "n challenge solving failed" in lowered
+        _found(hits, _MISSING_RUNTIME_PATTERNS) or _N_CHALLENGE_FAILED in hits
     ):
         return FailureAnalysis(
             FailureCategory.JAVASCRIPT_RUNTIME_UNAVAILABLE,
             "YouTube challenge solver unavailable. Install Node.js or use the bundled runtime.",
         )
 
-    if any(pattern in lowered for pattern in _AUTH_PATTERNS):
+    if _found(hits, _AUTH_PATTERNS):
         return FailureAnalysis(
             FailureCategory.AUTHENTICATION_REQUIRED,
             "This video requires YouTube authentication. Neural Extractor will try an available cookie source.",
             authentication_specific=True,
         )
 
-    if "http error 403" in lowered or "http status 403" in lowered or "403 forbidden" in lowered:
+    if _found(hits, _HTTP_403_PATTERNS):
         if attempt_kind == "po_token":
             return FailureAnalysis(
                 FailureCategory.PO_TOKEN_MEDIA_403,
@@ -313,20 +482,21 @@ def classify_youtube_failure(
             "YouTube rejected media access with HTTP 403. Authentication is not assumed from this error alone.",
         )
 
-    if _is_format_unavailable(lowered):
+    if _found(hits, _FORMAT_UNAVAILABLE_PATTERNS):
         return FailureAnalysis(
             FailureCategory.REQUESTED_FORMAT_UNAVAILABLE,
             "The requested media format is not available for this video.",
         )
 
-    if any(pattern in lowered for pattern in _TRANSIENT_NETWORK_PATTERNS):
+    if _found(hits, _TRANSIENT_NETWORK_PATTERNS):
         return FailureAnalysis(
             FailureCategory.NETWORK_TRANSIENT,
             "A temporary network failure interrupted the YouTube attempt.",
             transient=True,
+            rate_limited=_RATE_LIMITED in hits,
         )
 
-    if "n challenge solving failed" in lowered:
+    if _N_CHALLENGE_FAILED in hits:
         return FailureAnalysis(
             FailureCategory.UNKNOWN,
             "YouTube challenge processing failed even though the JavaScript runtime was available.",
@@ -338,76 +508,29 @@ def classify_youtube_failure(
     )
 
 
-def _is_cookie_database_locked(lowered: str) -> bool:
-    return (
-        "could not copy" in lowered
-        and "cookie database" in lowered
-        or "database is locked" in lowered
-        or "database table is locked" in lowered
-    )
+def has_age_restriction_signal(error_text: str) -> bool:
+    """Return whether yt-dlp output says the video is behind YouTube's age gate."""
+    return _found(_pattern_hits(error_text), _AGE_RESTRICTION_PATTERNS)
 
 
-def _is_cookie_decryption_failure(lowered: str) -> bool:
-    return any(
-        pattern in lowered
-        for pattern in (
-            "dpapi",
-            "failed to decrypt",
-            "could not decrypt",
-            "unable to decrypt",
-            "decrypt cookie",
-            "app-bound",
-            "app bound",
-            "application-bound",
-            'cookie version: "v20"',
-        )
-    )
+def _pattern_hits(error_text: str) -> frozenset[str]:
+    text = error_text or ""
+    if len(text) > CLASSIFICATION_WINDOW_CHARS:
+        text = text[-CLASSIFICATION_WINDOW_CHARS:]
+    return _MATCHER.hits(text.lower())
 
 
-def _is_browser_cookie_extraction_failure(lowered: str) -> bool:
-    return any(
-        pattern in lowered
-        for pattern in (
-            "failed to load cookies",
-            "could not load cookies",
-            "failed loading cookies",
-            "cookies from browser",
-            "browser cookies",
-            "keyring",
-            "secretstorage",
-        )
-    )
+def _found(hits: frozenset[str], patterns: tuple[str, ...]) -> bool:
+    return not hits.isdisjoint(patterns)
 
 
-def _is_format_unavailable(lowered: str) -> bool:
-    return any(
-        pattern in lowered
-        for pattern in (
-            "requested format is not available",
-            "requested format not available",
-            "format is not available",
-            "no suitable formats",
-            "no video formats found",
-        )
+def _is_cookie_database_locked(hits: frozenset[str]) -> bool:
+    return (
+        _COOKIE_COPY_FAILED in hits
+        and _COOKIE_DATABASE in hits
+        or _found(hits, _DATABASE_LOCKED_PATTERNS)
     )
 
 
-def _is_worker_unicode_transport_failure(lowered: str) -> bool:
-    return any(
-        marker in lowered
-        for marker in (
-            "unicodeencodeerror",
-            "unicodedecodeerror",
-            "codec can't encode character",
-            "codec can't decode byte",
-        )
-    ) and any(
-        marker in lowered
-        for marker in (
-            "charmap",
-            "cp1252",
-            "utf-8",
-            "unicodeencodeerror",
-            "unicodedecodeerror",
-        )
-    )
+def _is_worker_unicode_transport_failure(hits: frozenset[str]) -> bool:
+    return _found(hits, _UNICODE_ERROR_PATTERNS) and _found(hits, _UNICODE_CODEC_PATTERNS)
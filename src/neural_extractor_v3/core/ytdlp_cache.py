@@ -0,0 +1,215 @@
+"""Shared, size-capped yt-dlp cache directory under the application data folder.
+
+yt-dlp keeps preprocessed player JavaScript, solved signature/n-challenge
+functions and the ``ejs:github`` solver scripts in its cache directory.
+Workers used to point ``XDG_CACHE_HOME`` at the per-attempt temp folder, so
+all of that was downloaded and solved again on every attempt.  Every worker
+now shares one cache root.  yt-dlp replaces cache entries with an atomic
+rename, so concurrent workers never read a torn entry; maintenance runs under
+a cross-process lock, drops entries that are not valid yt-dlp cache records,
+removes orphaned temp files, and evicts the least recently written entries
+beyond the age and size limits.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import stat
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from neural_extractor_v3.config import YTDLP_CACHE_MAX_AGE_SECONDS, YTDLP_CACHE_MAX_BYTES
+
+YTDLP_CACHE_DIRECTORY = "ytdlp-cache"
+MAINTENANCE_INTERVAL_SECONDS = 300.0
+TEMP_FILE_GRACE_SECONDS = 600.0
+_LOCK_FILENAME = ".maintenance.lock"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheMaintenanceReport:
+    kept: int = 0
+    kept_bytes: int = 0
+    removed_invalid: int = 0
+    removed_expired: int = 0
+    removed_evicted: int = 0
+    removed_temp: int = 0
+
+
+class SharedYtdlpCache:
+    """Own one yt-dlp cache root; ``root`` is what workers get as ``XDG_CACHE_HOME``."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = YTDLP_CACHE_MAX_BYTES,
+        max_age: float = YTDLP_CACHE_MAX_AGE_SECONDS,
+        maintenance_interval: float = MAINTENANCE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max(0, max_bytes)
+        self.max_age = max_age
+        self.maintenance_interval = maintenance_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_maintenance: float | None = None
+        self._validated: dict[Path, tuple[int, int]] = {}
+
+    @property
+    def ytdlp_dir(self) -> Path:
+        return self.root / "yt-dlp"
+
+    def maintain(self, *, force: bool = False) -> CacheMaintenanceReport | None:
+        """Sweep the cache when due; ``None`` when skipped or another process holds the lock."""
+        with self._lock:
+            now = self._clock()
+            if (
+                not force
+                and self._last_maintenance is not None
+                and now - self._last_maintenance < self.maintenance_interval
+            ):
+                return None
+            self._last_maintenance = now
+            try:
+                self.ytdlp_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return None
+            with _exclusive_lock(self.root / _LOCK_FILENAME) as acquired:
+                if not acquired:
+                    return None
+                return self._sweep(now)
+
+    def _sweep(self, now: float) -> CacheMaintenanceReport:
+        invalid = expired = temp = 0
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.ytdlp_dir.rglob("*"):
+            try:
+                info = path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+            age = now - info.st_mtime
+            if path.suffix != ".json":
+                # yt-dlp only writes JSON entries; anything else is a leftover
+                # temp file once no writer can still be renaming it.
+                if age >= TEMP_FILE_GRACE_SECONDS and self._remove(path):
+                    temp += 1
+                continue
+            if age >= self.max_age:
+                if self._remove(path):
+                    expired += 1
+                continue
+            identity = (info.st_size, info.st_mtime_ns)
+            if self._validated.get(path) != identity:
+                if not _is_cache_record(path):
+                    if self._remove(path):
+                        invalid += 1
+                    continue
+                self._validated[path] = identity
+            entries.append((info.st_mtime, info.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        kept = len(entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                evicted += 1
+                kept -= 1
+        return CacheMaintenanceReport(
+            kept=kept,
+            kept_bytes=total,
+            removed_invalid=invalid,
+            removed_expired=expired,
+            removed_evicted=evicted,
+            removed_temp=temp,
+        )
+
+    def _remove(self, path: Path) -> bool:
+        self._validated.pop(path, None)
+        try:
+            path.unlink()
+        except OSError:
+            # Windows refuses to delete an entry a worker is reading right now.
+            return False
+        return True
+
+
+def _is_cache_record(path: Path) -> bool:
+    try:
+        with path.open(encoding="utf-8") as stream:
+            record = json.load(stream)
+    except (OSError, ValueError):
+        return False
+    return isinstance(record, dict) and "data" in record
+
+
+@contextlib.contextmanager
+def _exclusive_lock(path: Path) -> Iterator[bool]:
+    """Try once to take a cross-process lock on ``path``; yield whether it was acquired."""
+    try:
+        handle = path.open("a+b")
+    except OSError:
+        yield False
+        return
+    acquired = False
+    try:
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            acquired = True
+        except OSError:
+            acquired = False
+        yield acquired
+    finally:
+        if acquired:
+            with contextlib.suppress(OSError):
+                if sys.platform == "win32":
+                    import msvcrt
+
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    import fcntl
+
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        handle.close()
+
+
+_CACHES: dict[str, SharedYtdlpCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_ytdlp_cache(root: Path) -> SharedYtdlpCache:
+    key = os.path.normcase(os.path.abspath(root))
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = SharedYtdlpCache(Path(root))
+        return cache
+
+
+__all__ = [
+    "YTDLP_CACHE_DIRECTORY",
+    "CacheMaintenanceReport",
+    "SharedYtdlpCache",
+    "get_ytdlp_cache",
+]
@@ -5,9 +5,12 @@ from __future__ import annotations
 import contextlib
 import json
 import os
+import sys
+import tempfile
 import threading
+import time
 import traceback
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import Any, BinaryIO, TextIO
 
 # Disable arbitrary user/plugin discovery before yt-dlp itself is imported.
@@ -15,6 +18,8 @@ os.environ["YTDLP_NO_PLUGINS"] = "1"
 
 import yt_dlp  # noqa: E402
 
+from neural_extractor_v3.core.js_solver import configure_yt_dlp_challenge_solver
+from neural_extractor_v3.core.line_framer import LineFramer
 from neural_extractor_v3.core.pot_provider import (
     configure_yt_dlp_plugins,
     options_request_po_provider,
@@ -23,6 +28,13 @@ from neural_extractor_v3.core.pot_provider import (
 
 PROTOCOL_PREFIX = "NEURAL_EXTRACTOR_EVENT "
 PROTOCOL_ENCODING = "utf-8"
+PROTOCOL_COMPLETE_KIND = "complete"
+# Per-attempt locations a long-lived worker adopts from each request.
+REQUEST_ENVIRONMENT_KEYS = ("TEMP", "TMP", "XDG_CACHE_HOME")
+# Phase a worker reports when another attempt already holds the download claim.
+DOWNLOAD_CLAIM_LOST_PHASE = "claim_lost"
+# Default frame budget when a request does not carry its own.
+DEFAULT_PROGRESS_FRAMES_PER_SECOND = 4.0
 PROTOCOL_SMOKE_TITLE = "Artist ｜ Greatest Hits ❤️ Nederlandse Muziek — 夜の名曲"
 
 
@@ -120,20 +132,18 @@ class ProtocolTextStream:
 
     def __init__(self, stream: str) -> None:
         self.stream = stream
-        self._buffer = ""
+        self._framer = LineFramer()
 
     def write(self, value: str) -> int:
-        self._buffer += str(value)
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
+        for line in self._framer.feed(str(value)):
             if line.strip():
                 _emit("log", stream=self.stream, message=line.rstrip())
         return len(value)
 
     def flush(self) -> None:
-        if self._buffer.strip():
-            _emit("log", stream=self.stream, message=self._buffer.rstrip())
-        self._buffer = ""
+        remaining = self._framer.flush()
+        if remaining.strip():
+            _emit("log", stream=self.stream, message=remaining.rstrip())
 
 
 def _progress_hook(data: Mapping[str, Any]) -> None:
@@ -161,6 +171,64 @@ def _progress_hook(data: Mapping[str, Any]) -> None:
     )
 
 
+class _ProgressCoalescer:
+    """Forward at most ``frames_per_second`` progress frames to the parent.
+
+    yt-dlp reports progress for every fragment and block, often dozens of
+    times a second, and every report costs a redaction, a protocol write and
+    a parse in the engine.  Intermediate ``downloading`` reports inside the
+    frame interval are dropped; the next one that passes carries the newer
+    totals anyway.  A status change, a new file and a report that reaches
+    the total size always pass, so the parent never misses a transition or
+    the final frame.  A budget of ``0`` forwards everything.  The number of
+    dropped reports is logged once at the end of the attempt for diagnostics.
+    """
+
+    def __init__(
+        self,
+        frames_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = 1.0 / frames_per_second if frames_per_second > 0 else 0.0
+        self._clock = clock
+        # yt-dlp calls hooks from concurrent fragment threads; emitting under the
+        # lock keeps a final frame from overtaking an earlier one.
+        self._lock = threading.Lock()
+        self._last_key: tuple[str, str] | None = None
+        self._last_emitted = 0.0
+        self.suppressed = 0
+
+    def __call__(self, data: Mapping[str, Any]) -> None:
+        status = str(data.get("status", "working"))
+        info = data.get("info_dict")
+        filepath = info.get("filepath") if isinstance(info, Mapping) else ""
+        key = (status, str(data.get("filename") or filepath or ""))
+        total = data.get("total_bytes") or data.get("total_bytes_estimate") or 0
+        downloaded = data.get("downloaded_bytes") or 0
+        with self._lock:
+            now = self._clock()
+            if (
+                status == "downloading"
+                and key == self._last_key
+                and not (total and downloaded >= total)
+                and now - self._last_emitted < self._interval
+            ):
+                self.suppressed += 1
+                return
+            self._last_key = key
+            self._last_emitted = now
+            _progress_hook(data)
+
+
+def _progress_frames_per_second(value: Any) -> float:
+    try:
+        frames = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PROGRESS_FRAMES_PER_SECOND
+    return frames if frames >= 0 else DEFAULT_PROGRESS_FRAMES_PER_SECOND
+
+
 def _summarize_formats(info: Any) -> list[dict[str, Any]]:
     if not isinstance(info, Mapping):
         return []
@@ -199,6 +267,125 @@ def _metadata_event(info: Any) -> dict[str, Any]:
     }
 
 
+class _MetadataAnnouncer(yt_dlp.postprocessor.PostProcessor):
+    """Emit the format list before format selection so a failed selection still carries it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.announced = False
+
+    def run(self, info: dict[str, Any]) -> tuple[list[str], dict[str, Any]]:
+        if not self.announced:
+            self.announced = True
+            _emit("metadata", **_metadata_event(info))
+        return [], info
+
+
+class _CompletionAnnouncer(yt_dlp.postprocessor.PostProcessor):
+    """Report each video's final file once every post-processor has moved it into place."""
+
+    def run(self, info: dict[str, Any]) -> tuple[list[str], dict[str, Any]]:
+        filepath = info.get("filepath")
+        if info.get("id") and filepath:
+            _emit("completed", id=str(info["id"]), filepath=str(filepath))
+        return [], info
+
+
+def _playlist_event(info: Any) -> dict[str, Any]:
+    """Summarize a flat playlist extraction as ordered, downloadable entries.
+
+    Nested playlists, such as the tabs a channel home lists, are not videos
+    and are left out.
+    """
+    if not isinstance(info, Mapping):
+        return {"entries": []}
+    entries: list[dict[str, Any]] = []
+    for position, entry in enumerate(info.get("entries") or (), start=1):
+        if not isinstance(entry, Mapping) or _is_nested_playlist(entry):
+            continue
+        video_id = str(entry.get("id") or "")
+        url = str(entry.get("webpage_url") or entry.get("url") or "")
+        if video_id and not url.startswith(("http://", "https://")):
+            url = f"https://www.youtube.com/watch?v={video_id}"
+        if not url:
+            continue
+        entries.append(
+            {
+                "index": int(entry.get("playlist_index") or position),
+                "id": video_id,
+                "url": url,
+                "title": str(entry.get("title") or ""),
+            }
+        )
+    return {
+        "id": str(info.get("id") or ""),
+        "title": str(info.get("title") or ""),
+        "entries": entries,
+    }
+
+
+def _is_nested_playlist(entry: Mapping[str, Any]) -> bool:
+    return entry.get("_type") == "playlist" or entry.get("ie_key") == "YoutubeTab"
+
+
+def _list_until_known(ydl: Any, url: str, known: set[str], streak: int) -> Any:
+    """List a newest-first playlist lazily, stopping after ``streak`` known entries in a row.
+
+    Without ``process`` yt-dlp hands back its page generator, so entries past
+    the stop point are never requested from YouTube.
+    """
+    info = ydl.extract_info(url, download=False, process=False)
+    for _redirect in range(3):
+        if not isinstance(info, Mapping) or info.get("_type") not in {"url", "url_transparent"}:
+            break
+        info = ydl.extract_info(
+            info["url"], download=False, process=False, ie_key=info.get("ie_key")
+        )
+    if not isinstance(info, Mapping):
+        return info
+    entries: list[Any] = []
+    run = 0
+    for entry in info.get("entries") or ():
+        entries.append(entry)
+        video_id = entry.get("id") if isinstance(entry, Mapping) else None
+        run = run + 1 if video_id in known else 0
+        if run >= streak:
+            break
+    return {**info, "entries": entries}
+
+
+def _download_extracted(ydl: Any, info: Mapping[str, Any], url: str) -> int:
+    """Download from the preflight info dict instead of extracting the page again.
+
+    Mirrors ``YoutubeDL.download_with_info_file``: when yt-dlp asks for a fresh
+    extraction (for example expired format URLs) fall back to the URL.
+    """
+    try:
+        ydl.process_ie_result(dict(info), download=True)
+    except yt_dlp.utils.ReExtractInfo:
+        return ydl.download([url])
+    return int(getattr(ydl, "_download_retcode", 0) or 0)
+
+
+def _claim_download(path: str, owner: str) -> bool:
+    """Create the shared claim file for ``owner``, or confirm ``owner`` already holds it.
+
+    Only the first of several racing workers creates the file; later attempts of
+    the same owner (format fallbacks, retries) keep their claim.
+    """
+    try:
+        descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                return handle.read() == owner
+        except OSError:
+            return False
+    with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+        handle.write(owner)
+    return True
+
+
 def run_worker(request: Mapping[str, Any]) -> int:
     url = str(request.get("url") or "")
     raw_options = request.get("options")
@@ -219,8 +406,12 @@ def run_worker(request: Mapping[str, Any]) -> int:
             message=(f"external_po_helper_unavailable: {redact_po_token_material(str(exc))}"),
         )
         return 1
+    configure_yt_dlp_challenge_solver()
     options["logger"] = ProtocolLogger()
-    options["progress_hooks"] = [_progress_hook]
+    coalescer = _ProgressCoalescer(
+        _progress_frames_per_second(request.get("progress_frames_per_second"))
+    )
+    options["progress_hooks"] = [coalescer]
     if isinstance(options.get("cookiesfrombrowser"), list):
         options["cookiesfrombrowser"] = tuple(options["cookiesfrombrowser"])
 
@@ -230,10 +421,16 @@ def run_worker(request: Mapping[str, Any]) -> int:
         options["skip_download"] = True
         options["simulate"] = True
         options["ignore_no_formats_error"] = True
+    elif mode == "expand":
+        options.pop("format", None)
+        options.pop("postprocessors", None)
+        options["extract_flat"] = "in_playlist"
+        options["skip_download"] = True
+        options["simulate"] = True
 
     redirected_out = ProtocolTextStream("stdout")
     redirected_err = ProtocolTextStream("stderr")
-    phase = "discovery" if mode == "discover" else "preflight"
+    phase = "discovery" if mode in {"discover", "expand"} else "preflight"
 
     try:
         with contextlib.redirect_stdout(redirected_out), contextlib.redirect_stderr(redirected_err):
@@ -244,18 +441,45 @@ def run_worker(request: Mapping[str, Any]) -> int:
                     )
                     info = ydl.extract_info(url, download=False)
                     _emit("metadata", **_metadata_event(info))
+                elif mode == "expand":
+                    _emit("phase", phase="discovery", message="Listing playlist entries")
+                    known = request.get("known_entries")
+                    if isinstance(known, list) and known:
+                        streak = max(1, int(request.get("known_streak") or 1))
+                        info = _list_until_known(ydl, url, set(map(str, known)), streak)
+                    else:
+                        info = ydl.extract_info(url, download=False)
+                    _emit("playlist", **_playlist_event(info))
                 else:
+                    info = None
                     if not playlist:
+                        announcer = _MetadataAnnouncer()
+                        ydl.add_post_processor(announcer, when="pre_process")
+                        ydl.add_post_processor(_CompletionAnnouncer(), when="after_move")
                         _emit("phase", phase="preflight", message="Preparing YouTube metadata")
                         info = ydl.extract_info(url, download=False)
-                        _emit("metadata", **_metadata_event(info))
+                        if not announcer.announced:
+                            _emit("metadata", **_metadata_event(info))
+                    claim = str(request.get("download_claim") or "")
+                    owner = str(request.get("download_claim_owner") or "")
+                    if claim and not _claim_download(claim, owner):
+                        _emit("phase", phase=DOWNLOAD_CLAIM_LOST_PHASE)
+                        _emit(
+                            "error",
+                            phase="download",
+                            message="Another attempt already started downloading this job",
+                        )
+                        return 1
                     phase = "download"
                     _emit(
                         "phase",
                         phase="download",
                         message=str(request.get("activity_label") or "Downloading media"),
                     )
-                    retcode = ydl.download([url])
+                    if isinstance(info, Mapping):
+                        retcode = _download_extracted(ydl, info, url)
+                    else:
+                        retcode = ydl.download([url])
                     if retcode:
                         _emit("error", phase=phase, message=f"yt-dlp returned exit code {retcode}")
                         return int(retcode)
@@ -272,16 +496,67 @@ def run_worker(request: Mapping[str, Any]) -> int:
     finally:
         redirected_out.flush()
         redirected_err.flush()
+        if coalescer.suppressed:
+            _emit(
+                "log",
+                stream="stdout",
+                message=f"[progress] Coalesced {coalescer.suppressed} intermediate progress reports",
+            )
 
     _emit("result", success=True)
     return 0
 
 
-def main() -> int:
+def _apply_request_environment(environment: Any) -> None:
+    if not isinstance(environment, Mapping):
+        return
+    for key in REQUEST_ENVIRONMENT_KEYS:
+        value = environment.get(key)
+        if isinstance(value, str) and value:
+            os.environ[key] = value
+    # tempfile caches its directory on first use; recompute for this request.
+    tempfile.tempdir = None
+
+
+def serve(input_stream: TextIO) -> int:
+    """Handle newline-framed requests until the parent closes stdin.
+
+    Every request, valid or not, ends with exactly one ``complete`` frame
+    carrying the exit code a one-shot worker would have returned.
+    """
+    for line in input_stream:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            _emit("error", phase="startup", message=f"Invalid internal request: {exc}")
+            _emit(PROTOCOL_COMPLETE_KIND, exit_code=2)
+            continue
+        if not isinstance(request, Mapping):
+            _emit("error", phase="startup", message="Internal request must be a JSON object")
+            _emit(PROTOCOL_COMPLETE_KIND, exit_code=2)
+            continue
+        _apply_request_environment(request.get("environment"))
+        try:
+            if request.get("mode") == "protocol_smoke":
+                exit_code = run_protocol_smoke()
+            else:
+                exit_code = run_worker(request)
+        except Exception as exc:
+            _emit("error", phase="startup", message=str(exc))
+            exit_code = 1
+        _emit(PROTOCOL_COMPLETE_KIND, exit_code=exit_code)
+    return 0
+
+
+def main(*, serve_requests: bool = False) -> int:
     try:
         # PyInstaller's windowed bootloader may install a non-None dummy stdin.
         # The parent always supplies an OS pipe, so read fd 0 directly here.
         input_stream = _stdio_stream(0, None, "r")
+        if serve_requests:
+            return serve(input_stream)
         request = json.loads(input_stream.read())
     except (OSError, json.JSONDecodeError) as exc:
         _emit("error", phase="startup", message=f"Invalid internal request: {exc}")
@@ -295,4 +570,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(main(serve_requests="--serve" in sys.argv[1:]))
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import os
 import sys
-import traceback
 from datetime import datetime
 from pathlib import Path
-from threading import Event, Lock
+from threading import Lock
 
 from PySide6.QtCore import QPoint, QRect, QSettings, Qt, QThread, QTimer, QUrl, Signal, Slot
 from PySide6.QtGui import QColor, QDesktopServices, QIcon, QPixmap
@@ -26,6 +25,7 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMainWindow,
+    QMenu,
     QMessageBox,
     QProgressBar,
     QProgressDialog,
@@ -52,6 +52,15 @@ from neural_extractor_v3.config import (
 )
 from neural_extractor_v3.core.diagnostics import run_support_diagnostics
 from neural_extractor_v3.core.downloader import DownloadEngine
+from neural_extractor_v3.core.job_journal import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_ORIGIN_GUI,
+    JOB_RUNNING,
+    JobJournal,
+    JournaledJob,
+    get_job_journal,
+)
 from neural_extractor_v3.core.js_runtime import (
     MISSING_JS_RUNTIME_MESSAGE,
     ensure_youtube_js_runtime,
@@ -60,6 +69,7 @@ from neural_extractor_v3.core.pot_provider import (
     PoTokenProviderStatus,
     get_po_token_provider,
 )
+from neural_extractor_v3.core.scheduler import DownloadScheduler
 from neural_extractor_v3.core.update_installer import (
     PreparedUpdate,
     assess_installation_capability,
@@ -88,6 +98,7 @@ from neural_extractor_v3.gui.responsive_layout import (
 from neural_extractor_v3.models import (
     DownloadJob,
     DownloadOptions,
+    DownloadResult,
     MediaMode,
     PlaylistMode,
 )
@@ -113,9 +124,14 @@ PLAYLIST_TOOLTIP = (
     "How playlist and mix URLs are handled:\n"
     "• Auto detect — plain video links download alone, playlist links download fully\n"
     "• Current video only — ignore the playlist and fetch just the linked video\n"
-    "• Full playlist / mix — always expand and download every entry"
+    "• Full playlist / mix — always expand and download every entry\n"
+    "• Sync new playlist items — download only entries not fetched by an earlier sync;\n"
+    "  a channel home is synced through its /videos tab"
 )
 
+PARALLEL_DOWNLOADS_KEY = "downloads/max_parallel_jobs"
+PARALLEL_DOWNLOAD_CHOICES = (1, 2, 3, 4)
+
 STATUS_COLORS: tuple[tuple[str, str], ...] = (
     ("Queued", "#8b98ad"),
     ("Starting", "#7cc7ff"),
@@ -148,101 +164,58 @@ class DownloadWorker(QThread):
     log = Signal(str)
     batch_finished = Signal()
 
-    def __init__(self, jobs: list[DownloadJob], options: DownloadOptions) -> None:
+    def __init__(
+        self,
+        jobs: list[DownloadJob],
+        options: DownloadOptions,
+        journal: JobJournal | None = None,
+        job_options: dict[str, DownloadOptions] | None = None,
+    ) -> None:
         super().__init__()
         self.jobs = jobs
         self.options = options
-        self.engine: DownloadEngine | None = None
-        self._stop_event = Event()
-        self._state_lock = Lock()
-        self._current_job_id: str | None = None
+        self.job_options = job_options or {}
+        self.scheduler = DownloadScheduler(
+            options,
+            engine_factory=DownloadEngine,
+            progress_callback=self._on_progress,
+            log_callback=self.log.emit,
+            job_started=lambda job: self.job_started.emit(job.job_id, job.url),
+            job_finished=self._on_job_finished,
+            journal=journal,
+        )
         self._last_progress_by_job_id: dict[str, tuple[int, str, str]] = {}
 
     @property
     def stop_requested(self) -> bool:
-        return self._stop_event.is_set()
+        return self.scheduler.stop_requested
+
+    def active_job_ids(self) -> list[str]:
+        return self.scheduler.active_job_ids()
 
     def current_job_id(self) -> str | None:
-        with self._state_lock:
-            return self._current_job_id
+        active = self.scheduler.active_job_ids()
+        return active[0] if active else None
 
     def request_stop(self) -> str | None:
-        self._stop_event.set()
-        with self._state_lock:
-            engine = self.engine
-            job_id = self._current_job_id
-        if engine:
-            engine.cancel()
-        return job_id
+        active = self.scheduler.cancel()
+        return active[0] if active else None
+
+    def cancel_job(self, job_id: str) -> bool:
+        return bool(self.scheduler.cancel(job_id))
 
     def run(self) -> None:
         try:
-            for index, job in enumerate(self.jobs):
-                if self.stop_requested:
-                    self._emit_cancelled_jobs(self.jobs[index:])
-                    break
-
-                with self._state_lock:
-                    self._current_job_id = job.job_id
-                self.job_started.emit(job.job_id, job.url)
-
-                try:
-                    engine = DownloadEngine(
-                        self.options,
-                        progress_callback=self._on_progress,
-                        log_callback=self.log.emit,
-                    )
-                    with self._state_lock:
-                        self.engine = engine
-
-                    if self.stop_requested:
-                        engine.cancel()
-                        self.job_finished.emit(job.job_id, False, "Cancelled", "cancelled")
-                    else:
-                        result = engine.download(job)
-                        raw_category = getattr(result, "failure_category", "")
-                        failure_category = str(
-                            getattr(raw_category, "value", raw_category) or ""
-                        )
-                        if self.stop_requested and not result.success:
-                            failure_category = "cancelled"
-                        self.job_finished.emit(
-                            job.job_id,
-                            result.success,
-                            result.message,
-                            failure_category,
-                        )
-                except Exception:
-                    self.log.emit("Download worker exception:\n" + traceback.format_exc())
-                    if self.stop_requested:
-                        self.job_finished.emit(job.job_id, False, "Cancelled", "cancelled")
-                    else:
-                        self.job_finished.emit(
-                            job.job_id,
-                            False,
-                            "Download failed unexpectedly. See the Activity Log for details.",
-                            "unknown_ytdlp_failure",
-                        )
-                finally:
-                    with self._state_lock:
-                        self.engine = None
-                        self._current_job_id = None
-
-                if self.stop_requested:
-                    self._emit_cancelled_jobs(self.jobs[index + 1 :])
-                    break
+            self.scheduler.run(self.jobs, job_options=self.job_options)
         finally:
-            with self._state_lock:
-                self.engine = None
-                self._current_job_id = None
             self.batch_finished.emit()
 
-    def _emit_cancelled_jobs(self, jobs: list[DownloadJob]) -> None:
-        for job in jobs:
-            self.job_finished.emit(job.job_id, False, "Cancelled", "cancelled")
+    def _on_job_finished(self, job: DownloadJob, result: DownloadResult) -> None:
+        self.job_finished.emit(job.job_id, result.success, result.message, result.failure_category)
 
     def _on_progress(self, event) -> None:
-        if self.stop_requested:
+        cancelling = self.scheduler.is_cancelled(event.job_id)
+        if cancelling:
             status = "Cancelling"
         elif event.status == "downloading":
             status = f"Downloading {event.percent}%"
@@ -256,7 +229,7 @@ class DownloadWorker(QThread):
                 else raw_status
             )
 
-        detail_parts = ["Cancelling download"] if self.stop_requested else []
+        detail_parts = ["Cancelling download"] if cancelling else []
         if event.playlist_index and event.playlist_total:
             detail_parts.append(f"{event.playlist_index}/{event.playlist_total}")
         if event.title:
@@ -445,9 +418,13 @@ class MainWindow(QMainWindow):
         self.youtube_connection = self.youtube_connections[ManagedBrowser.CHROME]
         self.jobs: list[DownloadJob] = []
         self.row_by_job_id: dict[str, int] = {}
+        self.job_journal = get_job_journal()
+        # Restored jobs resume with the folder, mode and quality they were journaled with.
+        self._journaled_jobs: dict[str, JournaledJob] = {}
         self.progress_by_job_id: dict[str, QProgressBar] = {}
         self.worker: DownloadWorker | None = None
         self.active_job_id: str | None = None
+        self.running_job_ids: set[str] = set()
         self._close_after_worker_stops = False
         self.update_worker: UpdateCheckWorker | None = None
         self.update_install_worker: UpdateInstallWorker | None = None
@@ -1027,6 +1004,23 @@ class MainWindow(QMainWindow):
         hint = QLabel("Applies when a URL points to a playlist or mix.")
         hint.setObjectName("hintLabel")
         layout.addWidget(hint)
+
+        self.parallel_jobs_combo = QComboBox()
+        for count in PARALLEL_DOWNLOAD_CHOICES:
+            self.parallel_jobs_combo.addItem(
+                "One at a time" if count == 1 else f"{count} at once", count
+            )
+        stored_parallel_jobs = self.settings.value(
+            PARALLEL_DOWNLOADS_KEY, PARALLEL_DOWNLOAD_CHOICES[0], type=int
+        )
+        parallel_index = self.parallel_jobs_combo.findData(stored_parallel_jobs)
+        self.parallel_jobs_combo.setCurrentIndex(max(0, parallel_index))
+        self.parallel_jobs_combo.setToolTip(
+            "How many queued URLs download at the same time. Each download keeps its own "
+            "retries and can be cancelled on its own."
+        )
+        self.parallel_jobs_combo.currentIndexChanged.connect(self._save_parallel_downloads)
+        layout.addWidget(self._labeled("PARALLEL DOWNLOADS", self.parallel_jobs_combo))
         return group
 
     def _format_group(self) -> QGroupBox:
@@ -1349,6 +1343,8 @@ class MainWindow(QMainWindow):
         self.table.setShowGrid(False)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_job_menu)
         header = self.table.horizontalHeader()
         header.setHighlightSections(False)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
@@ -1427,6 +1423,7 @@ class MainWindow(QMainWindow):
         return [
             *self.mode_buttons.values(),
             self.playlist_combo,
+            self.parallel_jobs_combo,
             self.quality_combo,
             self.audio_quality_combo,
             self.subtitle_check,
@@ -1496,13 +1493,39 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, APP_NAME, "Invalid URL:\n" + invalid[0])
             return False
 
-        for url in urls:
-            self._append_job(DownloadJob(url=url))
+        jobs = [DownloadJob(url=url) for url in urls]
+        for job in jobs:
+            self._append_job(job)
+        self.job_journal.add(jobs)
         self.url_edit.clear()
         self.log(f"Queued {len(urls)} job(s)")
         return True
 
-    def _append_job(self, job: DownloadJob) -> None:
+    def restore_journaled_jobs(self) -> int:
+        """Re-queue jobs an earlier session did not finish; returns how many were restored."""
+        self.job_journal.discard_completed()
+        restored = [
+            entry
+            for entry in self.job_journal.jobs(origin=JOB_ORIGIN_GUI)
+            if entry.job.job_id not in self.row_by_job_id
+        ]
+        defaults = self._collect_options()
+        for entry in restored:
+            self._journaled_jobs[entry.job.job_id] = entry
+            self._append_job(entry.job, mode=entry.resume_options(defaults).media_mode)
+            row = self.row_by_job_id[entry.job.job_id]
+            if entry.state == JOB_FAILED:
+                self._set_status(row, "Failed")
+                self._set_detail(row, entry.message)
+            elif entry.state == JOB_CANCELLED:
+                self._set_status(row, "Cancelled")
+            elif entry.state == JOB_RUNNING:
+                self._set_detail(row, "Interrupted; the partial download will be continued")
+        if restored:
+            self.log(f"Restored {len(restored)} unfinished job(s) from the previous session")
+        return len(restored)
+
+    def _append_job(self, job: DownloadJob, *, mode: MediaMode | None = None) -> None:
         row = self.table.rowCount()
         self.table.insertRow(row)
         self.jobs.append(job)
@@ -1511,7 +1534,7 @@ class MainWindow(QMainWindow):
         source_item = QTableWidgetItem(job.url)
         source_item.setToolTip(job.url)
         self.table.setItem(row, 0, source_item)
-        self.table.setItem(row, 1, QTableWidgetItem(self._current_mode().label))
+        self.table.setItem(row, 1, QTableWidgetItem((mode or self._current_mode()).label))
 
         status_item = QTableWidgetItem("Queued")
         status_font = status_item.font()
@@ -1568,10 +1591,17 @@ class MainWindow(QMainWindow):
                 progress.setValue(0)
 
         options = self._collect_options()
+        job_options = {
+            job.job_id: entry.resume_options(options)
+            for job in runnable_jobs
+            if (entry := self._journaled_jobs.get(job.job_id)) is not None
+        }
         self._set_running_state(True)
         self.log("Starting queue" if reset_auth_attempts else "Resuming authenticated job(s)")
 
-        worker = DownloadWorker(runnable_jobs, options)
+        worker = DownloadWorker(
+            runnable_jobs, options, journal=self.job_journal, job_options=job_options
+        )
         self.worker = worker
         worker.job_started.connect(self.on_job_started)
         worker.progress.connect(self.on_progress)
@@ -1594,8 +1624,12 @@ class MainWindow(QMainWindow):
         if self.worker and self.worker.isRunning():
             self.log("Cancellation requested")
             worker_job_id = self.worker.request_stop()
-            job_id = self.active_job_id or worker_job_id
-            if job_id:
+            job_ids = {
+                job_id
+                for job_id in (self.active_job_id, worker_job_id, *self.running_job_ids)
+                if job_id
+            }
+            for job_id in job_ids:
                 row = self.row_by_job_id.get(job_id)
                 if row is not None:
                     self._set_status(row, "Cancelling")
@@ -1604,6 +1638,72 @@ class MainWindow(QMainWindow):
             self.stop_button.setText("Cancelling...")
             self.stop_button.setEnabled(False)
 
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel one running or not-yet-started job of the active batch."""
+        worker = self.worker
+        if not worker or not worker.isRunning():
+            return False
+        if job_id not in {job.job_id for job in worker.jobs}:
+            return False
+        row = self.row_by_job_id.get(job_id)
+        if row is not None:
+            item = self.table.item(row, 2)
+            if item is not None and item.text() in {"Done", "Failed", "Cancelled"}:
+                return False
+        worker.cancel_job(job_id)
+        self.log(f"Cancellation requested for {self._job_url(job_id)}")
+        if row is not None:
+            self._set_status(row, "Cancelling")
+            self._set_detail(row, "Cancelling download")
+        return True
+
+    def recheck_job(self, job_id: str) -> bool:
+        """Retry one failed job, checking again a video remembered as unavailable."""
+        if self.worker and self.worker.isRunning():
+            return False
+        job = next((job for job in self.jobs if job.job_id == job_id), None)
+        row = self.row_by_job_id.get(job_id)
+        item = self.table.item(row, 2) if row is not None else None
+        if job is None or item is None or item.text() != "Failed":
+            return False
+        job.recheck_unavailable = True
+        self.log(f"Rechecking availability of {job.url}")
+        self._start_download_worker([job], reset_auth_attempts=True)
+        return True
+
+    def _job_url(self, job_id: str) -> str:
+        return next((job.url for job in self.jobs if job.job_id == job_id), job_id)
+
+    def _job_at_row(self, row: int) -> DownloadJob | None:
+        return next((job for job in self.jobs if self.row_by_job_id.get(job.job_id) == row), None)
+
+    def _job_menu(self, row: int) -> QMenu | None:
+        job = self._job_at_row(row)
+        if job is None:
+            return None
+        menu = QMenu(self.table)
+        worker = self.worker
+        cancel_action = menu.addAction("Cancel Job")
+        cancel_action.setEnabled(
+            bool(worker and worker.isRunning())
+            and any(queued.job_id == job.job_id for queued in worker.jobs)
+        )
+        cancel_action.triggered.connect(lambda: self.cancel_job(job.job_id))
+        status = self.table.item(row, 2)
+        recheck_action = menu.addAction("Retry and Recheck Availability")
+        recheck_action.setEnabled(
+            not (worker and worker.isRunning())
+            and status is not None
+            and status.text() == "Failed"
+        )
+        recheck_action.triggered.connect(lambda: self.recheck_job(job.job_id))
+        return menu
+
+    def _show_job_menu(self, position: QPoint) -> None:
+        menu = self._job_menu(self.table.rowAt(position.y()))
+        if menu is not None:
+            menu.exec(self.table.viewport().mapToGlobal(position))
+
     def _runnable_jobs(self) -> list[DownloadJob]:
         runnable_statuses = {"Queued", "Failed", "Cancelled"}
         jobs: list[DownloadJob] = []
@@ -1619,6 +1719,8 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, APP_NAME, "Stop the queue before clearing it.")
             return
         self.jobs.clear()
+        self.job_journal.clear(origin=JOB_ORIGIN_GUI)
+        self._journaled_jobs.clear()
         self.row_by_job_id.clear()
         self.progress_by_job_id.clear()
         self.table.setRowCount(0)
@@ -1939,6 +2041,9 @@ class MainWindow(QMainWindow):
         self.settings.remove("cookie_file")
         self.log("cookies.txt cleared; the guided YouTube connection remains the normal workflow")
 
+    def _save_parallel_downloads(self) -> None:
+        self.settings.setValue(PARALLEL_DOWNLOADS_KEY, self.parallel_jobs_combo.currentData())
+
     def _save_legacy_browser_fallback(self) -> None:
         enabled = self.legacy_browser_check.isChecked()
         self.settings.setValue("youtube_connection/legacy_browser_fallback", enabled)
@@ -2214,6 +2319,7 @@ class MainWindow(QMainWindow):
             dedicated_browser_last_verified=connection.last_verified if connection else None,
             guided_youtube_auth=True,
             legacy_browser_fallback=self.legacy_browser_check.isChecked(),
+            max_parallel_jobs=int(self.parallel_jobs_combo.currentData() or 1),
         )
 
     # ------------------------------------------------------------------ worker slots
@@ -2224,6 +2330,7 @@ class MainWindow(QMainWindow):
         if row is None:
             return
         self.active_job_id = job_id
+        self.running_job_ids.add(job_id)
         self._set_status(row, "Starting")
         self._set_detail(row, url)
         self.statusBar().showMessage(f"Starting {url}")
@@ -2255,6 +2362,7 @@ class MainWindow(QMainWindow):
         message: str,
         failure_category: str = "",
     ) -> None:
+        self.running_job_ids.discard(job_id)
         row = self.row_by_job_id.get(job_id)
         if row is None:
             return
@@ -2388,6 +2496,7 @@ class MainWindow(QMainWindow):
         stopped = bool(worker and worker.stop_requested)
         self._set_running_state(False)
         self.active_job_id = None
+        self.running_job_ids.clear()
         message = "Queue stopped" if stopped else "Queue finished"
         self.statusBar().showMessage(message)
         self.log(message)
@@ -30,6 +30,7 @@ class PlaylistMode(Enum):
     AUTO = "auto"
     SINGLE = "single"
     FULL = "full"
+    SYNC = "sync"
 
     @property
     def label(self) -> str:
@@ -37,6 +38,19 @@ class PlaylistMode(Enum):
             PlaylistMode.AUTO: "Auto detect",
             PlaylistMode.SINGLE: "Current video only",
             PlaylistMode.FULL: "Full playlist / mix",
+            PlaylistMode.SYNC: "Sync new playlist items",
+        }[self]
+
+
+class DownloadAcceleration(Enum):
+    OFF = "off"
+    ADAPTIVE = "adaptive"
+
+    @property
+    def label(self) -> str:
+        return {
+            DownloadAcceleration.OFF: "Off",
+            DownloadAcceleration.ADAPTIVE: "Adaptive fragments and chunks",
         }[self]
 
 
@@ -62,12 +76,19 @@ class DownloadOptions:
     legacy_browser_fallback: bool = False
     overwrite: bool = False
     restrict_filenames: bool = False
+    max_parallel_jobs: int = 1
+    bandwidth_limit: int | None = None
+    acceleration: DownloadAcceleration = DownloadAcceleration.OFF
+    hedged_attempts: bool = False
 
 
 @dataclass(slots=True)
 class DownloadJob:
     url: str
     job_id: str = field(default_factory=lambda: uuid4().hex[:10])
+    playlist_title: str = ""
+    playlist_index: int | None = None
+    recheck_unavailable: bool = False
 
 
 @dataclass(slots=True)
@@ -104,3 +125,4 @@ class DownloadResult:
     message: str
     files: list[Path] = field(default_factory=list)
     failure_category: str = ""
+    entries: list[DownloadResult] = field(default_factory=list)
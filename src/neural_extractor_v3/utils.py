@@ -9,6 +9,8 @@ from urllib.parse import parse_qs, urlparse, urlunparse
 from neural_extractor_v3.config import YOUTUBE_HOSTS
 
 INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+BYTE_RATE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?(?:/s)?", re.IGNORECASE)
+BYTE_RATE_MULTIPLIERS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
 
 
 def sanitize_filename(value: str, max_length: int = 180) -> str:
@@ -76,6 +78,11 @@ def has_playlist_marker(url: str) -> bool:
     return bool(list_id or parsed.path.startswith("/playlist"))
 
 
+def is_youtube_channel_url(url: str) -> bool:
+    parsed = urlparse(normalize_user_url(url))
+    return parsed.path.startswith(("/@", "/channel/", "/c/", "/user/"))
+
+
 def is_youtube_mix_url(url: str) -> bool:
     parsed = urlparse(normalize_user_url(url))
     query = parse_qs(parsed.query)
@@ -90,6 +97,8 @@ def should_download_playlist(url: str, playlist_mode: str) -> bool:
         return False
     if playlist_mode == "full":
         return has_playlist_marker(url)
+    if playlist_mode == "sync":
+        return has_playlist_marker(url) or is_youtube_channel_url(url)
     return has_playlist_marker(url)
 
 
@@ -121,6 +130,19 @@ def format_bytes_per_second(value: float | int | None) -> str:
     return ""
 
 
+def parse_byte_rate(value: str | int | None) -> int | None:
+    """Parse ``500K``/``2.5M``/``1G`` style rates into bytes per second."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return value if value > 0 else None
+    match = BYTE_RATE_PATTERN.fullmatch(str(value).strip())
+    if not match:
+        raise ValueError(f"Invalid byte rate: {value}")
+    amount = float(match.group(1)) * BYTE_RATE_MULTIPLIERS[match.group(2).upper()]
+    return int(amount) if amount >= 1 else None
+
+
 def format_eta(seconds: float | int | None) -> str:
     if seconds is None:
         return ""
@@ -1,9 +1,42 @@
 from __future__ import annotations
 
+import importlib
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+_APP_DATA_SINGLETONS = (
+    ("neural_extractor_v3.core.discovery_cache", "_DEFAULT_CACHE"),
+    ("neural_extractor_v3.core.attempt_outcomes", "_DEFAULT_STORE"),
+    ("neural_extractor_v3.core.negative_cache", "_DEFAULT_CACHE"),
+    ("neural_extractor_v3.core.download_archive", "_DEFAULT_ARCHIVE"),
+    ("neural_extractor_v3.core.playlist_sync", "_DEFAULT_STORE"),
+    ("neural_extractor_v3.core.job_journal", "_DEFAULT_JOURNAL"),
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_app_data(tmp_path, monkeypatch):
+    """Point ``app_data_dir()`` at ``tmp_path`` and start every persisted store empty.
+
+    Learned routes, known-unavailable videos, the download archive, synced
+    playlist entries, the queue journal and cached format discoveries must never
+    leak between tests or into the developer's own data folder.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "local-app-data"))
+    modules = [importlib.import_module(name) for name, _ in _APP_DATA_SINGLETONS]
+    for module, (_, attribute) in zip(modules, _APP_DATA_SINGLETONS, strict=True):
+        monkeypatch.setattr(module, attribute, None)
+    yield
+    for module, (_, attribute) in zip(modules, _APP_DATA_SINGLETONS, strict=True):
+        close = getattr(getattr(module, attribute), "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from neural_extractor_v3.core.acceleration import (
+    AccelerationController,
+    is_throttling_signal,
+)
+from neural_extractor_v3.core.youtube_errors import classify_youtube_failure
+
+MIB = 1024 * 1024
+
+
+def test_controller_climbs_while_more_fragments_pay_off_and_sizes_chunks():
+    controller = AccelerationController(clock=lambda: 0.0)
+
+    first = controller.settings()
+    assert first.concurrent_fragments == 4
+    assert first.http_chunk_size == 10 * MIB
+
+    controller.record_throughput(4, 4 * MIB)
+    assert controller.settings().concurrent_fragments == 5
+    controller.record_throughput(5, 6 * MIB)
+    assert controller.settings().concurrent_fragments == 6
+
+    # A sixth fragment that does not add throughput is given back.
+    controller.record_throughput(6, 6 * MIB)
+    settled = controller.settings()
+    assert settled.concurrent_fragments == 5
+    assert settled.http_chunk_size == int(6 * MIB / 5 * 4)
+    assert controller.settings().concurrent_fragments == 5
+
+
+def test_throttling_halves_the_ceiling_once_per_cooldown_and_recovers():
+    now = [0.0]
+    controller = AccelerationController(clock=lambda: now[0])
+    rate_limited = classify_youtube_failure("ERROR: unable to download: HTTP Error 429")
+    forbidden = classify_youtube_failure("ERROR: unable to download: HTTP Error 403: Forbidden")
+
+    assert rate_limited.rate_limited and is_throttling_signal(rate_limited)
+    assert is_throttling_signal(forbidden)
+    assert not is_throttling_signal(classify_youtube_failure("HTTP Error 503"))
+
+    reduced = controller.back_off()
+    assert reduced is not None and reduced.concurrent_fragments == 2
+    assert controller.back_off() is None
+
+    controller.record_throughput(2, 2 * MIB)
+    assert controller.settings().concurrent_fragments == 2
+
+    now[0] = 300.0
+    assert controller.settings().concurrent_fragments == 3
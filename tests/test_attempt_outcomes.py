@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from neural_extractor_v3.core.attempt_outcomes import (
+    ROUTE_PO_PROVIDER,
+    ROUTE_PUBLIC,
+    ROUTE_VERIFIED_SESSION,
+    AttemptOutcomeStore,
+    url_class,
+)
+
+VIDEO_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+CANDIDATES = (ROUTE_VERIFIED_SESSION, ROUTE_PO_PROVIDER)
+
+
+def _learn(store, klass, *, jobs):
+    for _ in range(jobs):
+        store.record(klass, ROUTE_PUBLIC, success=False)
+        store.record(klass, ROUTE_PO_PROVIDER, success=True, detail={"reason": "po_provider_mweb"})
+
+
+def test_url_classes_separate_hosts_playlists_and_age_gated_videos(tmp_path):
+    store = AttemptOutcomeStore(tmp_path / "outcomes.json")
+
+    assert url_class(VIDEO_URL, playlist_entry=False) == "single:main:open"
+    assert url_class("https://music.youtube.com/watch?v=abc", playlist_entry=True) == (
+        "playlist:music:open"
+    )
+    assert url_class("https://www.youtube.com/shorts/abc", playlist_entry=False) == (
+        "single:shorts:open"
+    )
+
+    store.mark_age_restricted("jNQXAC9IVRw")
+
+    reloaded = AttemptOutcomeStore(tmp_path / "outcomes.json")
+    assert reloaded.classify(VIDEO_URL, playlist_entry=False) == "single:main:age"
+    assert reloaded.classify("https://youtu.be/other", playlist_entry=False) == "single:main:open"
+
+
+def test_store_promotes_a_proven_route_reprobes_public_and_decays(tmp_path):
+    now = [0.0]
+    path = tmp_path / "outcomes.json"
+    store = AttemptOutcomeStore(path, half_life=3600, probe_interval=4, clock=lambda: now[0])
+    klass = "single:main:open"
+
+    _learn(store, klass, jobs=2)
+    assert store.preferred_route(klass, CANDIDATES) is None
+
+    _learn(store, klass, jobs=1)
+    reloaded = AttemptOutcomeStore(path, half_life=3600, probe_interval=4, clock=lambda: now[0])
+    plans = [reloaded.preferred_route(klass, CANDIDATES) for _ in range(4)]
+
+    assert plans == [ROUTE_PO_PROVIDER, ROUTE_PO_PROVIDER, ROUTE_PO_PROVIDER, None]
+    assert reloaded.preferred_route(klass, (ROUTE_VERIFIED_SESSION,)) is None
+    assert reloaded.preferred_route("playlist:main:open", CANDIDATES) is None
+
+    now[0] = 3600.0
+    stats = reloaded.stats(klass)
+    assert stats[ROUTE_PO_PROVIDER].successes == 1.5
+    assert reloaded.preferred_route(klass, CANDIDATES) is None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from neural_extractor_v3.core.discovery_cache import DiscoveryCache, discovery_cache_key
+
+VIDEO_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw"
+FORMATS = [{"format_id": "18", "ext": "mp4", "vcodec": "avc1", "acodec": "mp4a"}]
+
+
+def test_discovery_cache_keys_on_video_auth_and_client_and_expires():
+    now = [0.0]
+    cache = DiscoveryCache(ttl=60, max_entries=8, clock=lambda: now[0])
+    key = discovery_cache_key(VIDEO_URL, "none", ("default",))
+    short_key = discovery_cache_key("https://youtu.be/jNQXAC9IVRw", "none", ["default"])
+
+    cache.put(key, FORMATS, {"id": "jNQXAC9IVRw"})
+    cached = cache.get(short_key)
+
+    assert key == short_key
+    assert cached is not None and cached.formats == FORMATS
+    cached.formats[0]["format_id"] = "mutated"
+    assert cache.get(key).formats == FORMATS
+    assert cache.get(discovery_cache_key(VIDEO_URL, "cookies_file", ("default",))) is None
+    assert cache.get(discovery_cache_key(VIDEO_URL, "none", ("web",))) is None
+
+    now[0] = 60.0
+    assert cache.get(key) is None
+    assert len(cache) == 0
+
+
+def test_discovery_cache_is_bounded_and_skips_uncacheable_results():
+    cache = DiscoveryCache(ttl=60, max_entries=2)
+    keys = [discovery_cache_key(f"https://youtu.be/video{index}", "none", ()) for index in range(3)]
+    for key in keys:
+        cache.put(key, FORMATS)
+    cache.put(discovery_cache_key("https://www.youtube.com/playlist?list=PL1", "none", ()), FORMATS)
+    cache.put(discovery_cache_key("https://youtu.be/empty", "none", ()), [])
+
+    assert len(cache) == 2
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None
+    assert DiscoveryCache(ttl=0).enabled is False
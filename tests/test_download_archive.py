@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+
+from neural_extractor_v3.core.download_archive import DownloadArchive, archive_variant
+from neural_extractor_v3.models import DownloadOptions, MediaMode
+
+
+def test_archive_matches_video_variant_and_survives_reopen(tmp_path):
+    media = tmp_path / "out" / "clip [abc].mp4"
+    media.parent.mkdir()
+    media.write_bytes(b"media bytes")
+    video = archive_variant(DownloadOptions(output_dir=tmp_path, quality="720p"))
+    mp3 = archive_variant(DownloadOptions(output_dir=tmp_path, media_mode=MediaMode.AUDIO_MP3))
+
+    archive = DownloadArchive(tmp_path / "archive.sqlite3", clock=lambda: 42.0)
+    record = archive.record("abc", video, media)
+    archive.close()
+
+    assert record.sha256 == hashlib.sha256(b"media bytes").hexdigest()
+    reopened = DownloadArchive(tmp_path / "archive.sqlite3")
+    try:
+        assert reopened.lookup("abc", video, tmp_path) == record
+        assert reopened.lookup("abc", mp3, tmp_path) is None
+        assert reopened.lookup("abc", video, tmp_path / "elsewhere") is None
+        assert (
+            archive_variant(DownloadOptions(tmp_path, media_mode=MediaMode.THUMBNAIL_ONLY)) is None
+        )
+    finally:
+        reopened.close()
+
+
+def test_changed_or_missing_files_are_downloaded_again(tmp_path):
+    media = tmp_path / "clip.m4a"
+    media.write_bytes(b"complete")
+    variant = archive_variant(DownloadOptions(tmp_path, media_mode=MediaMode.AUDIO_M4A))
+    archive = DownloadArchive(tmp_path / "archive.sqlite3")
+    try:
+        archive.record("abc", variant, media)
+        media.write_bytes(b"partial")
+        assert archive.lookup("abc", variant, tmp_path) is None
+
+        archive.record("abc", variant, media)
+        media.unlink()
+        assert archive.lookup("abc", variant, tmp_path) is None
+        media.write_bytes(b"partial")
+        assert archive.lookup("abc", variant, tmp_path) is None
+        assert archive.record("missing", variant, tmp_path / "missing.m4a") is None
+    finally:
+        archive.close()
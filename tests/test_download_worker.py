@@ -5,8 +5,9 @@ from types import SimpleNamespace
 import pytest
 from PySide6.QtWidgets import QApplication
 
+from neural_extractor_v3.core.job_journal import JOB_ORIGIN_CLI, JOB_ORIGIN_GUI
 from neural_extractor_v3.gui import main_window as gui_module
-from neural_extractor_v3.models import DownloadJob, DownloadOptions
+from neural_extractor_v3.models import DownloadJob, DownloadOptions, DownloadResult, MediaMode
 
 
 def test_cancel_marks_current_and_unstarted_jobs_and_a_new_worker_can_run(
@@ -175,6 +176,42 @@ def test_queue_reruns_failed_and_cancelled_but_not_completed_jobs(main_window):
     assert main_window._runnable_jobs() == [failed, cancelled]
 
 
+def test_unfinished_journaled_jobs_are_restored_into_the_queue(main_window):
+    journal = main_window.job_journal
+    done, interrupted, failed = (
+        DownloadJob(f"https://example.test/{name}") for name in ("done", "interrupted", "failed")
+    )
+    journal.add([done])
+    journal.add(
+        [interrupted],
+        DownloadOptions(output_dir=main_window.output_dir, media_mode=MediaMode.AUDIO_MP3),
+    )
+    journal.add([failed])
+    cli_job = DownloadJob("https://example.test/cli")
+    journal.add([cli_job], origin=JOB_ORIGIN_CLI)
+    journal.mark_finished(done.job_id, DownloadResult(done.job_id, True, "Download completed"))
+    journal.mark_running(interrupted.job_id)
+    journal.mark_finished(
+        failed.job_id, DownloadResult(failed.job_id, False, "Private video", failure_category="x")
+    )
+
+    assert main_window.restore_journaled_jobs() == 2
+    assert main_window.restore_journaled_jobs() == 0
+    assert [job.job_id for job in main_window._runnable_jobs()] == [
+        interrupted.job_id,
+        failed.job_id,
+    ]
+    interrupted_row = main_window.row_by_job_id[interrupted.job_id]
+    assert main_window.table.item(interrupted_row, 1).text() == MediaMode.AUDIO_MP3.label
+    failed_row = main_window.row_by_job_id[failed.job_id]
+    assert main_window.table.item(failed_row, 2).text() == "Failed"
+    assert main_window.table.item(failed_row, 4).text() == "Private video"
+
+    main_window.clear_queue()
+    assert journal.jobs(origin=JOB_ORIGIN_GUI) == []
+    assert journal.unfinished() == [cli_job]
+
+
 def test_stop_immediately_marks_active_row_and_finished_cleanup_is_identity_safe(main_window):
     job = DownloadJob("https://example.test/active")
     main_window._append_job(job)
@@ -209,3 +246,65 @@ def test_stop_immediately_marks_active_row_and_finished_cleanup_is_identity_safe
     assert main_window.worker is None
     assert main_window.start_button.isEnabled()
     assert main_window.statusBar().currentMessage() == "Queue stopped"
+
+
+def test_row_menu_cancels_a_single_job_of_the_running_batch(main_window):
+    running = DownloadJob("https://example.test/running")
+    other = DownloadJob("https://example.test/other")
+    for job in (running, other):
+        main_window._append_job(job)
+    cancelled: list[str] = []
+
+    class FakeWorker:
+        jobs = [running, other]
+
+        def isRunning(self) -> bool:  # noqa: N802 - mirrors QThread's Qt API
+            return True
+
+        def cancel_job(self, job_id: str) -> bool:
+            cancelled.append(job_id)
+            return True
+
+    main_window.worker = FakeWorker()
+    row = main_window.row_by_job_id[running.job_id]
+    menu = main_window._job_menu(row)
+    cancel_action = next(action for action in menu.actions() if action.text() == "Cancel Job")
+
+    assert cancel_action.isEnabled()
+    cancel_action.trigger()
+
+    assert cancelled == [running.job_id]
+    assert main_window.table.item(row, 2).text() == "Cancelling"
+    assert main_window.table.item(main_window.row_by_job_id[other.job_id], 2).text() == "Queued"
+    main_window.worker = None
+    assert not main_window._job_menu(row).actions()[0].isEnabled()
+
+
+def test_row_menu_retries_a_failed_job_with_an_availability_recheck(main_window, monkeypatch):
+    failed = DownloadJob("https://www.youtube.com/watch?v=jNQXAC9IVRw")
+    done = DownloadJob("https://example.test/done")
+    for job in (failed, done):
+        main_window._append_job(job)
+    main_window._set_status(main_window.row_by_job_id[failed.job_id], "Failed")
+    main_window._set_status(main_window.row_by_job_id[done.job_id], "Done")
+    started: list[list[DownloadJob]] = []
+    monkeypatch.setattr(
+        main_window,
+        "_start_download_worker",
+        lambda jobs, *, reset_auth_attempts: started.append(list(jobs)),
+    )
+
+    def recheck_action(job):
+        menu = main_window._job_menu(main_window.row_by_job_id[job.job_id])
+        return next(
+            action for action in menu.actions() if action.text() == "Retry and Recheck Availability"
+        )
+
+    assert not recheck_action(done).isEnabled()
+    action = recheck_action(failed)
+    assert action.isEnabled()
+    action.trigger()
+
+    assert started == [[failed]]
+    assert failed.recheck_unavailable
+    assert not done.recheck_unavailable
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
+from yt_dlp import YoutubeDL
 
+from neural_extractor_v3.core import download_slots as download_slots_module
 from neural_extractor_v3.core import downloader as downloader_module
+from neural_extractor_v3.core.acceleration import AccelerationController
 from neural_extractor_v3.core.auth import (
     AuthResolution,
     AuthStrategy,
     BrowserCookieSource,
     CookieFileStatus,
 )
+from neural_extractor_v3.core.discovery_cache import DiscoveryCache
+from neural_extractor_v3.core.download_slots import DownloadSlots
 from neural_extractor_v3.core.downloader import (
     AUDIO_M4A_SELECTOR,
     AUDIO_MP3_SELECTOR,
@@ -19,6 +27,7 @@ from neural_extractor_v3.core.downloader import (
     MAX_DOWNLOAD_ATTEMPTS,
     VIDEO_MP4_SELECTOR,
     DownloadEngine,
+    PlaylistEntry,
     YtdlpCapturedOutput,
     YtdlpRunError,
     YtdlpRunResult,
@@ -28,6 +37,7 @@ from neural_extractor_v3.core.js_runtime import JavaScriptRuntimeStatus
 from neural_extractor_v3.core.pot_provider import PROVIDER_EXTRACTOR_KEY
 from neural_extractor_v3.core.youtube_errors import FailureCategory
 from neural_extractor_v3.models import (
+    DownloadAcceleration,
     DownloadJob,
     DownloadOptions,
     MediaMode,
@@ -210,9 +220,13 @@ def test_provider_worker_environment_isolates_cache_and_blocks_node_injection(
     attempt_temp = tmp_path / "attempt"
     attempt_temp.mkdir()
 
+    application_data = tmp_path / "app-data"
+    monkeypatch.setattr(downloader_module, "app_data_dir", lambda: application_data)
+
     environment = _engine(tmp_path)._worker_environment(attempt_temp)
 
-    assert environment["XDG_CACHE_HOME"] == str(attempt_temp / "cache")
+    assert environment["TEMP"] == str(attempt_temp)
+    assert environment["XDG_CACHE_HOME"] == str(application_data / "ytdlp-cache")
     assert environment["YTDLP_NO_PLUGINS"] == "1"
     assert environment["FORCE_COLOR"] == "false"
     assert "NODE_OPTIONS" not in environment
@@ -657,6 +671,66 @@ def test_format_discovery_selects_only_actual_available_ids(tmp_path, monkeypatc
     assert "best" not in downloads[1]
 
 
+def test_retry_in_the_same_batch_reuses_the_cached_format_discovery(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    resolution = _resolution(tmp_path, cookie=False, browsers=())
+    _mock_resolution(monkeypatch, resolution)
+    downloads = []
+    discoveries = []
+
+    def run(self, url, options, *, discover_only=False):
+        if discover_only:
+            discoveries.append(_clients(options))
+            return YtdlpRunResult(formats=_media_formats())
+        downloads.append(str(options["format"]))
+        if options["format"] == VIDEO_MP4_SELECTOR:
+            raise _error("ERROR: Requested format is not available", options, phase="preflight")
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+
+    first = _engine(tmp_path).download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+    second = _engine(tmp_path).download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert first.success and second.success
+    assert len(discoveries) == 1
+    assert downloads[1] == downloads[3] != VIDEO_MP4_SELECTOR
+
+
+def test_format_failure_reuses_formats_the_attempt_reported_without_discovery(
+    tmp_path, monkeypatch
+):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    monkeypatch.setattr(downloader_module, "get_discovery_cache", lambda: DiscoveryCache(ttl=0))
+    downloads = []
+    discoveries = []
+
+    def run(self, url, options, *, discover_only=False):
+        if discover_only:
+            discoveries.append(_clients(options))
+            return YtdlpRunResult(formats=_media_formats())
+        downloads.append(str(options["format"]))
+        if options["format"] == VIDEO_MP4_SELECTOR:
+            raise _error(
+                "ERROR: Requested format is not available",
+                options,
+                phase="preflight",
+                formats=_media_formats(),
+                metadata={"id": "jNQXAC9IVRw"},
+            )
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+
+    result = _engine(tmp_path).download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert result.success
+    assert discoveries == []
+    assert downloads[0] == VIDEO_MP4_SELECTOR
+    assert "137" in downloads[1] and "140" in downloads[1]
+
+
 def test_image_only_discovery_does_not_start_media_fallback(tmp_path, monkeypatch):
     _mock_runtime(monkeypatch, tmp_path)
     resolution = _resolution(tmp_path, cookie=False, browsers=())
@@ -861,6 +935,459 @@ def test_mix_url_normalizes_to_current_video_only_and_command_has_no_playlist(
     assert logs == ["YouTube Mix detected. Downloading current video only."]
 
 
+@pytest.mark.parametrize("restrict", [False, True])
+@pytest.mark.parametrize(
+    "title", ["Mixed: 100%", "AC/DC | Live?", "  .Dots. ", "Ümlaut \u2014 Mix"]
+)
+def test_literal_playlist_folder_matches_yt_dlp_playlist_expansion(title, restrict):
+    params = {"restrictfilenames": restrict, "windowsfilenames": True, "quiet": True}
+    with YoutubeDL(params) as ydl:
+        expected = ydl.evaluate_outtmpl("%(playlist)s", {"playlist": title}, True)
+    literal = downloader_module._literal_path_component(title, restrict)
+
+    assert literal.replace("%%", "%") == expected
+
+
+def test_full_playlist_downloads_entries_in_parallel_with_aggregate_progress(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    entries = [
+        PlaylistEntry(index, f"https://www.youtube.com/watch?v=video{index}", f"video{index}")
+        for index in range(1, 5)
+    ]
+    lock = threading.Lock()
+    release = threading.Event()
+    state = {"active": 0, "peak": 0}
+    templates = []
+    events = []
+
+    def run(self, url, options, *, discover_only=False, expand_playlist=False, known_entries=()):
+        if expand_playlist:
+            assert url == "https://www.youtube.com/playlist?list=PLoffline"
+            return YtdlpRunResult(playlist_title="Mixed: 100%", entries=entries)
+        assert options["noplaylist"] is True
+        with lock:
+            templates.append(options["outtmpl"])
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            if state["peak"] == 2:
+                release.set()
+        release.wait(5)
+        with lock:
+            state["active"] -= 1
+        self._progress_hook(
+            {"status": "downloading", "downloaded_bytes": 1, "total_bytes": 1, "info_dict": {}}
+        )
+        if url.endswith("video3"):
+            raise _error("ERROR: [youtube] video3: Private video. Sign in", options)
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(downloader_module, "PLAYLIST_ENTRY_PARALLELISM", 2)
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(
+        DownloadOptions(output_dir=tmp_path, playlist_mode=PlaylistMode.FULL),
+        progress_callback=events.append,
+    )
+    job = DownloadJob("https://www.youtube.com/playlist?list=PLoffline")
+
+    result = engine.download(job)
+
+    assert state["peak"] == 2
+    assert sorted(templates) == [
+        str(tmp_path / "Mixed\uff1a 100%%" / f"{index:03d} - %(title).180B [%(id)s].%(ext)s")
+        for index in range(1, 5)
+    ]
+    assert not result.success
+    assert result.failure_category == FailureCategory.AUTHENTICATION_REQUIRED.value
+    assert "1 of 4 entries failed" in result.message
+    assert [entry.success for entry in result.entries] == [True, True, False, True]
+    assert {event.job_id for event in events} == {job.job_id}
+    assert events[-1].percent == 100
+    assert all(event.playlist_total == 4 for event in events if event.playlist_index)
+
+
+def test_playlist_entries_draw_extra_workers_from_the_shared_download_slots(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    entries = [
+        PlaylistEntry(index, f"https://www.youtube.com/watch?v=video{index}", f"video{index}")
+        for index in range(1, 7)
+    ]
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def run(self, url, options, *, discover_only=False, expand_playlist=False, known_entries=()):
+        if expand_playlist:
+            return YtdlpRunResult(playlist_title="Shared", entries=entries)
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.1)
+        with lock:
+            state["active"] -= 1
+        return YtdlpRunResult()
+
+    # Three process-wide slots: this job holds one and another job holds a second.
+    slots = DownloadSlots(3)
+    monkeypatch.setattr(download_slots_module, "_DEFAULT_SLOTS", slots)
+    monkeypatch.setattr(downloader_module, "PLAYLIST_ENTRY_PARALLELISM", 4)
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(DownloadOptions(output_dir=tmp_path, playlist_mode=PlaylistMode.FULL))
+
+    with slots.hold(), slots.hold():
+        result = engine.download(DownloadJob("https://www.youtube.com/playlist?list=PLshared"))
+
+    assert result.success
+    assert len(result.entries) == 6
+    assert state["peak"] == 2
+
+
+def test_adaptive_acceleration_sets_fragments_and_backs_off_on_media_403(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    controller = AccelerationController(clock=lambda: 0.0)
+    monkeypatch.setattr(downloader_module, "get_acceleration_controller", lambda: controller)
+    attempts = []
+    logs = []
+
+    def run(self, url, options, *, discover_only=False):
+        attempts.append(options["concurrent_fragment_downloads"])
+        raise _error("ERROR: unable to download video data: HTTP Error 403: Forbidden", options)
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(
+        DownloadOptions(output_dir=tmp_path, acceleration=DownloadAcceleration.ADAPTIVE),
+        log_callback=logs.append,
+    )
+    options = engine.build_ydl_options(PUBLIC_VIDEO_TEST_URL)
+    command = engine._yt_dlp_command(PUBLIC_VIDEO_TEST_URL, options)
+
+    assert options["http_chunk_size"] == 10 * 1024 * 1024
+    assert "--concurrent-fragments 4" in command
+    assert "--http-chunk-size 10485760" in command
+    assert "concurrent_fragment_downloads" not in _engine(tmp_path).build_ydl_options(
+        PUBLIC_VIDEO_TEST_URL
+    )
+
+    result = engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert result.failure_category == FailureCategory.HTTP_403_MEDIA_REJECTED.value
+    assert attempts == [4, 2]
+    assert any("acceleration backed off" in log for log in logs)
+
+
+def test_hedged_mode_races_po_provider_and_cancels_the_slow_public_attempt(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    monkeypatch.setattr(downloader_module, "HEDGED_ATTEMPT_DELAY_SECONDS", 30)
+    cancelled = []
+    logs = []
+    events = []
+
+    def run(self, url, options, *, discover_only=False):
+        if PROVIDER_EXTRACTOR_KEY not in options["extractor_args"]:
+            self._attempt_observer("log", "WARNING: This client requires a PO Token")
+            assert self._cancel_event.wait(5)
+            cancelled.append(_clients(options))
+            raise downloader_module.DownloadCancelledError
+        self._attempt_observer("phase", "download")
+        self._progress_hook({"status": "finished", "filename": str(tmp_path / "video.mp4")})
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(
+        DownloadOptions(output_dir=tmp_path, hedged_attempts=True),
+        progress_callback=events.append,
+        log_callback=logs.append,
+    )
+
+    result = engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert result.success
+    assert result.files == [tmp_path / "video.mp4"]
+    assert cancelled == [DEFAULT_YOUTUBE_CLIENTS]
+    assert any("after leading po_token_required signal" in log for log in logs)
+    assert any("Hedged race won by hedged_po_provider" in log for log in logs)
+    assert not any(event.status == "Cancelling download" for event in events)
+
+
+def test_hedge_is_not_started_once_the_primary_has_already_failed(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    monkeypatch.setattr(downloader_module, "HEDGED_ATTEMPT_DELAY_SECONDS", 30)
+    racers = []
+    logs = []
+
+    def run(self, url, options, *, discover_only=False):
+        if self._download_claim is not None:
+            racers.append(self._download_claim[1])
+        raise _error("ERROR: Unable to download webpage: connection reset", options)
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(
+        DownloadOptions(output_dir=tmp_path, hedged_attempts=True),
+        log_callback=logs.append,
+    )
+
+    result = engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert not result.success
+    assert racers == ["primary"]
+    assert not any("Starting hedged" in log for log in logs)
+
+
+def test_racer_that_loses_the_download_claim_yields_to_the_other_attempt(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    monkeypatch.setattr(downloader_module, "HEDGED_ATTEMPT_DELAY_SECONDS", 30)
+    hedge_running = threading.Event()
+    primary_yielded = threading.Event()
+    logs = []
+
+    def run(self, url, options, *, discover_only=False):
+        if PROVIDER_EXTRACTOR_KEY not in options["extractor_args"]:
+            self._attempt_observer("log", "WARNING: This client requires a PO Token")
+            assert hedge_running.wait(5)
+            self._attempt_observer("phase", downloader_module.DOWNLOAD_CLAIM_LOST_PHASE)
+            primary_yielded.set()
+            raise _error("ERROR: Another attempt already started downloading this job", options)
+        hedge_running.set()
+        assert primary_yielded.wait(5)
+        self._attempt_observer("phase", "download")
+        self._progress_hook({"status": "finished", "filename": str(tmp_path / "video.mp4")})
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(
+        DownloadOptions(output_dir=tmp_path, hedged_attempts=True),
+        log_callback=logs.append,
+    )
+
+    result = engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+
+    assert result.success
+    assert result.files == [tmp_path / "video.mp4"]
+    assert any("Hedged race won by hedged_po_provider" in log for log in logs)
+    assert not any("Another attempt already started" in log for log in logs)
+
+
+def test_learned_outcomes_start_later_jobs_with_the_po_provider_route(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    calls = []
+    logs = []
+
+    def run(self, url, options, *, discover_only=False):
+        provider = PROVIDER_EXTRACTOR_KEY in options["extractor_args"]
+        calls.append("provider" if provider else "public")
+        if not provider:
+            raise _error("WARNING: This client requires a PO Token for video playback", options)
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    engine = DownloadEngine(DownloadOptions(output_dir=tmp_path), log_callback=logs.append)
+
+    for _ in range(3):
+        assert engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL)).success
+    assert calls == ["public", "provider"] * 3
+
+    calls.clear()
+    assert engine.download(DownloadJob(PUBLIC_VIDEO_TEST_URL)).success
+
+    assert calls == ["provider"]
+    assert any("starting with learned_po_provider" in log for log in logs)
+
+
+def test_learned_routes_never_promote_cookies_or_learn_from_video_level_failures(tmp_path):
+    engine = _engine(tmp_path)
+    klass = "single:main:open"
+    for _ in range(5):
+        engine._outcomes.record(klass, downloader_module.ROUTE_PUBLIC, success=False)
+        engine._outcomes.record(klass, downloader_module.ROUTE_VERIFIED_SESSION, success=True)
+
+    assert engine._learned_profile(klass, None, SimpleNamespace()) is None
+
+    profile = SimpleNamespace(reason="public", auth_strategy=SimpleNamespace(provider_id=""))
+    for category in (
+        FailureCategory.VIDEO_UNAVAILABLE,
+        FailureCategory.LIVE_EVENT_ENDED,
+        FailureCategory.UNKNOWN,
+    ):
+        engine._record_outcome("single:main:age", profile, SimpleNamespace(category=category))
+    assert engine._outcomes.stats("single:main:age") == {}
+
+
+def test_a_hedge_started_by_delay_alone_never_sends_the_verified_session(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    engine = _engine(tmp_path)
+    public = AuthStrategy("none", "none", {}, attempted_auth=False)
+    verified = AuthStrategy(
+        "dedicated_browser",
+        "Dedicated Neural Extractor Firefox profile",
+        {"cookiesfrombrowser": ("firefox", str(tmp_path / "profile"))},
+        attempted_auth=True,
+    )
+
+    on_signal = engine._hedge_profile(public, verified, after_failure_signal=True)
+    on_delay = engine._hedge_profile(public, verified, after_failure_signal=False)
+
+    assert on_signal.reason == f"hedged_{downloader_module.ROUTE_VERIFIED_SESSION}"
+    assert on_delay.reason == f"hedged_{downloader_module.ROUTE_PO_PROVIDER}"
+    assert not on_delay.auth_strategy.attempted_auth
+
+    engine.po_token_provider_status = SimpleNamespace(available=False, integrity_verified=False)
+    assert engine._hedge_profile(public, verified, after_failure_signal=False) is None
+
+
+def test_known_unavailable_video_is_answered_without_a_worker_until_rechecked(
+    tmp_path, monkeypatch
+):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    calls = []
+
+    def run(self, url, options, *, discover_only=False):
+        calls.append(url)
+        raise _error(
+            "ERROR: [youtube] jNQXAC9IVRw: Video unavailable. This video has been removed",
+            options,
+            phase="preflight",
+        )
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+
+    first = _engine(tmp_path).download(DownloadJob(PUBLIC_VIDEO_TEST_URL))
+    second = _engine(tmp_path).download(DownloadJob("https://youtu.be/jNQXAC9IVRw"))
+
+    assert first.failure_category == FailureCategory.VIDEO_UNAVAILABLE.value
+    assert second.failure_category == FailureCategory.VIDEO_UNAVAILABLE.value
+    assert second.message == first.message
+    assert len(calls) == 1
+
+    rechecked = _engine(tmp_path).download(
+        DownloadJob(PUBLIC_VIDEO_TEST_URL, recheck_unavailable=True)
+    )
+
+    assert not rechecked.success
+    assert len(calls) == 2
+
+
+def test_archived_entries_are_skipped_on_the_next_run_without_a_worker(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    entries = [
+        PlaylistEntry(index, f"https://www.youtube.com/watch?v=video{index}", f"video{index}")
+        for index in range(1, 3)
+    ]
+    downloads = []
+
+    def run(self, url, options, *, discover_only=False, expand_playlist=False, known_entries=()):
+        if expand_playlist:
+            return YtdlpRunResult(playlist_title="Archive", entries=entries)
+        video_id = url.rsplit("=", 1)[-1]
+        downloads.append(video_id)
+        path = tmp_path / "Archive" / f"{video_id}.mp4"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(video_id.encode())
+        self._completed_media.append((video_id, path))
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    options = DownloadOptions(output_dir=tmp_path, playlist_mode=PlaylistMode.FULL)
+    job = DownloadJob("https://www.youtube.com/playlist?list=PLoffline")
+
+    assert DownloadEngine(options).download(job).success
+    (tmp_path / "Archive" / "video2.mp4").write_bytes(b"truncated download")
+    second = DownloadEngine(options).download(job)
+
+    assert second.success
+    assert sorted(downloads) == ["video1", "video2", "video2"]
+    assert second.entries[0].message == "Already downloaded: video1.mp4"
+
+    single = DownloadEngine(replace(options, playlist_mode=PlaylistMode.SINGLE))
+    assert single.download(DownloadJob(entries[0].url)).message == (
+        "Already downloaded: video1.mp4"
+    )
+    assert len(downloads) == 3
+
+    DownloadEngine(replace(options, overwrite=True)).download(job)
+    assert sorted(downloads[3:]) == ["video1", "video2"]
+
+
+def test_playlist_sync_schedules_only_entries_that_were_not_downloaded_yet(tmp_path, monkeypatch):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    listings = [["video1", "video2", "video3"], ["video4", "video1", "video2", "video3"]]
+    known_seen = []
+    downloads = []
+
+    def run(self, url, options, *, discover_only=False, expand_playlist=False, known_entries=()):
+        if expand_playlist:
+            known_seen.append(set(known_entries))
+            ids = listings[min(len(known_seen), len(listings)) - 1]
+            entries = [
+                PlaylistEntry(index, f"https://www.youtube.com/watch?v={video_id}", video_id)
+                for index, video_id in enumerate(ids, start=1)
+            ]
+            return YtdlpRunResult(playlist_title="Uploads", entries=entries)
+        downloads.append(url.rsplit("=", 1)[-1])
+        if url.endswith("video2") and len(known_seen) == 1:
+            raise _error("ERROR: [youtube] video2: Private video. Sign in", options)
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    options = DownloadOptions(output_dir=tmp_path, playlist_mode=PlaylistMode.SYNC)
+    job = DownloadJob("https://www.youtube.com/playlist?list=UUoffline")
+
+    first = DownloadEngine(options).download(job)
+    second = DownloadEngine(options).download(job)
+    third = DownloadEngine(options).download(job)
+
+    assert not first.success
+    assert known_seen == [set(), {"video1", "video3"}, {"video1", "video2", "video3", "video4"}]
+    assert sorted(downloads) == ["video1", "video2", "video2", "video3", "video4"]
+    assert second.success and len(second.entries) == 2
+    assert third.success
+    assert third.message == "Playlist up to date: no new entries"
+
+
+def test_channel_sync_lists_the_videos_tab_and_fails_instead_of_a_full_download(
+    tmp_path, monkeypatch
+):
+    _mock_runtime(monkeypatch, tmp_path)
+    _mock_resolution(monkeypatch, _resolution(tmp_path, cookie=False, browsers=()))
+    listed = []
+    downloads = []
+    listing = {"entries": []}
+
+    def run(self, url, options, *, discover_only=False, expand_playlist=False, known_entries=()):
+        if expand_playlist:
+            listed.append(url)
+            if listing["entries"] is None:
+                raise _error("ERROR: Unable to download API page: HTTP Error 404", options)
+            return YtdlpRunResult(playlist_title="Uploads", entries=listing["entries"])
+        downloads.append(url)
+        return YtdlpRunResult()
+
+    monkeypatch.setattr(DownloadEngine, "_run_yt_dlp", run)
+    options = DownloadOptions(output_dir=tmp_path, playlist_mode=PlaylistMode.SYNC)
+    job = DownloadJob("https://www.youtube.com/@offline")
+
+    empty = DownloadEngine(options).download(job)
+    listing["entries"] = None
+    failed = DownloadEngine(options).download(job)
+    listing["entries"] = [PlaylistEntry(1, "https://www.youtube.com/watch?v=video1", "video1")]
+    synced = DownloadEngine(options).download(job)
+
+    assert listed == ["https://www.youtube.com/@offline/videos"] * 3
+    assert not empty.success and "found no videos" in empty.message
+    assert not failed.success and failed.message.startswith("Playlist sync could not list")
+    assert synced.success
+    assert downloads == ["https://www.youtube.com/watch?v=video1"]
+    known = downloader_module.get_playlist_sync_store().known_ids("channel:/@offline/videos")
+    assert known == {"video1"}
+
+
 def test_auth_options_merge_without_overwriting_selected_client(tmp_path, monkeypatch):
     _mock_runtime(monkeypatch, tmp_path)
     auth = AuthStrategy(
@@ -882,6 +1409,20 @@ def test_auth_options_merge_without_overwriting_selected_client(tmp_path, monkey
     assert _clients(options) == ("web",)
 
 
+def test_captured_output_keeps_a_bounded_head_and_the_final_error_lines():
+    lines = downloader_module.CapturedLines(max_chars=400)
+    lines.extend(f"[download] {index:4d} of 9999 fragments" for index in range(10_000))
+    lines.append("ERROR: [youtube] abc: Sign in to confirm you're not a bot")
+    kept = list(lines)
+    output = YtdlpCapturedOutput(stderr=kept)
+
+    assert sum(len(line) for line in kept if not line.startswith("[...")) <= 400
+    assert kept[0] == "[download]    0 of 9999 fragments"
+    assert any("line(s) of yt-dlp output omitted" in line for line in kept)
+    assert kept[-1] == "ERROR: [youtube] abc: Sign in to confirm you're not a bot"
+    assert output.stderr_text().endswith("not a bot")
+
+
 def test_command_and_logs_redact_cookie_path_and_secret_values(tmp_path, monkeypatch):
     _mock_runtime(monkeypatch, tmp_path)
     cookie_path = tmp_path / "cookies.txt"
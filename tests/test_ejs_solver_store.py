@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+from neural_extractor_v3.core import ejs_solver_store
+from neural_extractor_v3.core.ejs_solver_store import (
+    EjsSolverStore,
+    SolverPins,
+    ytdlp_remote_components,
+)
+
+LIB_CODE = b"var lib = 'pinned';"
+CORE_CODE = b"var core = 'pinned';"
+
+
+def _pins() -> SolverPins:
+    return SolverPins(
+        version="0.8.0",
+        ytdlp_version="2026.08.19",
+        scripts={
+            "lib": {"minified": ("yt.solver.lib.min.js", hashlib.sha3_512(LIB_CODE).hexdigest())},
+            "core": {
+                "minified": ("yt.solver.core.min.js", hashlib.sha3_512(CORE_CODE).hexdigest())
+            },
+        },
+    )
+
+
+def _cache_record(path, *, version: str, code: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    record = {
+        "yt-dlp_version": "2026.08.19",
+        "data": {"version": version, "variant": "minified", "code": code.decode("utf-8")},
+    }
+    path.write_text(json.dumps(record), encoding="utf-8")
+
+
+def test_store_admits_only_pinned_scripts_and_seeds_the_ytdlp_cache(tmp_path):
+    shipped = tmp_path / "shipped"
+    shipped.mkdir()
+    (shipped / "yt.solver.lib.min.js").write_bytes(LIB_CODE)
+    cache_dir = tmp_path / "cache" / "yt-dlp"
+    _cache_record(cache_dir / "challenge-solver" / "core.json", version="0.8.0", code=b"forged")
+    store = EjsSolverStore(tmp_path / "store", shipped_dir=shipped, pins=_pins())
+
+    status = store.prepare(cache_dir)
+
+    assert not status.ready
+    assert status.detail == "solver v0.8.0 missing core"
+    assert not (cache_dir / "challenge-solver" / "lib.json").exists()
+
+    # A copy yt-dlp fetched itself is harvested once it matches the pin.
+    _cache_record(cache_dir / "challenge-solver" / "core.json", version="0.8.0", code=CORE_CODE)
+    status = store.prepare(cache_dir)
+
+    assert status.ready
+    manifest = json.loads(store.manifest_path.read_text(encoding="utf-8"))
+    assert manifest["scripts"]["core"]["sha256"] == hashlib.sha256(CORE_CODE).hexdigest()
+    seeded = json.loads((cache_dir / "challenge-solver" / "lib.json").read_text("utf-8"))
+    assert seeded["data"] == {
+        "version": "0.8.0",
+        "variant": "minified",
+        "code": LIB_CODE.decode("utf-8"),
+    }
+
+
+def test_store_rehashes_changed_scripts_and_rejects_tampering(tmp_path, monkeypatch):
+    shipped = tmp_path / "shipped"
+    shipped.mkdir()
+    (shipped / "yt.solver.lib.min.js").write_bytes(LIB_CODE)
+    (shipped / "yt.solver.core.min.js").write_bytes(CORE_CODE)
+    cache_dir = tmp_path / "cache" / "yt-dlp"
+    store = EjsSolverStore(tmp_path / "store", shipped_dir=shipped, pins=_pins())
+    assert store.prepare(cache_dir).ready
+
+    hashed: list[int] = []
+    original_sha256 = hashlib.sha256
+
+    def counting_sha256(data=b""):
+        hashed.append(len(data))
+        return original_sha256(data)
+
+    monkeypatch.setattr(hashlib, "sha256", counting_sha256)
+    assert store.status().ready
+    assert hashed == []
+
+    (tmp_path / "store" / "yt.solver.core.min.js").write_bytes(b"var core = 'tampered';")
+    (shipped / "yt.solver.core.min.js").unlink()
+
+    status = store.status()
+
+    assert not status.ready
+    assert hashed
+    assert status.detail == "solver v0.8.0 missing core"
+
+
+def test_remote_ejs_component_is_only_requested_while_the_store_is_incomplete(
+    tmp_path, monkeypatch
+):
+    shipped = tmp_path / "shipped"
+    shipped.mkdir()
+    (shipped / "yt.solver.lib.min.js").write_bytes(LIB_CODE)
+    store = EjsSolverStore(tmp_path / "store", shipped_dir=shipped, pins=_pins())
+    monkeypatch.setattr(ejs_solver_store, "default_ejs_solver_store", lambda: store)
+    cache_dir = tmp_path / "cache" / "yt-dlp"
+
+    assert ytdlp_remote_components(cache_dir) == ["ejs:github"]
+
+    (shipped / "yt.solver.core.min.js").write_bytes(CORE_CODE)
+
+    assert ytdlp_remote_components(cache_dir) == []
+    assert (cache_dir / "challenge-solver" / "core.json").is_file()
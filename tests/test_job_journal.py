@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+from neural_extractor_v3 import app
+from neural_extractor_v3.core.job_journal import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_ORIGIN_CLI,
+    JOB_ORIGIN_GUI,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JobJournal,
+    get_job_journal,
+)
+from neural_extractor_v3.core.scheduler import DownloadScheduler
+from neural_extractor_v3.models import (
+    DownloadJob,
+    DownloadOptions,
+    DownloadResult,
+    MediaMode,
+)
+
+
+def test_scheduler_journals_transitions_and_a_crash_leaves_jobs_resumable(tmp_path):
+    path = tmp_path / "queue.sqlite3"
+    journal = JobJournal(path)
+    jobs = [DownloadJob(f"https://example.test/{index}") for index in range(4)]
+
+    class Engine:
+        def __init__(self, options, progress_callback=None, log_callback=None):
+            pass
+
+        def cancel(self) -> None:
+            pass
+
+        def download(self, job):
+            if job is jobs[1]:
+                return SimpleNamespace(success=False, message="gone", failure_category="private")
+            if job is jobs[2]:
+                scheduler.cancel()
+                return SimpleNamespace(success=False, message="stopped", failure_category="")
+            return SimpleNamespace(success=True, message="done", failure_category="")
+
+    scheduler = DownloadScheduler(
+        DownloadOptions(output_dir=tmp_path), engine_factory=Engine, journal=journal
+    )
+    scheduler.run(jobs)
+    journal.close()
+
+    reopened = JobJournal(path)
+    try:
+        states = [(entry.job.url, entry.state) for entry in reopened.jobs()]
+        assert states == [
+            (jobs[0].url, JOB_COMPLETED),
+            (jobs[1].url, JOB_FAILED),
+            (jobs[2].url, JOB_CANCELLED),
+            (jobs[3].url, JOB_CANCELLED),
+        ]
+
+        crashed = DownloadJob("https://example.test/crashed", playlist_title="Mix")
+        reopened.add([crashed, jobs[0]])
+        reopened.mark_running(crashed.job_id)
+        reopened.discard_completed()
+
+        assert [entry.state for entry in reopened.jobs()] == [
+            JOB_FAILED,
+            JOB_CANCELLED,
+            JOB_CANCELLED,
+            JOB_RUNNING,
+        ]
+        assert reopened.unfinished() == [jobs[2], jobs[3], crashed]
+        assert [entry.state for entry in reopened.jobs([JOB_QUEUED])] == []
+    finally:
+        reopened.close()
+
+
+def test_cli_resume_runs_unfinished_jobs_before_new_urls(monkeypatch):
+    journal = get_job_journal()
+    interrupted = DownloadJob("https://www.youtube.com/watch?v=interrupted")
+    journal.add([interrupted], origin=JOB_ORIGIN_CLI)
+    journal.mark_running(interrupted.job_id)
+    submitted: list[list[DownloadJob]] = []
+
+    class RecordingScheduler:
+        def __init__(self, options, **kwargs):
+            assert kwargs["journal"] is journal
+
+        def run(self, jobs, job_options=None):
+            submitted.append(list(jobs))
+            return [SimpleNamespace(success=True) for _ in jobs]
+
+    monkeypatch.setattr(app, "DownloadScheduler", RecordingScheduler)
+    monkeypatch.setattr(app, "recover_stale_download_processes", lambda log: [])
+    args = app._parse_args(["--resume", "--url", "https://youtu.be/new"])
+
+    assert app.run_cli(args) == 0
+    assert [job.url for job in submitted[0]] == [
+        interrupted.url,
+        "https://youtu.be/new",
+    ]
+    assert submitted[0][0].job_id == interrupted.job_id
+
+
+def test_resume_uses_each_jobs_options_snapshot_and_only_its_own_front_end(monkeypatch, tmp_path):
+    journal = get_job_journal()
+    queued_from_cli = DownloadOptions(
+        output_dir=tmp_path / "music", media_mode=MediaMode.AUDIO_M4A, quality="720p"
+    )
+    interrupted = DownloadJob("https://www.youtube.com/watch?v=interrupted")
+    failed = DownloadJob("https://www.youtube.com/watch?v=failed")
+    from_gui = DownloadJob("https://www.youtube.com/watch?v=gui")
+    journal.add([interrupted, failed], queued_from_cli, origin=JOB_ORIGIN_CLI)
+    journal.add([from_gui])
+    journal.mark_running(interrupted.job_id)
+    journal.mark_finished(failed.job_id, DownloadResult(failed.job_id, False, "Private video"))
+    submitted: list[tuple[list[DownloadJob], dict[str, DownloadOptions]]] = []
+
+    class RecordingScheduler:
+        def __init__(self, options, **kwargs):
+            assert kwargs["journal_origin"] == JOB_ORIGIN_CLI
+
+        def run(self, jobs, job_options=None):
+            submitted.append((list(jobs), dict(job_options or {})))
+            return [SimpleNamespace(success=True) for _ in jobs]
+
+    monkeypatch.setattr(app, "DownloadScheduler", RecordingScheduler)
+    monkeypatch.setattr(app, "recover_stale_download_processes", lambda log: [])
+    args = app._parse_args(["--resume", "--output", str(tmp_path / "elsewhere")])
+
+    assert app.run_cli(args) == 0
+    jobs, job_options = submitted[0]
+    assert jobs == [interrupted]
+    resumed = job_options[interrupted.job_id]
+    assert resumed.output_dir == tmp_path / "music"
+    assert resumed.media_mode == MediaMode.AUDIO_M4A
+    assert resumed.quality == "720p"
+    # The CLI batch forgets its failures; the GUI's queue is left alone.
+    assert [(entry.job, entry.origin) for entry in journal.jobs()] == [
+        (interrupted, JOB_ORIGIN_CLI),
+        (from_gui, JOB_ORIGIN_GUI),
+    ]
+
+
+def test_journals_from_before_snapshots_are_migrated_in_place(tmp_path):
+    path = tmp_path / "queue.sqlite3"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE jobs (position INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "job_id TEXT NOT NULL UNIQUE, url TEXT NOT NULL, "
+            "playlist_title TEXT NOT NULL DEFAULT '', playlist_index INTEGER, "
+            "recheck_unavailable INTEGER NOT NULL DEFAULT 0, state TEXT NOT NULL, "
+            "message TEXT NOT NULL DEFAULT '', failure_category TEXT NOT NULL DEFAULT '', "
+            "updated_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO jobs (job_id, url, state, updated_at) VALUES ('old', 'https://x', ?, 0)",
+            (JOB_QUEUED,),
+        )
+    connection.close()
+    journal = JobJournal(path)
+    try:
+        (entry,) = journal.jobs(origin=JOB_ORIGIN_GUI)
+        defaults = DownloadOptions(output_dir=Path("unchanged"))
+        assert entry.resume_options(defaults) is defaults
+
+        journal.add([entry.job], DownloadOptions(output_dir=tmp_path, quality="480p"))
+        (entry,) = journal.jobs()
+        assert entry.state == JOB_QUEUED
+        assert entry.resume_options(defaults).output_dir == tmp_path
+        assert entry.resume_options(defaults).quality == "480p"
+    finally:
+        journal.close()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import os
+
+from neural_extractor_v3.core import js_runtime
+
+
+def test_node_version_probe_is_reused_until_the_executable_changes(tmp_path, monkeypatch):
+    node = tmp_path / "node"
+    node.write_bytes(b"node v1")
+    probes = []
+
+    def fake_version(path):
+        probes.append(path)
+        return f"v22.{len(probes)}.0"
+
+    monkeypatch.setattr(js_runtime, "_NODE_VERSION_CACHE", {})
+    monkeypatch.setattr(js_runtime, "_node_candidates", lambda: [node])
+    monkeypatch.setattr(js_runtime, "_node_version", fake_version)
+
+    first = js_runtime.resolve_youtube_js_runtime()
+    second = js_runtime.resolve_youtube_js_runtime()
+    assert first == second
+    assert first.version == "v22.1.0"
+    assert len(probes) == 1
+
+    node.write_bytes(b"node v2 upgraded")
+    stat = node.stat()
+    os.utime(node, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    upgraded = js_runtime.resolve_youtube_js_runtime()
+
+    assert upgraded.version == "v22.2.0"
+    assert len(probes) == 2
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import shutil
+import signal
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from neural_extractor_v3.core.js_solver import (
+    ChallengeSolutionCache,
+    ResidentNodeSolver,
+    configure_yt_dlp_challenge_solver,
+)
+
+NODE = shutil.which("node")
+LIB = "var lib = {twice: (value) => value + value};"
+CORE = """
+var jsc = function (data) {
+  const player = data.type === 'player' ? data.player : data.preprocessed_player;
+  return {
+    type: 'result',
+    preprocessed_player: data.type === 'player' ? player : undefined,
+    responses: data.requests.map((request) => ({
+      type: 'result',
+      data: Object.fromEntries(
+        request.challenges.map((challenge) => [challenge, twice(challenge) + '@' + player])
+      ),
+    })),
+  };
+};
+"""
+
+
+def _node_version() -> tuple[int, ...]:
+    completed = subprocess.run([NODE, "--version"], capture_output=True, text=True, check=True)
+    return tuple(int(part) for part in completed.stdout.strip().lstrip("v").split("."))
+
+
+@pytest.mark.skipif(NODE is None, reason="node is not installed")
+def test_resident_service_keeps_scripts_and_player_loaded_across_requests(tmp_path):
+    solver = ResidentNodeSolver(Path(NODE), node_version=_node_version(), record_directory=tmp_path)
+    players: list[str] = []
+
+    def load_player() -> str:
+        players.append("player-v1")
+        return "player-v1"
+
+    def solve(challenges: list[str]):
+        return solver.solve(
+            lib=LIB,
+            core=CORE,
+            player_key="https://www.youtube.com/s/player/v1/base.js",
+            load_player=load_player,
+            requests=[{"type": "n", "challenges": challenges}],
+        )
+
+    try:
+        first = solve(["ab"])
+        pid = solver.pid
+        assert first["responses"] == [{"type": "result", "data": {"ab": "abab@player-v1"}}]
+        assert "preprocessed_player" not in first
+        assert list(tmp_path.glob("active-js-solver-*.json"))
+
+        second = solve(["cd"])
+        assert second["responses"][0]["data"] == {"cd": "cdcd@player-v1"}
+        assert solver.pid == pid
+        assert players == ["player-v1"]
+
+        # A crashed service is restarted once and reloads what it needs.
+        os.kill(pid, signal.SIGTERM)
+        third = solve(["ef"])
+        assert third["responses"][0]["data"] == {"ef": "efef@player-v1"}
+        assert solver.pid != pid
+        assert players == ["player-v1", "player-v1"]
+    finally:
+        solver.close()
+    assert not list(tmp_path.glob("active-js-solver-*.json"))
+
+
+def test_solution_cache_is_keyed_by_player_and_bounded():
+    cache = ChallengeSolutionCache(max_entries=2)
+    cache.store("player-a", "n", {"x": "1", "y": "2"})
+    cache.store("player-b", "n", {"x": "3"})
+
+    assert cache.lookup("player-a", "n", ["x", "y"]) == {"y": "2"}
+    assert cache.lookup("player-b", "n", ["x"]) == {"x": "3"}
+    assert cache.lookup("player-a", "sig", ["y"]) == {}
+    assert configure_yt_dlp_challenge_solver() is True
+    assert configure_yt_dlp_challenge_solver() is True
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+
+from neural_extractor_v3.core.json_store import load_json_document, save_json_document
+
+
+def test_documents_round_trip_and_other_schema_versions_read_as_missing(tmp_path):
+    path = tmp_path / "state" / "store.json"
+
+    assert load_json_document(path, 1) is None
+    assert save_json_document(path, 1, {"entries": {"b": 1, "a": 2}})
+    assert load_json_document(path, 1) == {"entries": {"b": 1, "a": 2}, "schema_version": 1}
+    assert list(load_json_document(path, 1)["entries"]) == ["b", "a"]
+    assert load_json_document(path, 2) is None
+    assert [item.name for item in path.parent.iterdir()] == ["store.json"]
+
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert load_json_document(path, 1) is None
+    path.write_text("{truncated", encoding="utf-8")
+    assert load_json_document(path, 1) is None
+
+
+def test_failed_write_keeps_the_previous_document_and_no_temporary_file(tmp_path):
+    path = tmp_path / "store.json"
+    save_json_document(path, 1, {"entries": {}})
+    blocked = tmp_path / "blocked"
+    blocked.write_text("a file, not a folder", encoding="utf-8")
+
+    assert not save_json_document(blocked / "store.json", 1, {"entries": {}})
+    assert json.loads(path.read_text(encoding="utf-8"))["schema_version"] == 1
+    assert sorted(item.name for item in tmp_path.iterdir()) == ["blocked", "store.json"]
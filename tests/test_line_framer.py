@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+from neural_extractor_v3.core.line_framer import LineFramer
+from neural_extractor_v3.core.ytdlp_worker import PROTOCOL_PREFIX
+
+
+def test_framer_joins_split_lines_and_keeps_the_unfinished_tail():
+    framer = LineFramer()
+
+    assert framer.feed("first\r\nsec") == ["first"]
+    assert framer.feed("ond") == []
+    assert framer.feed("\n\nthird\nfour") == ["second", "", "third"]
+    assert framer.flush() == "four"
+    assert framer.flush() == ""
+
+
+def test_large_playlist_frame_survives_byte_sized_chunks():
+    entries = [{"index": index, "id": f"video{index}"} for index in range(5000)]
+    frame = PROTOCOL_PREFIX + json.dumps({"kind": "playlist", "entries": entries}) + "\n"
+    framer = LineFramer(max_frame_chars=len(frame))
+
+    lines = [
+        line
+        for offset in range(0, len(frame), 7)
+        for line in framer.feed(frame[offset : offset + 7])
+    ]
+
+    assert len(lines) == 1
+    assert json.loads(lines[0][len(PROTOCOL_PREFIX) :])["entries"][-1]["id"] == "video4999"
+
+
+def test_oversized_frames_are_dropped_and_counted_without_losing_the_next_line():
+    framer = LineFramer(max_frame_chars=8)
+
+    assert framer.feed("0123456789abc") == []
+    assert framer.feed("def\nok\n" + "x" * 9 + "\nafter") == ["ok"]
+
+    assert framer.overflowed_frames == 2
+    assert framer.overflowed_chars == 16 + 9
+    assert framer.flush() == "after"
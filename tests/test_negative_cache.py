@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from neural_extractor_v3.core.negative_cache import NegativeResultCache
+from neural_extractor_v3.core.youtube_errors import FailureCategory
+
+
+def test_negative_results_expire_per_category_and_survive_a_reload(tmp_path):
+    now = [1000.0]
+    path = tmp_path / "negative.json"
+    ttls = {FailureCategory.VIDEO_UNAVAILABLE: 100, FailureCategory.LIVE_EVENT_ENDED: 10}
+    cache = NegativeResultCache(path, ttls=ttls, clock=lambda: now[0])
+
+    assert cache.put("removed", FailureCategory.VIDEO_UNAVAILABLE, "Removed.")
+    assert cache.put("ended", FailureCategory.LIVE_EVENT_ENDED, "Ended.")
+    assert not cache.put("network", FailureCategory.NETWORK_TRANSIENT, "Try again.")
+    assert not cache.put("auth", FailureCategory.AUTHENTICATION_REQUIRED, "Sign in.")
+
+    now[0] = 1010.0
+    reloaded = NegativeResultCache(path, ttls=ttls, clock=lambda: now[0])
+    removed = reloaded.get("removed")
+
+    assert removed is not None
+    assert removed.category is FailureCategory.VIDEO_UNAVAILABLE
+    assert removed.message == "Removed."
+    assert removed.recorded_at == 1000.0
+    assert reloaded.get("ended") is None
+    assert reloaded.get("network") is None
+
+    reloaded.discard("removed")
+    assert NegativeResultCache(path, ttls=ttls, clock=lambda: now[0]).get("removed") is None
+
+
+def test_negative_cache_drops_the_oldest_entries_beyond_its_bound(tmp_path):
+    cache = NegativeResultCache(tmp_path / "negative.json", max_entries=2)
+
+    for video_id in ("a", "b", "c"):
+        cache.put(video_id, FailureCategory.VIDEO_UNAVAILABLE, "Removed.")
+    cache.put("b", FailureCategory.VIDEO_UNAVAILABLE, "Removed again.")
+    cache.put("d", FailureCategory.VIDEO_UNAVAILABLE, "Removed.")
+
+    assert [video_id for video_id in "abcd" if cache.get(video_id)] == ["b", "d"]
+    assert not NegativeResultCache(tmp_path / "off.json", max_entries=0).put(
+        "a", FailureCategory.VIDEO_UNAVAILABLE, "Removed."
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from neural_extractor_v3.core.playlist_sync import (
+    PlaylistSyncStore,
+    lists_newest_first,
+    playlist_sync_key,
+    sync_listing_url,
+)
+from neural_extractor_v3.utils import should_download_playlist
+
+
+def test_sync_keys_and_listing_order_follow_the_playlist_kind():
+    assert playlist_sync_key("https://www.youtube.com/playlist?list=PLabc") == "list:PLabc"
+    assert playlist_sync_key("https://www.youtube.com/@chan/videos/") == "channel:/@chan/videos"
+    assert playlist_sync_key("https://www.youtube.com/watch?v=abc") is None
+
+    assert lists_newest_first("https://www.youtube.com/playlist?list=UULFabc")
+    assert lists_newest_first("https://www.youtube.com/channel/UCabc/videos")
+    assert not lists_newest_first("https://www.youtube.com/playlist?list=PLabc")
+
+    assert should_download_playlist("https://www.youtube.com/@chan", "sync")
+    assert not should_download_playlist("https://www.youtube.com/@chan", "full")
+
+
+def test_channel_homes_are_synced_through_their_videos_tab():
+    assert (
+        sync_listing_url("https://www.youtube.com/@chan") == "https://www.youtube.com/@chan/videos"
+    )
+    assert sync_listing_url("https://youtube.com/channel/UCabc/") == (
+        "https://youtube.com/channel/UCabc/videos"
+    )
+    assert sync_listing_url("https://www.youtube.com/@chan/shorts") == (
+        "https://www.youtube.com/@chan/shorts"
+    )
+    playlist = "https://www.youtube.com/playlist?list=PLabc"
+    assert sync_listing_url(playlist) == playlist
+
+
+def test_store_accumulates_downloaded_entries_across_reloads(tmp_path):
+    now = [10.0]
+    path = tmp_path / "sync.json"
+    store = PlaylistSyncStore(path, clock=lambda: now[0])
+
+    store.record("list:PLabc", "Mix", ["a", "b", ""])
+    now[0] = 20.0
+    store.record("list:PLabc", "", ["b", "c"])
+
+    reloaded = PlaylistSyncStore(path)
+    assert reloaded.known_ids("list:PLabc") == {"a", "b", "c"}
+    assert reloaded.known_ids("list:other") == frozenset()
+    assert reloaded.known_ids(None) == frozenset()
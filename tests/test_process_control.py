@@ -15,6 +15,9 @@ from pathlib import Path
 import pytest
 
 from neural_extractor_v3.core.process_control import (
+    OutputRetention,
+    OutputRetentionMode,
+    OwnedProcessSession,
     OwnedProcessSupervisor,
     ProcessCancelledError,
     ProcessInactivityTimeoutError,
@@ -241,6 +244,65 @@ def test_utf8_stdin_stdout_and_stderr_round_trip(tmp_path):
     assert result.stderr == "خطأ مؤقت\n"
 
 
+LOUD_CHILD = textwrap.dedent(
+    """
+    import sys
+
+    sys.stdout.write("first line\\n")
+    for index in range(20000):
+        sys.stdout.write(f"[debug] line {index:05d} " + "x" * 80 + "\\n")
+    sys.stdout.write("last line\\n")
+    sys.stdout.flush()
+    """
+)
+
+
+def test_head_tail_retention_bounds_the_result_while_callbacks_see_everything(tmp_path):
+    seen: list[str] = []
+    supervisor = OwnedProcessSupervisor(
+        limits(),
+        ownership_record=tmp_path / "loud.json",
+        retention=OutputRetention(OutputRetentionMode.HEAD_TAIL, head_chars=64, tail_chars=256),
+    )
+
+    result = supervisor.run([sys.executable, "-c", LOUD_CHILD], stdout_callback=seen.append)
+
+    streamed = "".join(seen)
+    assert streamed.count("\n") == 20002
+    assert result.stdout.startswith("first line\n[debug] line 00000")
+    assert result.stdout.endswith("line 19999 " + "x" * 80 + "\nlast line\n")
+    omitted = len(streamed) - 64 - 256
+    assert f"[... {omitted} characters of output omitted ...]" in result.stdout
+    assert len(result.stdout) < 400
+    assert result.stdout_spill_path is None
+
+
+def test_spill_retention_writes_a_capped_file_and_none_keeps_nothing(tmp_path):
+    spill = OutputRetention(
+        OutputRetentionMode.SPILL,
+        head_chars=0,
+        tail_chars=32,
+        spill_directory=tmp_path / "spill",
+        spill_max_bytes=100_000,
+    )
+    supervisor = OwnedProcessSupervisor(limits(), retention=spill)
+
+    result = supervisor.run([sys.executable, "-c", LOUD_CHILD])
+
+    assert result.stdout.endswith("x" * 12 + "\nlast line\n")
+    assert result.stdout_spill_path is not None
+    spilled = result.stdout_spill_path.read_bytes()
+    assert len(spilled) == 100_000
+    assert spilled.startswith(b"first line\n[debug] line 00000")
+    assert result.stderr_spill_path is None
+
+    quiet = OwnedProcessSupervisor(limits(), retention=OutputRetention(OutputRetentionMode.NONE))
+    assert quiet.run([sys.executable, "-c", LOUD_CHILD]).stdout == ""
+
+    with pytest.raises(ValueError):
+        OutputRetention(OutputRetentionMode.HEAD_TAIL, tail_chars=-1)
+
+
 def test_activity_clock_arming_discards_pre_monitoring_time() -> None:
     """Deterministic guarantee, independent of any process scheduling.
 
@@ -583,3 +645,61 @@ def test_shell_command_strings_are_rejected():
 
     with pytest.raises(TypeError, match="argv sequence"):
         supervisor.run(f"{sys.executable} -c print('unsafe')")
+
+
+def test_session_serves_several_requests_from_one_owned_process(tmp_path):
+    script = textwrap.dedent(
+        """
+        import sys
+
+        for line in sys.stdin:
+            print(f"echo {line.strip()}", flush=True)
+            print("done", flush=True)
+        """
+    )
+    record = tmp_path / "session.json"
+    session = OwnedProcessSession(
+        [sys.executable, "-c", script],
+        limits=limits(),
+        ownership_record=record,
+    )
+    session.start()
+    try:
+        assert record.exists()
+        pids = []
+        for payload in ("first", "second"):
+            received: list[str] = []
+            result = session.request(
+                payload,
+                completed=lambda: 0 if "done" in "".join(received) else None,
+                stdout_callback=received.append,
+            )
+            pids.append(result.pid)
+            assert f"echo {payload}" in result.stdout
+            assert result.returncode == 0
+        assert pids[0] == pids[1] == session.pid
+        assert session.requests_served == 2
+    finally:
+        session.close()
+    assert not session.alive
+    assert not record.exists()
+
+
+def test_session_cancellation_terminates_the_owned_tree_and_retires_the_session(tmp_path):
+    session = OwnedProcessSession(
+        [sys.executable, "-c", "import sys, time; sys.stdin.readline(); time.sleep(60)"],
+        limits=limits(inactivity=5.0),
+        ownership_record=tmp_path / "session.json",
+    )
+    session.start()
+    pid = session.pid
+    cancel = threading.Event()
+    threading.Timer(0.2, cancel.set).start()
+    try:
+        with pytest.raises(ProcessCancelledError) as raised:
+            session.request("go", completed=lambda: None, cancellation_event=cancel)
+        assert raised.value.result.outcome == ProcessOutcome.CANCELLED
+        assert wait_until(lambda: not is_process_running(pid))
+        assert not session.alive
+    finally:
+        force_stop_test_process(pid)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from neural_extractor_v3.core.scheduler import DownloadScheduler
+from neural_extractor_v3.models import DownloadJob, DownloadOptions
+
+
+def test_scheduler_bounds_concurrency_and_starts_jobs_in_submission_order(tmp_path):
+    lock = threading.Lock()
+    release = threading.Event()
+    state = {"active": 0, "peak": 0}
+    started: list[str] = []
+
+    class BlockingEngine:
+        def __init__(self, options, progress_callback=None, log_callback=None):
+            pass
+
+        def cancel(self) -> None:
+            pass
+
+        def download(self, job):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                if state["peak"] == 2:
+                    release.set()
+            release.wait(5)
+            with lock:
+                state["active"] -= 1
+            return SimpleNamespace(success=True, message=f"done {job.url}", failure_category="")
+
+    jobs = [DownloadJob(f"https://example.test/{index}") for index in range(5)]
+    scheduler = DownloadScheduler(
+        DownloadOptions(output_dir=tmp_path, max_parallel_jobs=2),
+        engine_factory=BlockingEngine,
+        job_started=lambda job: started.append(job.job_id),
+    )
+
+    results = scheduler.run(jobs)
+
+    assert state["peak"] == 2
+    assert started == [job.job_id for job in jobs]
+    assert sorted(result.job_id for result in results) == sorted(job.job_id for job in jobs)
+    assert all(result.success for result in results)
+    assert scheduler.active_job_ids() == []
+
+
+def test_scheduler_cancels_a_single_pending_job_without_stopping_the_batch(tmp_path):
+    calls: list[str] = []
+    jobs = [DownloadJob(f"https://example.test/{index}") for index in range(3)]
+
+    class RecordingEngine:
+        def __init__(self, options, progress_callback=None, log_callback=None):
+            pass
+
+        def cancel(self) -> None:
+            raise AssertionError("only the pending job was cancelled")
+
+        def download(self, job):
+            calls.append(job.job_id)
+            if job is jobs[0]:
+                scheduler.cancel(jobs[1].job_id)
+            return SimpleNamespace(success=True, message="Download completed", failure_category="")
+
+    scheduler = DownloadScheduler(
+        DownloadOptions(output_dir=tmp_path),
+        engine_factory=RecordingEngine,
+    )
+    finished: list[tuple[str, bool, str]] = []
+    scheduler.job_finished = lambda job, result: finished.append(
+        (job.job_id, result.success, result.failure_category)
+    )
+
+    scheduler.run(jobs)
+
+    assert calls == [jobs[0].job_id, jobs[2].job_id]
+    assert finished == [
+        (jobs[0].job_id, True, ""),
+        (jobs[1].job_id, False, "cancelled"),
+        (jobs[2].job_id, True, ""),
+    ]
+    assert not scheduler.stop_requested
+
+
+def test_scheduler_shares_the_batch_bandwidth_cap_and_raises_shares_as_it_drains(tmp_path):
+    jobs = [DownloadJob(f"https://example.test/{index}") for index in range(3)]
+    both_started = threading.Barrier(2, timeout=5)
+    last_finished = threading.Event()
+    limits: dict[str, list[int | None]] = {}
+
+    class RecordingEngine:
+        def __init__(self, options, progress_callback=None, log_callback=None):
+            self.options = options
+
+        def cancel(self) -> None:
+            pass
+
+        def download(self, job):
+            # Each read stands for one yt-dlp attempt building its options.
+            limits[job.url] = [self.options.bandwidth_limit]
+            if job is not jobs[2]:
+                both_started.wait()
+            if job is jobs[0]:
+                assert last_finished.wait(5)
+                limits[job.url].append(self.options.bandwidth_limit)
+            return SimpleNamespace(success=True, message="Download completed", failure_category="")
+
+    options = DownloadOptions(
+        output_dir=tmp_path,
+        max_parallel_jobs=2,
+        bandwidth_limit=4_000_000,
+    )
+    scheduler = DownloadScheduler(
+        options,
+        engine_factory=RecordingEngine,
+        job_finished=lambda job, result: job is jobs[2] and last_finished.set(),
+    )
+
+    scheduler.run(jobs)
+
+    assert limits == {
+        jobs[0].url: [2_000_000, 4_000_000],
+        jobs[1].url: [2_000_000],
+        jobs[2].url: [2_000_000],
+    }
+    assert options.bandwidth_limit == 4_000_000
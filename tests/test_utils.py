@@ -1,9 +1,12 @@
+import pytest
+
 from neural_extractor_v3.models import PlaylistMode
 from neural_extractor_v3.utils import (
     extract_video_id,
     is_youtube_mix_url,
     is_youtube_url,
     normalize_single_video_url,
+    parse_byte_rate,
     sanitize_filename,
     should_download_playlist,
     split_urls,
@@ -39,3 +42,12 @@ def test_mix_url_is_not_treated_as_playlist():
 
 def test_sanitize_filename_removes_windows_reserved_chars():
     assert sanitize_filename('bad:name/with*chars?') == "bad_name_with_chars_"
+
+
+def test_parse_byte_rate_accepts_suffixes_and_rejects_garbage():
+    assert parse_byte_rate("500K") == 512_000
+    assert parse_byte_rate("2.5M") == int(2.5 * 1024**2)
+    assert parse_byte_rate("1GiB/s") == 1024**3
+    assert parse_byte_rate("") is None
+    with pytest.raises(ValueError):
+        parse_byte_rate("fast")
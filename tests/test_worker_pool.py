@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+from neural_extractor_v3.core.pot_provider import PROTOCOL_VERSION, PROVIDER_EXTRACTOR_KEY
+from neural_extractor_v3.core.process_control import ProcessLimits
+from neural_extractor_v3.core.worker_pool import (
+    PooledWorkerRunner,
+    YtdlpWorkerPool,
+    worker_configuration_key,
+)
+from neural_extractor_v3.core.ytdlp_worker import PROTOCOL_PREFIX
+
+SOURCE_ROOT = Path(__file__).resolve().parents[1] / "src"
+SERVE_COMMAND = [sys.executable, "-m", "neural_extractor_v3.core.ytdlp_worker", "--serve"]
+
+
+def _limits() -> ProcessLimits:
+    return ProcessLimits(
+        inactivity_timeout=30.0,
+        total_timeout=60.0,
+        termination_grace=1.0,
+        force_kill_wait=1.0,
+        poll_interval=0.02,
+    )
+
+
+def _environment(tmp_path: Path) -> dict[str, str]:
+    environment = os.environ.copy()
+    existing = environment.get("PYTHONPATH", "")
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SOURCE_ROOT), existing]))
+    environment["PYTHONUTF8"] = "1"
+    environment["TEMP"] = str(tmp_path)
+    environment["TMP"] = str(tmp_path)
+    environment["XDG_CACHE_HOME"] = str(tmp_path / "cache")
+    return environment
+
+
+def _smoke_request(**options) -> str:
+    return json.dumps({"url": "offline", "mode": "protocol_smoke", "options": options})
+
+
+def _run(runner: PooledWorkerRunner, tmp_path: Path, **options):
+    frames: list[str] = []
+    result = runner.run(
+        SERVE_COMMAND,
+        stdin_data=_smoke_request(**options),
+        env=_environment(tmp_path),
+        stdout_callback=frames.append,
+    )
+    kinds = [
+        json.loads(line[len(PROTOCOL_PREFIX) :])["kind"]
+        for line in "".join(frames).splitlines()
+        if line.startswith(PROTOCOL_PREFIX)
+    ]
+    return result, kinds
+
+
+def test_pooled_worker_stays_warm_and_is_recycled_after_its_request_budget(tmp_path):
+    pool = YtdlpWorkerPool(max_idle_workers=2, max_requests_per_worker=2, idle_timeout=60)
+    runner = PooledWorkerRunner(
+        pool,
+        _limits(),
+        cancellation_event=threading.Event(),
+        record_directory=tmp_path / "process-state",
+        record_label="test",
+    )
+    try:
+        first, kinds = _run(runner, tmp_path)
+        assert first.returncode == 0
+        assert kinds == ["protocol_smoke", "protocol_smoke", "complete"]
+        assert pool.idle_count() == 1
+
+        second, _ = _run(runner, tmp_path)
+        assert second.pid == first.pid
+        # Two requests exhaust the budget, so the worker is retired, not pooled.
+        assert pool.idle_count() == 0
+
+        third, _ = _run(runner, tmp_path)
+        assert third.pid != first.pid
+        assert list((tmp_path / "process-state").glob("active-test-pool-*.json"))
+    finally:
+        pool.shutdown()
+    assert not list((tmp_path / "process-state").glob("active-test-pool-*.json"))
+
+
+def test_auth_or_plugin_changes_select_a_different_worker(tmp_path):
+    environment = _environment(tmp_path)
+    public = worker_configuration_key(
+        SERVE_COMMAND, cwd=None, env=environment, request={"options": {}}
+    )
+    with_cookies = worker_configuration_key(
+        SERVE_COMMAND,
+        cwd=None,
+        env=environment,
+        request={"options": {"cookiefile": str(tmp_path / "cookies.txt")}},
+    )
+    with_provider = worker_configuration_key(
+        SERVE_COMMAND,
+        cwd=None,
+        env=environment,
+        request={
+            "options": {
+                "extractor_args": {
+                    "youtube": {"player_client": ["mweb"], "fetch_pot": ["auto"]},
+                    PROVIDER_EXTRACTOR_KEY: {"protocol": [str(PROTOCOL_VERSION)]},
+                }
+            }
+        },
+    )
+    assert len({public, with_cookies, with_provider}) == 3
+    assert public == worker_configuration_key(
+        SERVE_COMMAND, cwd=None, env=dict(environment), request={"options": {}, "url": "x"}
+    )
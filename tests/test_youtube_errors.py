@@ -1,5 +1,8 @@
+import random
+
 import pytest
 
+from neural_extractor_v3.core import youtube_errors
 from neural_extractor_v3.core.youtube_errors import (
     FailureCategory,
     classify_youtube_failure,
@@ -45,6 +48,10 @@ from neural_extractor_v3.core.youtube_errors import (
             "ERROR: Sign in to confirm your age. Use --cookies",
             FailureCategory.AUTHENTICATION_REQUIRED,
         ),
+        (
+            "ERROR: [youtube] abc: Video unavailable. This video has been removed by the uploader",
+            FailureCategory.VIDEO_UNAVAILABLE,
+        ),
     ],
 )
 def test_failure_categories_are_separate(message, category):
@@ -188,3 +195,126 @@ def test_provider_failures_take_priority_over_generic_po_token_requirement():
 
     assert unavailable.category == FailureCategory.PO_TOKEN_PROVIDER_UNAVAILABLE
     assert fetch_failed.category == FailureCategory.PO_TOKEN_FETCH_FAILED
+
+
+@pytest.mark.parametrize(
+    ("message", "options", "category"),
+    [
+        (
+            "UnicodeDecodeError: 'utf-8' codec can't decode byte; Sign in to confirm",
+            {},
+            FailureCategory.WORKER_PROTOCOL_ERROR,
+        ),
+        (
+            "Private video. Sign in to confirm; cookies are no longer valid",
+            {"auth_kind": "dedicated_firefox"},
+            FailureCategory.YOUTUBE_ACCESS_RESTRICTED,
+        ),
+        (
+            "Sign in to confirm you're not a bot. Cookies have been rotated",
+            {"auth_kind": "dedicated_browser"},
+            FailureCategory.YOUTUBE_SESSION_EXPIRED,
+        ),
+        (
+            "This live event has ended. This video is no longer available",
+            {},
+            FailureCategory.LIVE_EVENT_ENDED,
+        ),
+        (
+            "Could not copy Chrome cookie database; failed to decrypt with DPAPI",
+            {},
+            FailureCategory.BROWSER_COOKIE_DATABASE_LOCKED,
+        ),
+        (
+            "Failed to load cookies from browser: secretstorage keyring",
+            {},
+            FailureCategory.BROWSER_COOKIE_EXTRACTION_FAILED,
+        ),
+        (
+            "external_po_helper_unavailable: helper timeout expired when trying to run script",
+            {},
+            FailureCategory.PO_TOKEN_PROVIDER_UNAVAILABLE,
+        ),
+        (
+            "Only images are available; a PO Token is required",
+            {},
+            FailureCategory.ONLY_SABR_OR_IMAGE_FORMATS,
+        ),
+        (
+            "Proof of Origin Token missing. No usable challenge solver",
+            {},
+            FailureCategory.PO_TOKEN_REQUIRED,
+        ),
+        (
+            "Failed to load challenge solver; n challenge solving failed",
+            {"javascript_runtime_available": False},
+            FailureCategory.CHALLENGE_SOLVER_COMPONENT_UNAVAILABLE,
+        ),
+        (
+            "n challenge solving failed. Sign in to confirm your age",
+            {"javascript_runtime_available": False},
+            FailureCategory.JAVASCRIPT_RUNTIME_UNAVAILABLE,
+        ),
+        (
+            "Members-only content. HTTP Error 403: Forbidden",
+            {"attempt_kind": "po_token"},
+            FailureCategory.AUTHENTICATION_REQUIRED,
+        ),
+        (
+            "HTTP Error 403: Forbidden; Requested format is not available",
+            {"auth_kind": "cookies_file"},
+            FailureCategory.COOKIE_FILE_REJECTED,
+        ),
+        (
+            "No video formats found after HTTP Error 429: Too Many Requests",
+            {},
+            FailureCategory.REQUESTED_FORMAT_UNAVAILABLE,
+        ),
+    ],
+)
+def test_first_matching_rule_wins_when_several_patterns_occur(message, options, category):
+    assert classify_youtube_failure(message, **options).category == category
+
+
+def test_rate_limit_flag_comes_from_the_same_pattern_pass():
+    analysis = classify_youtube_failure("ERROR: HTTP Error 429: Too Many Requests")
+
+    assert analysis.category == FailureCategory.NETWORK_TRANSIENT
+    assert analysis.transient and analysis.rate_limited
+
+
+def test_pattern_matcher_finds_exactly_the_patterns_a_substring_scan_finds():
+    patterns = sorted(youtube_errors._MATCHER.patterns)
+    rng = random.Random(2024)
+    corpus = [
+        "browser cookies from browser",
+        "external_po_helper_unavailable",
+        "temporary failure in name resolution",
+        "requested format is not available",
+        "unicodeencodeerror: 'charmap' codec can't encode character",
+    ]
+    for _ in range(2000):
+        parts = []
+        for pattern in rng.sample(patterns, rng.randint(0, 4)):
+            if rng.random() < 0.3:
+                pattern = pattern[: rng.randint(1, len(pattern))]
+            parts.append(pattern + rng.choice(("", " ", "\n", "x", ": ")))
+        corpus.append("".join(parts))
+
+    for text in corpus:
+        expected = {pattern for pattern in patterns if pattern in text}
+        assert youtube_errors._MATCHER.hits(text) == expected, text
+
+
+def test_classification_reads_only_the_tail_window_of_large_output():
+    window = youtube_errors.CLASSIFICATION_WINDOW_CHARS
+    progress = "[download]  42.3% of 183.52MiB at 4.21MiB/s ETA 00:25\n"
+    noise = progress * (window // len(progress) + 1)
+
+    decisive_last = classify_youtube_failure(
+        "Sign in to confirm\n" + noise + "ERROR: Requested format is not available"
+    )
+    beyond_window = classify_youtube_failure("Sign in to confirm\n" + noise)
+
+    assert decisive_last.category == FailureCategory.REQUESTED_FORMAT_UNAVAILABLE
+    assert beyond_window.category == FailureCategory.UNKNOWN
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+import os
+
+from neural_extractor_v3.core.ytdlp_cache import SharedYtdlpCache, _exclusive_lock
+
+NOW = 1_900_000_000.0
+
+
+def _entry(cache: SharedYtdlpCache, name: str, *, age: float, size: int = 0) -> object:
+    path = cache.ytdlp_dir / "youtube-sigfuncs" / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"yt-dlp_version": "2026.08.19", "data": "x" * size}), encoding="utf-8"
+    )
+    os.utime(path, (NOW - age, NOW - age))
+    return path
+
+
+def test_maintenance_drops_corrupt_temp_and_expired_entries_then_evicts_oldest(tmp_path):
+    cache = SharedYtdlpCache(tmp_path, max_bytes=2_500, max_age=3_600, clock=lambda: NOW)
+    newest = _entry(cache, "newest.json", age=10, size=1_000)
+    middle = _entry(cache, "middle.json", age=20, size=1_000)
+    oldest = _entry(cache, "oldest.json", age=30, size=1_000)
+    expired = _entry(cache, "expired.json", age=7_200)
+    torn = cache.ytdlp_dir / "youtube-nsig" / "torn.json"
+    torn.parent.mkdir(parents=True)
+    torn.write_text('{"yt-dlp_version": "2026.08.19", "da', encoding="utf-8")
+    os.utime(torn, (NOW - 5, NOW - 5))
+    orphan = cache.ytdlp_dir / "youtube-nsig" / "torn.json.abc123.tmp"
+    orphan.write_text("{}", encoding="utf-8")
+    os.utime(orphan, (NOW - 3_600, NOW - 3_600))
+
+    report = cache.maintain()
+
+    assert report is not None
+    assert (report.removed_invalid, report.removed_expired, report.removed_temp) == (1, 1, 1)
+    assert report.removed_evicted == 1 and report.kept == 2
+    assert newest.exists() and middle.exists()
+    assert not any(path.exists() for path in (oldest, expired, torn, orphan))
+    # Further calls inside the maintenance interval do not rescan the tree.
+    assert cache.maintain() is None
+
+
+def test_maintenance_is_skipped_while_another_process_holds_the_lock(tmp_path):
+    cache = SharedYtdlpCache(tmp_path, max_age=3_600, clock=lambda: NOW)
+    expired = _entry(cache, "expired.json", age=7_200)
+
+    with _exclusive_lock(tmp_path / ".maintenance.lock") as acquired:
+        assert acquired
+        with _exclusive_lock(tmp_path / ".maintenance.lock") as contended:
+            assert not contended
+        assert cache.maintain() is None
+
+    assert expired.exists()
+    assert cache.maintain(force=True).removed_expired == 1
@@ -36,6 +36,8 @@ def test_worker_download_protocol_reports_phase_metadata_progress_and_success(mo
     class FakeYoutubeDL:
         def __init__(self, options):
             captured_options.update(options)
+            self.pre_processors = []
+            self.after_move = []
 
         def __enter__(self):
             return self
@@ -43,9 +45,14 @@ def test_worker_download_protocol_reports_phase_metadata_progress_and_success(mo
         def __exit__(self, exc_type, exc, traceback):
             return False
 
+        def add_post_processor(self, pp, when="post_process"):
+            assert when in {"pre_process", "after_move"}
+            (self.pre_processors if when == "pre_process" else self.after_move).append(pp)
+
         def extract_info(self, url, download=False):
             assert download is False
-            return {
+            info = {
+                "id": "offline",
                 "formats": [
                     {
                         "format_id": "18",
@@ -54,10 +61,17 @@ def test_worker_download_protocol_reports_phase_metadata_progress_and_success(mo
                         "acodec": "mp4a",
                         "height": 360,
                     }
-                ]
+                ],
             }
-
-        def download(self, urls):
+            for pp in self.pre_processors:
+                _files, info = pp.run(info)
+            return info
+
+        def process_ie_result(self, info, download=True):
+            assert download is True
+            assert info["formats"][0]["format_id"] == "18"
+            for pp in self.pre_processors:
+                pp.run(info)
             captured_options["progress_hooks"][0](
                 {
                     "status": "downloading",
@@ -66,7 +80,12 @@ def test_worker_download_protocol_reports_phase_metadata_progress_and_success(mo
                     "info_dict": {"title": "Offline fake"},
                 }
             )
-            return 0
+            for pp in self.after_move:
+                pp.run({**info, "filepath": "/downloads/Offline fake.mp4"})
+            return info
+
+        def download(self, urls):
+            raise AssertionError("single videos must reuse the preflight extraction")
 
     monkeypatch.setattr(
         ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
@@ -90,9 +109,106 @@ def test_worker_download_protocol_reports_phase_metadata_progress_and_success(mo
         "metadata",
         "phase",
         "progress",
+        "completed",
         "result",
     ]
     assert events[1][1]["formats"][0]["format_id"] == "18"
+    assert events[4][1] == {"id": "offline", "filepath": "/downloads/Offline fake.mp4"}
+
+
+def test_worker_falls_back_to_url_download_when_yt_dlp_requests_reextraction(monkeypatch):
+    calls = []
+
+    class ReExtractingYoutubeDL:
+        _download_retcode = 0
+
+        def __init__(self, options):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def add_post_processor(self, pp, when="post_process"):
+            pass
+
+        def extract_info(self, url, download=False):
+            calls.append("extract_info")
+            return {"formats": []}
+
+        def process_ie_result(self, info, download=True):
+            calls.append("process_ie_result")
+            raise ytdlp_worker.yt_dlp.utils.ReExtractInfo("formats expired")
+
+        def download(self, urls):
+            calls.append("download")
+            return 0
+
+    monkeypatch.setattr(ytdlp_worker, "_emit", lambda kind, **payload: None)
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", ReExtractingYoutubeDL)
+
+    exit_code = ytdlp_worker.run_worker(
+        {
+            "url": "https://www.youtube.com/watch?v=offline",
+            "options": {},
+            "playlist": False,
+            "mode": "download",
+        }
+    )
+
+    assert exit_code == 0
+    assert calls == ["extract_info", "process_ie_result", "download"]
+
+
+def test_only_the_download_claim_owner_reaches_the_download_phase(monkeypatch, tmp_path):
+    downloads = []
+
+    class FakeYoutubeDL:
+        _download_retcode = 0
+
+        def __init__(self, options):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def add_post_processor(self, pp, when="post_process"):
+            pass
+
+        def extract_info(self, url, download=False):
+            return {"formats": []}
+
+        def process_ie_result(self, info, download=True):
+            downloads.append(info)
+
+    def attempt(owner):
+        events = []
+        monkeypatch.setattr(
+            ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
+        )
+        exit_code = ytdlp_worker.run_worker(
+            {
+                "url": "https://www.youtube.com/watch?v=offline",
+                "options": {},
+                "playlist": False,
+                "mode": "download",
+                "download_claim": str(tmp_path / "download.claim"),
+                "download_claim_owner": owner,
+            }
+        )
+        return exit_code, [payload.get("phase") for kind, payload in events if kind == "phase"]
+
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+
+    assert attempt("primary") == (0, ["preflight", "download"])
+    assert attempt("hedge") == (1, ["preflight", ytdlp_worker.DOWNLOAD_CLAIM_LOST_PHASE])
+    assert attempt("primary") == (0, ["preflight", "download"])
+    assert len(downloads) == 2
 
 
 def test_worker_discovery_removes_requested_selector_and_never_downloads(monkeypatch):
@@ -145,6 +261,152 @@ def test_worker_discovery_removes_requested_selector_and_never_downloads(monkeyp
     assert any(kind == "metadata" for kind, _payload in events)
 
 
+def test_worker_playlist_expansion_lists_flat_entries_without_downloading(monkeypatch):
+    events = []
+    captured_options = {}
+
+    class FakeYoutubeDL:
+        def __init__(self, options):
+            captured_options.update(options)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def extract_info(self, url, download=False):
+            assert download is False
+            return {
+                "id": "PLoffline",
+                "title": "Offline playlist",
+                "entries": [
+                    {"id": "first", "url": "first", "title": "First"},
+                    {"id": "second", "url": "https://www.youtube.com/watch?v=second"},
+                    None,
+                ],
+            }
+
+        def download(self, urls):
+            raise AssertionError("playlist expansion must never download media")
+
+    monkeypatch.setattr(
+        ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
+    )
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+
+    exit_code = ytdlp_worker.run_worker(
+        {
+            "url": "https://www.youtube.com/playlist?list=PLoffline",
+            "options": {"format": "18", "postprocessors": [{"key": "FFmpegMetadata"}]},
+            "playlist": True,
+            "mode": "expand",
+        }
+    )
+
+    assert exit_code == 0
+    assert captured_options["extract_flat"] == "in_playlist"
+    assert "format" not in captured_options and "postprocessors" not in captured_options
+    playlist = next(payload for kind, payload in events if kind == "playlist")
+    assert playlist["title"] == "Offline playlist"
+    assert playlist["entries"] == [
+        {
+            "index": 1,
+            "id": "first",
+            "url": "https://www.youtube.com/watch?v=first",
+            "title": "First",
+        },
+        {
+            "index": 2,
+            "id": "second",
+            "url": "https://www.youtube.com/watch?v=second",
+            "title": "",
+        },
+    ]
+
+
+def test_channel_tabs_in_a_flat_listing_are_not_reported_as_videos():
+    channel = "https://www.youtube.com/@offline"
+    info = {
+        "id": "UCoffline",
+        "title": "Offline",
+        "entries": [
+            {
+                "_type": "url",
+                "ie_key": "YoutubeTab",
+                "id": "UCoffline",
+                "url": f"{channel}/{tab}",
+                "title": f"Offline - {tab.title()}",
+            }
+            for tab in ("videos", "shorts", "streams")
+        ]
+        + [{"_type": "url", "ie_key": "Youtube", "id": "video1", "url": "video1"}],
+    }
+
+    event = ytdlp_worker._playlist_event(info)
+
+    assert [(entry["id"], entry["url"]) for entry in event["entries"]] == [
+        ("video1", "https://www.youtube.com/watch?v=video1")
+    ]
+
+
+def test_worker_sync_expansion_stops_listing_after_known_entries(monkeypatch):
+    events = []
+    calls = []
+
+    def uploads():
+        for video_id in ("new1", "new2", "old1", "old2", "old3"):
+            yield {"id": video_id, "url": video_id}
+        raise AssertionError("pages past the known entries must not be requested")
+
+    class FakeYoutubeDL:
+        def __init__(self, options):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def extract_info(self, url, download=False, process=True, ie_key=None):
+            assert process is False
+            calls.append((url, ie_key))
+            if url.endswith("/@offline"):
+                return {"_type": "url", "url": url + "/videos", "ie_key": "YoutubeTab"}
+            return {"id": "UCoffline", "title": "Offline - Videos", "entries": uploads()}
+
+    monkeypatch.setattr(
+        ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
+    )
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", FakeYoutubeDL)
+
+    exit_code = ytdlp_worker.run_worker(
+        {
+            "url": "https://www.youtube.com/@offline",
+            "options": {},
+            "playlist": True,
+            "mode": "expand",
+            "known_entries": ["old1", "old2", "old3", "old4"],
+            "known_streak": 3,
+        }
+    )
+
+    assert exit_code == 0
+    assert calls == [
+        ("https://www.youtube.com/@offline", None),
+        ("https://www.youtube.com/@offline/videos", "YoutubeTab"),
+    ]
+    playlist = next(payload for kind, payload in events if kind == "playlist")
+    assert [entry["id"] for entry in playlist["entries"]] == [
+        "new1",
+        "new2",
+        "old1",
+        "old2",
+        "old3",
+    ]
+
+
 def test_worker_failure_reports_phase_and_traceback_without_crashing_protocol(monkeypatch):
     events = []
 
@@ -158,6 +420,9 @@ def test_worker_failure_reports_phase_and_traceback_without_crashing_protocol(mo
         def __exit__(self, exc_type, exc, traceback):
             return False
 
+        def add_post_processor(self, pp, when="post_process"):
+            pass
+
         def extract_info(self, url, download=False):
             raise RuntimeError("controlled offline failure")
 
@@ -182,6 +447,48 @@ def test_worker_failure_reports_phase_and_traceback_without_crashing_protocol(mo
     assert "RuntimeError" in error["traceback"]
 
 
+def test_worker_reports_formats_when_format_selection_fails(monkeypatch):
+    events = []
+
+    class UnselectableYoutubeDL:
+        def __init__(self, options):
+            self.pre_processors = []
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def add_post_processor(self, pp, when="post_process"):
+            self.pre_processors.append(pp)
+
+        def extract_info(self, url, download=False):
+            info = {"id": "offline", "formats": [{"format_id": "140", "acodec": "mp4a"}]}
+            for pp in self.pre_processors:
+                pp.run(info)
+            raise ytdlp_worker.yt_dlp.utils.DownloadError("Requested format is not available")
+
+    monkeypatch.setattr(
+        ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
+    )
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", UnselectableYoutubeDL)
+
+    exit_code = ytdlp_worker.run_worker(
+        {
+            "url": "https://www.youtube.com/watch?v=offline",
+            "options": {"format": "bv*+ba"},
+            "playlist": False,
+            "mode": "download",
+        }
+    )
+
+    assert exit_code == 1
+    assert [kind for kind, _payload in events] == ["phase", "metadata", "error"]
+    assert events[1][1]["formats"][0]["format_id"] == "140"
+    assert events[2][1]["phase"] == "preflight"
+
+
 @pytest.mark.parametrize(
     ("extractor_args", "expected_provider_enabled"),
     [
@@ -285,6 +592,102 @@ def test_provider_startup_failure_is_categorized_and_redacted(monkeypatch):
     assert "<redacted>" in payload["message"]
 
 
+def test_progress_frames_are_coalesced_but_transitions_and_final_frames_pass(monkeypatch):
+    events = []
+    now = [0.0]
+    monkeypatch.setattr(
+        ytdlp_worker, "_emit", lambda kind, **payload: events.append(payload["data"])
+    )
+    hook = ytdlp_worker._ProgressCoalescer(4, clock=lambda: now[0])
+
+    def report(status, downloaded, filename="video.f137.mp4"):
+        hook(
+            {
+                "status": status,
+                "filename": filename,
+                "downloaded_bytes": downloaded,
+                "total_bytes": 1000,
+            }
+        )
+
+    for downloaded in range(0, 1000, 10):
+        report("downloading", downloaded)
+        now[0] += 0.01
+    report("downloading", 1000)
+    report("finished", 1000)
+    report("downloading", 5, filename="video.f140.m4a")
+
+    assert [(event["status"], event["downloaded_bytes"]) for event in events[:2]] == [
+        ("downloading", 0),
+        ("downloading", 250),
+    ]
+    assert len(events) == 7
+    assert [(event["status"], event["filename"]) for event in events[-3:]] == [
+        ("downloading", "video.f137.mp4"),
+        ("finished", "video.f137.mp4"),
+        ("downloading", "video.f140.m4a"),
+    ]
+    assert events[-3]["downloaded_bytes"] == 1000
+    assert hook.suppressed == 96
+
+    unlimited = ytdlp_worker._ProgressCoalescer(0, clock=lambda: 0.0)
+    for _ in range(5):
+        unlimited({"status": "downloading", "downloaded_bytes": 1, "total_bytes": 10})
+    assert unlimited.suppressed == 0
+
+
+def test_worker_reports_how_many_progress_frames_it_coalesced(monkeypatch):
+    events = []
+    captured_options = {}
+
+    class ChattyYoutubeDL:
+        _download_retcode = 0
+
+        def __init__(self, options):
+            captured_options.update(options)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, traceback):
+            return False
+
+        def add_post_processor(self, pp, when="post_process"):
+            pass
+
+        def extract_info(self, url, download=False):
+            return {"formats": []}
+
+        def process_ie_result(self, info, download=True):
+            for downloaded in range(0, 100):
+                captured_options["progress_hooks"][0](
+                    {"status": "downloading", "downloaded_bytes": downloaded, "total_bytes": 100}
+                )
+
+    monkeypatch.setattr(
+        ytdlp_worker, "_emit", lambda kind, **payload: events.append((kind, payload))
+    )
+    monkeypatch.setattr(ytdlp_worker.yt_dlp, "YoutubeDL", ChattyYoutubeDL)
+
+    exit_code = ytdlp_worker.run_worker(
+        {
+            "url": "https://www.youtube.com/watch?v=offline",
+            "options": {},
+            "playlist": False,
+            "mode": "download",
+            "progress_frames_per_second": 1,
+        }
+    )
+
+    assert exit_code == 0
+    assert sum(kind == "progress" for kind, _payload in events) == 1
+    assert events[-2] == (
+        "log",
+        {"stream": "stdout", "message": "[progress] Coalesced 99 intermediate progress reports"},
+    )
+    assert events[-1][0] == "result"
+
+
 def test_protocol_redacts_po_token_material_recursively(monkeypatch):
     stream = io.BytesIO()
     secret = "opaque-provider-secret-123456"